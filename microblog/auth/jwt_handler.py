@@ -7,57 +7,179 @@ JWT secret and expiration settings from the configuration system.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import base64
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timezone
 
-from jose import JWTError, jwt
+import jwt
+from jwt.exceptions import PyJWTError as JWTError
 
 from microblog.server.config import get_config
 
+# Cache of verified token payloads so repeated requests carrying the same
+# token (e.g. HTMX polling) skip signature verification. Entries are keyed
+# by a digest of the signing secret and the token, and store the payload,
+# its expiry timestamp and the time it was cached.
+PAYLOAD_CACHE_MAX_SIZE = 2048
+PAYLOAD_CACHE_TTL = 60
 
-def create_jwt_token(user_id: int, username: str) -> str:
-    """
-    Create a JWT token for the authenticated user.
+_payload_cache: dict[bytes, tuple[dict, float, float]] = {}
+_payload_cache_lock = threading.Lock()
 
-    Args:
-        user_id: User ID to include in token
-        username: Username to include in token
+# Auth settings derived from the active configuration object. They are
+# recomputed whenever get_config() returns a different object, which is
+# what happens when the configuration is (re)loaded.
+_auth_config: object | None = None
+_jwt_secret: bytes | None = None
+_session_expires_seconds: int | None = None
 
-    Returns:
-        Encoded JWT token string
 
-    Raises:
-        RuntimeError: If configuration is missing or invalid
+def _get_auth_settings() -> tuple[bytes | None, int | None]:
     """
+    Get the JWT secret as bytes and the session lifetime in seconds.
+
+    Both values are None if no JWT secret is configured.
+    """
+    global _auth_config, _jwt_secret, _session_expires_seconds
+
     config = get_config()
+    if config is _auth_config:
+        return _jwt_secret, _session_expires_seconds
+
+    secret = config.auth.jwt_secret
+    if secret:
+        _jwt_secret = secret.encode("utf-8")
+        _session_expires_seconds = int(config.auth.session_expires)
+    else:
+        _jwt_secret = None
+        _session_expires_seconds = None
+    _auth_config = config
+
+    return _jwt_secret, _session_expires_seconds
 
-    if not config.auth.jwt_secret:
-        raise RuntimeError("JWT secret not configured")
 
-    # Calculate expiration time
-    now = datetime.now(timezone.utc)
-    expires = now + timedelta(seconds=config.auth.session_expires)
+def clear_auth_settings_cache() -> None:
+    """Forget the cached auth settings so they are re-read on next use."""
+    global _auth_config
+    _auth_config = None
+
+
+def _payload_cache_key(secret: bytes, token: str) -> bytes:
+    """Build the payload cache key for a token verified with a given secret."""
+    return hashlib.sha256(secret + b":" + token.encode("utf-8")).digest()
+
+
+def _get_cached_payload(key: bytes) -> dict | None:
+    """Return a cached payload if it is still fresh and unexpired."""
+    with _payload_cache_lock:
+        entry = _payload_cache.get(key)
+        if entry is None:
+            return None
+
+        payload, exp_timestamp, cached_at = entry
+        now = time.time()
+        if exp_timestamp <= now or now - cached_at >= PAYLOAD_CACHE_TTL:
+            del _payload_cache[key]
+            return None
+
+    return dict(payload)
+
+
+def _cache_payload(key: bytes, payload: dict) -> None:
+    """Store a verified payload, evicting the oldest entry when full."""
+    exp_timestamp = payload.get("exp")
+    if not isinstance(exp_timestamp, (int, float)):
+        return
+
+    with _payload_cache_lock:
+        if key not in _payload_cache and len(_payload_cache) >= PAYLOAD_CACHE_MAX_SIZE:
+            del _payload_cache[next(iter(_payload_cache))]
+        _payload_cache[key] = (dict(payload), float(exp_timestamp), time.time())
+
+
+def clear_token_cache() -> None:
+    """Clear all cached token payloads."""
+    with _payload_cache_lock:
+        _payload_cache.clear()
+
+
+def _encode_token(
+    user_id: int, username: str, secret: bytes, session_expires: int
+) -> str:
+    """Encode a token payload for a user with the given secret and lifetime."""
+    # JWT stores whole-second POSIX timestamps, so build them directly
+    now = int(time.time())
 
     # Create token payload
     payload = {
         "user_id": user_id,
         "username": username,
         "role": "admin",  # Fixed role as per ERD specification
-        "exp": expires,
+        "exp": now + session_expires,
         "iat": now
     }
 
     # Encode token
     try:
-        token = jwt.encode(payload, config.auth.jwt_secret, algorithm="HS256")
-        return token
+        return jwt.encode(payload, secret, algorithm="HS256")
     except JWTError as e:
         raise RuntimeError(f"Failed to create JWT token: {e}") from None
 
 
+def _decode_token(token: str, secret: bytes) -> dict | None:
+    """Verify a token against a secret and return its payload, or None."""
+    cache_key = _payload_cache_key(secret, token)
+    cached_payload = _get_cached_payload(cache_key)
+    if cached_payload is not None:
+        return cached_payload
+
+    try:
+        # Signature, expiry and all required claims are validated in one pass
+        payload = jwt.decode(
+            token,
+            secret,
+            algorithms=["HS256"],
+            options={"require": ["user_id", "username", "exp", "iat"]},
+        )
+    except JWTError:
+        return None
+
+    _cache_payload(cache_key, payload)
+    return payload
+
+
+def create_jwt_token(user_id: int, username: str) -> str:
+    """
+    Create a JWT token for the authenticated user.
+
+    Args:
+        user_id: User ID to include in token
+        username: Username to include in token
+
+    Returns:
+        Encoded JWT token string
+
+    Raises:
+        RuntimeError: If configuration is missing or invalid
+    """
+    secret, session_expires = _get_auth_settings()
+
+    if not secret:
+        raise RuntimeError("JWT secret not configured")
+
+    return _encode_token(user_id, username, secret, session_expires)
+
+
 def verify_jwt_token(token: str) -> dict | None:
     """
     Verify and decode a JWT token.
 
+    Successfully verified payloads are cached for a short time, so repeated
+    verification of the same token only re-checks its expiry.
+
     Args:
         token: JWT token string to verify
 
@@ -68,33 +190,33 @@ def verify_jwt_token(token: str) -> dict | None:
         return None
 
     try:
-        config = get_config()
+        secret, _ = _get_auth_settings()
 
-        if not config.auth.jwt_secret:
+        if not secret:
             return None
 
-        # Decode and verify token
-        payload = jwt.decode(token, config.auth.jwt_secret, algorithms=["HS256"])
+        return _decode_token(token, secret)
 
-        # Validate required fields
-        required_fields = ["user_id", "username", "exp", "iat"]
-        if not all(field in payload for field in required_fields):
-            return None
+    except Exception:
+        return None
 
-        # Check if token is expired (jose should handle this, but double-check)
-        exp_timestamp = payload["exp"]
-        if isinstance(exp_timestamp, (int, float)):
-            exp_datetime = datetime.fromtimestamp(exp_timestamp, timezone.utc)
-            if exp_datetime < datetime.now(timezone.utc):
-                return None
 
-        return payload
+def _fast_claims(token: str) -> dict | None:
+    """
+    Extract the claims segment of a JWT without verifying it.
 
-    except JWTError:
-        return None
-    except Exception:
+    Splits the token once and base64url-decodes only the payload segment,
+    skipping header parsing entirely.
+    """
+    parts = token.split(".", 2)
+    if len(parts) != 3:
         return None
 
+    segment = parts[1]
+    padding = "=" * (-len(segment) % 4)
+    payload = json.loads(base64.urlsafe_b64decode(segment + padding))
+    return payload if isinstance(payload, dict) else None
+
 
 def decode_jwt_token_unsafe(token: str) -> dict | None:
     """
@@ -111,10 +233,7 @@ def decode_jwt_token_unsafe(token: str) -> dict | None:
 
     try:
         # Decode without verification
-        payload = jwt.get_unverified_claims(token)
-        return payload
-    except JWTError:
-        return None
+        return _fast_claims(token)
     except Exception:
         return None
 
@@ -153,11 +272,15 @@ def is_token_expired(token: str) -> bool:
     Returns:
         True if token is expired, False if valid or indeterminate
     """
-    expiry = get_token_expiry(token)
-    if expiry is None:
+    payload = decode_jwt_token_unsafe(token)
+    if not payload:
         return True  # Assume expired if we can't determine
 
-    return expiry < datetime.now(timezone.utc)
+    exp_timestamp = payload.get("exp")
+    if not isinstance(exp_timestamp, (int, float)):
+        return True
+
+    return exp_timestamp < time.time()
 
 
 def refresh_token(token: str) -> str | None:
@@ -170,12 +293,21 @@ def refresh_token(token: str) -> str | None:
     Returns:
         New JWT token if refresh successful, None if current token invalid
     """
-    payload = verify_jwt_token(token)
-    if not payload:
+    if not token:
         return None
 
-    # Create new token with same user info
     try:
-        return create_jwt_token(payload["user_id"], payload["username"])
-    except RuntimeError:
+        secret, session_expires = _get_auth_settings()
+        if not secret:
+            return None
+
+        payload = _decode_token(token, secret)
+        if not payload:
+            return None
+
+        # Create new token with same user info, reusing the loaded settings
+        return _encode_token(
+            payload["user_id"], payload["username"], secret, session_expires
+        )
+    except Exception:
         return None
@@ -7,10 +7,121 @@ the single-admin-user pattern specified in the ERD.
 
 from __future__ import annotations
 
+import os
 import sqlite3
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Open connections keyed by database path, together with the (st_dev, st_ino)
+# of the file they were opened on so a deleted or replaced database is
+# detected and reopened.
+_connections: dict[Path, tuple[sqlite3.Connection, tuple[int, int]]] = {}
+_connections_lock = threading.RLock()
+
+# Short-lived cache of User objects keyed by (db_path, "username"|"id", value).
+# The admin row is read on every authenticated request but rarely changes.
+USER_CACHE_TTL = 30
+USER_CACHE_MAX_SIZE = 8
+_user_cache: dict[tuple[Path, str, object], tuple[User, float]] = {}
+_user_cache_lock = threading.Lock()
+
+
+def _get_cached_user(key: tuple[Path, str, object]) -> User | None:
+    """Return a cached user if present and not older than the TTL."""
+    with _user_cache_lock:
+        entry = _user_cache.get(key)
+        if entry is None:
+            return None
+        user, cached_at = entry
+        if time.monotonic() - cached_at >= USER_CACHE_TTL:
+            del _user_cache[key]
+            return None
+        return user
+
+
+def _cache_user(user: User, db_path: Path) -> None:
+    """Store a user under both its username and ID keys."""
+    now = time.monotonic()
+    with _user_cache_lock:
+        for key in ((db_path, "username", user.username), (db_path, "id", user.user_id)):
+            _user_cache.pop(key, None)
+            while len(_user_cache) >= USER_CACHE_MAX_SIZE:
+                del _user_cache[next(iter(_user_cache))]
+            _user_cache[key] = (user, now)
+
+
+def clear_user_cache(db_path: Path | None = None) -> None:
+    """
+    Drop cached users.
+
+    Args:
+        db_path: Only drop entries for this database; all entries if None
+    """
+    with _user_cache_lock:
+        if db_path is None:
+            _user_cache.clear()
+            return
+        for key in [k for k in _user_cache if k[0] == db_path]:
+            del _user_cache[key]
+
+
+def _file_identity(db_path: Path) -> tuple[int, int] | None:
+    """Return the (device, inode) pair of a database file, if it exists."""
+    try:
+        st = os.stat(db_path)
+    except FileNotFoundError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def get_connection(db_path: Path) -> sqlite3.Connection:
+    """
+    Get the shared connection for a database, opening it on first use.
+
+    Connections are opened once per database file in WAL mode and reused,
+    which avoids the open/close cost on every query. Callers must hold
+    ``connection_lock()`` while using the connection.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        Open SQLite connection with ``sqlite3.Row`` row factory
+    """
+    with _connections_lock:
+        cached = _connections.get(db_path)
+        if cached is not None:
+            conn, identity = cached
+            if _file_identity(db_path) == identity:
+                return conn
+            conn.close()
+            del _connections[db_path]
+            clear_user_cache(db_path)
+
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        _connections[db_path] = (conn, _file_identity(db_path))
+        return conn
+
+
+def connection_lock() -> threading.RLock:
+    """Get the lock that serializes use of the shared connections."""
+    return _connections_lock
+
+
+def close_connection(db_path: Path) -> None:
+    """Close the shared connection for a database, if one is open."""
+    with _connections_lock:
+        cached = _connections.pop(db_path, None)
+        if cached is not None:
+            cached[0].close()
+    clear_user_cache(db_path)
+
 
 class User:
     """
@@ -41,7 +152,8 @@ class User:
     @classmethod
     def create_table(cls, db_path: Path) -> None:
         """Create the users table if it doesn't exist."""
-        with sqlite3.connect(db_path) as conn:
+        with _connections_lock:
+            conn = get_connection(db_path)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS users (
                     user_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -55,55 +167,60 @@ class User:
             """)
             conn.commit()
 
+    @classmethod
+    def _from_row(cls, row: sqlite3.Row) -> User:
+        """Build a User from a users table row."""
+        return cls(
+            user_id=row["user_id"],
+            username=row["username"],
+            email=row["email"],
+            password_hash=row["password_hash"],
+            role=row["role"],
+            created_at=cls._parse_datetime(row["created_at"]),
+            updated_at=cls._parse_datetime(row["updated_at"])
+        )
+
     @classmethod
     def get_by_username(cls, username: str, db_path: Path) -> User | None:
         """Get user by username."""
-        with sqlite3.connect(db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
+        user = _get_cached_user((db_path, "username", username))
+        if user is not None:
+            return user
+
+        with _connections_lock:
+            row = get_connection(db_path).execute(
                 "SELECT * FROM users WHERE username = ?", (username,)
-            )
-            row = cursor.fetchone()
+            ).fetchone()
 
-            if row:
-                return cls(
-                    user_id=row["user_id"],
-                    username=row["username"],
-                    email=row["email"],
-                    password_hash=row["password_hash"],
-                    role=row["role"],
-                    created_at=cls._parse_datetime(row["created_at"]),
-                    updated_at=cls._parse_datetime(row["updated_at"])
-                )
-            return None
+        if row:
+            user = cls._from_row(row)
+            _cache_user(user, db_path)
+            return user
+        return None
 
     @classmethod
     def get_by_id(cls, user_id: int, db_path: Path) -> User | None:
         """Get user by ID."""
-        with sqlite3.connect(db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
+        user = _get_cached_user((db_path, "id", user_id))
+        if user is not None:
+            return user
+
+        with _connections_lock:
+            row = get_connection(db_path).execute(
                 "SELECT * FROM users WHERE user_id = ?", (user_id,)
-            )
-            row = cursor.fetchone()
+            ).fetchone()
 
-            if row:
-                return cls(
-                    user_id=row["user_id"],
-                    username=row["username"],
-                    email=row["email"],
-                    password_hash=row["password_hash"],
-                    role=row["role"],
-                    created_at=cls._parse_datetime(row["created_at"]),
-                    updated_at=cls._parse_datetime(row["updated_at"])
-                )
-            return None
+        if row:
+            user = cls._from_row(row)
+            _cache_user(user, db_path)
+            return user
+        return None
 
     @classmethod
     def user_exists(cls, db_path: Path) -> bool:
         """Check if any user exists (single-user constraint)."""
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM users")
+        with _connections_lock:
+            cursor = get_connection(db_path).execute("SELECT COUNT(*) FROM users")
             count = cursor.fetchone()[0]
             return count > 0
 
@@ -125,7 +242,7 @@ class User:
             raise ValueError("Only one admin user is allowed in the system")
 
         try:
-            with sqlite3.connect(db_path) as conn:
+            with _connections_lock, get_connection(db_path) as conn:
                 now = datetime.now(timezone.utc).isoformat()
                 cursor = conn.execute(
                     """
@@ -135,7 +252,7 @@ class User:
                     (username, email, password_hash, now, now)
                 )
                 user_id = cursor.lastrowid
-                conn.commit()
+                clear_user_cache(db_path)
 
                 return cls(
                     user_id=user_id,
@@ -152,16 +269,16 @@ class User:
     def update_password(self, new_password_hash: str, db_path: Path) -> bool:
         """Update user password hash."""
         try:
-            with sqlite3.connect(db_path) as conn:
+            with _connections_lock, get_connection(db_path) as conn:
                 now = datetime.now(timezone.utc).isoformat()
                 conn.execute(
                     "UPDATE users SET password_hash = ?, updated_at = ? WHERE user_id = ?",
                     (new_password_hash, now, self.user_id)
                 )
-                conn.commit()
                 self.password_hash = new_password_hash
                 self.updated_at = datetime.fromisoformat(now)
-                return True
+            clear_user_cache(db_path)
+            return True
         except sqlite3.Error:
             return False
 
@@ -182,9 +299,14 @@ class User:
         if not dt_str:
             return datetime.now(timezone.utc)
 
+        # fromisoformat() accepts both our ISO timestamps and SQLite's
+        # "YYYY-MM-DD HH:MM:SS" default; only a trailing "Z" needs rewriting
+        # for Python < 3.11.
+        if dt_str[-1] == 'Z':
+            dt_str = dt_str[:-1] + '+00:00'
+
         try:
-            # Try ISO format first (for manually inserted timestamps)
-            return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+            return datetime.fromisoformat(dt_str)
         except ValueError:
             try:
                 # Try SQLite CURRENT_TIMESTAMP format: "YYYY-MM-DD HH:MM:SS"
@@ -10,6 +10,31 @@ import bcrypt
 # Cost factor for bcrypt (minimum 12 as required)
 BCRYPT_ROUNDS = 12
 
+# Prefix of hashes produced by bcrypt.gensalt(); the cost follows as two digits
+BCRYPT_PREFIX = "$2b$"
+
+# Length of a complete bcrypt hash string
+BCRYPT_HASH_LENGTH = 60
+
+
+def _bcrypt_cost(hashed_password: str) -> int | None:
+    """
+    Read the cost factor of a bcrypt hash.
+
+    Bcrypt hashes have the fixed layout ``$2b$NN$...`` so the cost is sliced
+    directly instead of splitting the whole string.
+
+    Args:
+        hashed_password: Hash string to inspect
+
+    Returns:
+        Cost factor, or None if the string is not a bcrypt hash
+    """
+    if hashed_password[:4] != BCRYPT_PREFIX or hashed_password[6:7] != "$":
+        return None
+    cost = hashed_password[4:6]
+    return int(cost) if cost.isdigit() else None
+
 
 def hash_password(password: str) -> str:
     """
@@ -49,6 +74,10 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     if not plain_password or not hashed_password:
         return False
 
+    # Reject malformed hashes before spending a full bcrypt round on them
+    if not hashed_password.startswith(BCRYPT_PREFIX) or len(hashed_password) != BCRYPT_HASH_LENGTH:
+        return False
+
     try:
         password_bytes = plain_password.encode('utf-8')
         hashed_bytes = hashed_password.encode('utf-8')
@@ -68,13 +97,10 @@ def needs_update(hashed_password: str) -> bool:
         True if hash needs updating, False otherwise
     """
     try:
-        if not hashed_password.startswith("$2b$"):
-            return True  # Not bcrypt
-
-        cost = int(hashed_password.split("$")[2])
-        return cost < BCRYPT_ROUNDS
+        cost = _bcrypt_cost(hashed_password)
     except Exception:
         return True  # If we can't check, assume it needs updating
+    return cost is None or cost < BCRYPT_ROUNDS
 
 
 def get_password_info(hashed_password: str) -> dict:
@@ -88,17 +114,15 @@ def get_password_info(hashed_password: str) -> dict:
         Dictionary with hash information
     """
     try:
-        if hashed_password.startswith("$2b$"):
-            cost_str = hashed_password.split("$")[2]
-            cost = int(cost_str)
-            return {
-                "scheme": "bcrypt",
-                "cost_factor": cost,
-                "meets_minimum": cost >= BCRYPT_ROUNDS,
-                "needs_update": cost < BCRYPT_ROUNDS,
-                "valid": True
-            }
-        else:
-            return {"scheme": "unknown", "valid": False, "needs_update": True}
+        cost = _bcrypt_cost(hashed_password)
     except Exception:
+        cost = None
+    if cost is None:
         return {"scheme": "unknown", "valid": False, "needs_update": True}
+    return {
+        "scheme": "bcrypt",
+        "cost_factor": cost,
+        "meets_minimum": cost >= BCRYPT_ROUNDS,
+        "needs_update": cost < BCRYPT_ROUNDS,
+        "valid": True
+    }
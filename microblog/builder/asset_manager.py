@@ -6,9 +6,15 @@ optimization for the static site generator.
 """
 
 import hashlib
+import json
 import logging
-import mimetypes
+import mmap
+import os
 import shutil
+import stat
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +27,50 @@ from microblog.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are hashed through a memory map
+MMAP_HASH_THRESHOLD = 64 * 1024
+
+# Maximum size of a single asset (50MB)
+MAX_ASSET_SIZE = 50 * 1024 * 1024
+
+# Server and secrets files that are never copied to the build output, as
+# dot-separated name components so 'prod.env.json' or 'web.config.xml' are
+# caught while 'environment.txt' is not
+SUSPICIOUS_NAME_PARTS = ('.htaccess.', '.env.', '.config.ini.', '.web.config.')
+
+# Record of the sources copied by the last successful copy_all_assets() run,
+# stored in the build directory
+ASSET_MANIFEST_NAME = '.asset-manifest.json'
+
+
+def _copy_file_contents(source_path: Path, dest_path: Path) -> None:
+    """
+    Copy the contents of a file, keeping the data in the kernel.
+
+    os.copy_file_range() is tried first; it can share extents (reflink) on
+    copy-on-write filesystems. Where it is unavailable or refused, this
+    falls back to shutil.copyfile(), which uses sendfile on Linux.
+
+    Args:
+        source_path: File to copy
+        dest_path: File to create or overwrite
+    """
+    if hasattr(os, 'copy_file_range'):
+        with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+            try:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                return
+            except OSError:
+                # e.g. EXDEV or ENOSYS; start over with the portable copy
+                pass
+
+    shutil.copyfile(source_path, dest_path)
+
 
 class AssetManagingError(Exception):
     """Raised when asset management operations fail."""
@@ -40,6 +90,30 @@ class AssetManager:
     - Build-time optimization
     """
 
+    # Allowed file extensions for security
+    ALLOWED_EXTENSIONS = frozenset({
+        # Images
+        '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico', '.bmp',
+        # Documents
+        '.pdf', '.txt', '.md',
+        # Web assets
+        '.css', '.js', '.json', '.xml',
+        # Fonts
+        '.woff', '.woff2', '.ttf', '.otf', '.eot',
+        # Other common assets
+        '.zip', '.tar', '.gz'
+    })
+
+    # Source to destination mappings as (source root, source subdirectory,
+    # destination subdirectory, description). The source root is "content"
+    # or "static" and is resolved against the configured directories.
+    ASSET_MAPPINGS_TEMPLATE = (
+        ('content', 'images', 'images', 'User content images'),
+        ('static', 'css', 'css', 'CSS stylesheets'),
+        ('static', 'js', 'js', 'JavaScript files'),
+        ('static', 'images', 'images', 'Static site images'),
+    )
+
     def __init__(self):
         """Initialize the asset manager with configuration."""
         self.config = get_config()
@@ -47,84 +121,63 @@ class AssetManager:
         self.static_dir = get_static_dir()
         self.build_dir = Path(self.config.build.output_dir)
 
-        # Allowed file extensions for security
-        self.allowed_extensions = {
-            # Images
-            '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico', '.bmp',
-            # Documents
-            '.pdf', '.txt', '.md',
-            # Web assets
-            '.css', '.js', '.json', '.xml',
-            # Fonts
-            '.woff', '.woff2', '.ttf', '.otf', '.eot',
-            # Other common assets
-            '.zip', '.tar', '.gz'
-        }
+        # Cached directory listings, see _list_files()
+        self._scan_cache: dict[tuple[Path, bool], tuple[list[tuple[Path, int]], list[Path]]] = {}
 
         # Source to destination mappings
+        roots = {'content': self.content_dir, 'static': self.static_dir}
         self.asset_mappings = [
             {
-                'source': self.content_dir / 'images',
-                'destination': self.build_dir / 'images',
-                'description': 'User content images'
-            },
-            {
-                'source': self.static_dir / 'css',
-                'destination': self.build_dir / 'css',
-                'description': 'CSS stylesheets'
-            },
-            {
-                'source': self.static_dir / 'js',
-                'destination': self.build_dir / 'js',
-                'description': 'JavaScript files'
-            },
-            {
-                'source': self.static_dir / 'images',
-                'destination': self.build_dir / 'images',
-                'description': 'Static site images'
+                'source': roots[root] / source,
+                'destination': self.build_dir / destination,
+                'description': description
             }
+            for root, source, destination, description in self.ASSET_MAPPINGS_TEMPLATE
         ]
 
         logger.info("Asset manager initialized")
 
-    def validate_file(self, file_path: Path) -> bool:
+    def validate_file(self, file_path: Path, file_stat: os.stat_result | None = None) -> bool:
         """
         Validate a file for copying.
 
         Args:
             file_path: Path to the file to validate
+            file_stat: Already known stat result of the file
 
         Returns:
             True if file is valid for copying, False otherwise
         """
         try:
-            # Check if file exists and is a regular file
-            if not file_path.is_file():
-                logger.debug(f"Skipping non-file: {file_path}")
-                return False
-
-            # Check file extension
-            if file_path.suffix.lower() not in self.allowed_extensions:
+            # Name checks first: they need no syscall and reject most bad files.
+            # Lowercase the name once and slice the extension from it, which
+            # matches Path.suffix without building another string per check.
+            name = file_path.name.lower()
+            dot = name.rfind('.')
+            if dot <= 0 or name[dot:] not in self.ALLOWED_EXTENSIONS:
                 logger.warning(f"Skipping file with disallowed extension: {file_path}")
                 return False
 
-            # Check file size (limit to 50MB)
-            file_size = file_path.stat().st_size
-            if file_size > 50 * 1024 * 1024:  # 50MB
-                logger.warning(f"Skipping large file ({file_size} bytes): {file_path}")
+            dotted = f'.{name}.'
+            if any(part in dotted for part in SUSPICIOUS_NAME_PARTS):
+                logger.warning(f"Skipping suspicious file: {file_path}")
                 return False
 
-            # Check MIME type for additional security
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            if mime_type and mime_type.startswith(('application/x-executable', 'application/x-sharedlib')):
-                logger.warning(f"Skipping executable file: {file_path}")
+            # Stat once and reuse the result for the type and size checks
+            if file_stat is None:
+                try:
+                    file_stat = file_path.stat()
+                except FileNotFoundError:
+                    file_stat = None
+
+            # Check if file exists and is a regular file
+            if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+                logger.debug(f"Skipping non-file: {file_path}")
                 return False
 
-            # Check for suspicious file names
-            filename = file_path.name.lower()
-            suspicious_patterns = ['.htaccess', '.env', 'config.ini', 'web.config']
-            if any(pattern in filename for pattern in suspicious_patterns):
-                logger.warning(f"Skipping suspicious file: {file_path}")
+            # Check file size
+            if file_stat.st_size > MAX_ASSET_SIZE:
+                logger.warning(f"Skipping large file ({file_stat.st_size} bytes): {file_path}")
                 return False
 
             return True
@@ -135,85 +188,112 @@ class AssetManager:
 
     def calculate_file_hash(self, file_path: Path) -> str:
         """
-        Calculate MD5 hash of a file for change detection.
+        Calculate a BLAKE2b hash of a file for change detection.
+
+        The hash only detects content changes, so it does not need to be
+        cryptographic; BLAKE2b is used because it is faster than MD5 in
+        CPython. Large files are hashed through a memory map in one call.
 
         Args:
             file_path: Path to the file
 
         Returns:
-            MD5 hash string
+            Hex digest string (32 characters)
         """
         try:
-            hash_md5 = hashlib.md5()
+            file_hash = hashlib.blake2b(digest_size=16)
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                size = os.fstat(f.fileno()).st_size
+                if size >= MMAP_HASH_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        file_hash.update(mm)
+                else:
+                    file_hash.update(f.read())
+            return file_hash.hexdigest()
         except Exception as e:
             logger.error(f"Error calculating hash for {file_path}: {e}")
             return ""
 
-    def needs_update(self, source_path: Path, dest_path: Path) -> bool:
+    def needs_update(
+        self,
+        source_path: Path,
+        dest_path: Path,
+        source_stat: os.stat_result | None = None,
+    ) -> bool:
         """
         Check if a file needs to be copied or updated.
 
+        Files are compared by their (mtime_ns, size) pair. Copies preserve
+        the source modification time, so any difference means the source
+        changed since it was last copied.
+
         Args:
             source_path: Source file path
             dest_path: Destination file path
+            source_stat: Already known stat result of the source file
 
         Returns:
             True if file needs to be copied, False otherwise
         """
         try:
-            # If destination doesn't exist, always copy
-            if not dest_path.exists():
+            try:
+                dest_stat = dest_path.stat()
+            except FileNotFoundError:
+                # If destination doesn't exist, always copy
                 return True
 
-            # Compare modification times
-            source_mtime = source_path.stat().st_mtime
-            dest_mtime = dest_path.stat().st_mtime
-
-            if source_mtime > dest_mtime:
-                return True
+            if source_stat is None:
+                source_stat = source_path.stat()
 
-            # If times are very close, compare file sizes
-            if abs(source_mtime - dest_mtime) < 1:  # Within 1 second
-                source_size = source_path.stat().st_size
-                dest_size = dest_path.stat().st_size
-                return source_size != dest_size
-
-            return False
+            return (source_stat.st_mtime_ns, source_stat.st_size) != (
+                dest_stat.st_mtime_ns,
+                dest_stat.st_size,
+            )
 
         except Exception as e:
             logger.error(f"Error checking if update needed for {source_path}: {e}")
             return True  # Default to copying on error
 
-    def copy_file(self, source_path: Path, dest_path: Path) -> bool:
+    def copy_file(
+        self,
+        source_path: Path,
+        dest_path: Path,
+        source_stat: os.stat_result | None = None,
+        ensure_parent: bool = True,
+    ) -> bool:
         """
         Copy a single file with validation and error handling.
 
         Args:
             source_path: Source file path
             dest_path: Destination file path
+            source_stat: Already known stat result of the source file
+            ensure_parent: Whether to create the destination directory; batch
+                callers create all parent directories up front instead
 
         Returns:
             True if copy successful, False otherwise
         """
         try:
             # Validate the source file
-            if not self.validate_file(source_path):
+            if not self.validate_file(source_path, source_stat):
                 return False
 
             # Check if update is needed
-            if not self.needs_update(source_path, dest_path):
+            if not self.needs_update(source_path, dest_path, source_stat):
                 logger.debug(f"Skipping up-to-date file: {source_path}")
                 return True
 
             # Ensure destination directory exists
-            ensure_directory(dest_path.parent)
+            if ensure_parent:
+                ensure_directory(dest_path.parent)
 
-            # Copy the file with metadata
-            shutil.copy2(source_path, dest_path)
+            # Copy the contents, then carry over only the timestamps that
+            # needs_update() compares, skipping copy2's mode and xattr syscalls
+            if source_stat is None:
+                source_stat = source_path.stat()
+            _copy_file_contents(source_path, dest_path)
+            os.utime(dest_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
 
             logger.debug(f"Copied: {source_path} -> {dest_path}")
             return True
@@ -222,6 +302,68 @@ class AssetManager:
             logger.error(f"Error copying file {source_path} to {dest_path}: {e}")
             return False
 
+    def _list_files(self, source_dir: Path, recursive: bool = True) -> list[Path]:
+        """
+        List the regular files below a directory, reusing the previous scan.
+
+        The listing is cached together with the mtime of every directory it
+        visited. Adding, removing or renaming a file changes its directory's
+        mtime, so the cached listing is reused only while all recorded
+        directory mtimes are unchanged.
+
+        Args:
+            source_dir: Directory to scan
+            recursive: Whether to descend into subdirectories
+
+        Returns:
+            List of file paths
+        """
+        cache_key = (source_dir, recursive)
+        cached = self._scan_cache.get(cache_key)
+        if cached is not None:
+            dir_mtimes, files = cached
+            try:
+                if all(os.stat(d).st_mtime_ns == mtime_ns for d, mtime_ns in dir_mtimes):
+                    return files
+            except OSError:
+                pass
+
+        dir_mtimes = []
+        files = []
+        pending = [source_dir]
+        while pending:
+            current = pending.pop()
+            dir_mtimes.append((current, os.stat(current).st_mtime_ns))
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(Path(entry.path))
+                    elif entry.is_file():
+                        files.append(Path(entry.path))
+
+        self._scan_cache[cache_key] = (dir_mtimes, files)
+        return files
+
+    def _scan_files(
+        self, source_dir: Path, recursive: bool = True
+    ) -> Iterator[tuple[Path, os.stat_result]]:
+        """
+        Yield regular files below a directory together with fresh stat results.
+
+        Args:
+            source_dir: Directory to scan
+            recursive: Whether to descend into subdirectories
+
+        Yields:
+            Tuples of (file_path, stat_result)
+        """
+        for file_path in self._list_files(source_dir, recursive):
+            try:
+                yield file_path, file_path.stat()
+            except FileNotFoundError:
+                continue
+
     def copy_directory_assets(self, source_dir: Path, dest_dir: Path, recursive: bool = True) -> tuple[int, int]:
         """
         Copy all valid assets from a source directory to destination.
@@ -242,22 +384,20 @@ class AssetManager:
                 logger.debug(f"Source directory does not exist: {source_dir}")
                 return successful, failed
 
-            # Get all files to copy
-            if recursive:
-                files_to_copy = source_dir.rglob('*')
-            else:
-                files_to_copy = source_dir.glob('*')
-
-            for source_file in files_to_copy:
-                if source_file.is_file():
-                    # Calculate relative path for destination
-                    relative_path = source_file.relative_to(source_dir)
-                    dest_file = dest_dir / relative_path
+            # Calculate destination paths and create each parent directory
+            # once rather than once per file
+            files = [
+                (source_file, dest_dir / source_file.relative_to(source_dir), source_stat)
+                for source_file, source_stat in self._scan_files(source_dir, recursive)
+            ]
+            for parent in {dest_file.parent for _, dest_file, _ in files}:
+                ensure_directory(parent)
 
-                    if self.copy_file(source_file, dest_file):
-                        successful += 1
-                    else:
-                        failed += 1
+            for source_file, dest_file, source_stat in files:
+                if self.copy_file(source_file, dest_file, source_stat, ensure_parent=False):
+                    successful += 1
+                else:
+                    failed += 1
 
         except Exception as e:
             logger.error(f"Error copying directory assets from {source_dir}: {e}")
@@ -265,10 +405,15 @@ class AssetManager:
 
         return successful, failed
 
-    def copy_all_assets(self) -> dict[str, Any]:
+    def copy_all_assets(self, previous_build_dir: Path | None = None) -> dict[str, Any]:
         """
         Copy all assets from configured sources to build directory.
 
+        Args:
+            previous_build_dir: Output of the previous build, if it was moved
+                out of the build directory; unchanged assets are hard-linked
+                from there instead of copied
+
         Returns:
             Dictionary with copy results and statistics
         """
@@ -281,24 +426,89 @@ class AssetManager:
         try:
             logger.info("Starting asset copying process")
 
-            for mapping in self.asset_mappings:
+            # Walk every source tree first, grouping sources by destination so
+            # that mappings sharing a destination are still applied in order
+            copy_tasks: dict[Path, list[tuple[int, Path, os.stat_result]]] = {}
+
+            for index, mapping in enumerate(self.asset_mappings):
                 source_dir = mapping['source']
                 dest_dir = mapping['destination']
                 description = mapping['description']
 
                 logger.info(f"Copying {description} from {source_dir} to {dest_dir}")
 
-                successful, failed = self.copy_directory_assets(source_dir, dest_dir)
+                scan_failed = 0
+                try:
+                    if source_dir.is_dir():
+                        for source_file, source_stat in self._scan_files(source_dir):
+                            dest_file = dest_dir / source_file.relative_to(source_dir)
+                            copy_tasks.setdefault(dest_file, []).append(
+                                (index, source_file, source_stat)
+                            )
+                    else:
+                        logger.debug(f"Source directory does not exist: {source_dir}")
+                except Exception as e:
+                    logger.error(f"Error copying directory assets from {source_dir}: {e}")
+                    scan_failed = 1
 
-                mapping_result = {
+                results['mappings'].append({
                     'source': str(source_dir),
                     'destination': str(dest_dir),
                     'description': description,
-                    'successful': successful,
-                    'failed': failed
-                }
+                    'successful': 0,
+                    'failed': scan_failed
+                })
+
+            # Create each destination directory once before copying
+            for parent in {dest_file.parent for dest_file in copy_tasks}:
+                ensure_directory(parent)
+
+            # Compare against the last successful run. Copying into a build
+            # directory that run already filled is skipped for the files still
+            # there; into a fresh one, unchanged files are hard-linked from the
+            # previous build.
+            sources_digest = self._sources_digest(copy_tasks)
+            previous_dir = previous_build_dir if previous_build_dir is not None else self.build_dir
+            previous = self._load_manifest(previous_dir)
+            unchanged = (
+                previous is not None
+                and not any(m['failed'] for m in results['mappings'])
+                and previous.get('sources') == sources_digest
+                and len(previous.get('successful', ())) == len(results['mappings'])
+            )
+            in_place = unchanged and previous_dir == self.build_dir
+            present = {dest_file for dest_file in copy_tasks if dest_file.exists()} if in_place else set()
+            if in_place and len(present) == len(copy_tasks):
+                for mapping_result, successful in zip(results['mappings'], previous['successful'], strict=True):
+                    mapping_result['successful'] = successful
+                    results['total_successful'] += successful
+                logger.info(f"Assets unchanged since last build, skipped copying {results['total_successful']} files")
+                return results
+
+            def copy_to_destination(dest_file: Path, sources: list) -> list[tuple[int, bool]]:
+                if dest_file in present:
+                    return [(index, True) for index, _, _ in sources]
+                if unchanged and not in_place and self._link_previous_file(dest_file, previous_dir):
+                    return [(index, True) for index, _, _ in sources]
+                return [
+                    (index, self.copy_file(source_file, dest_file, source_stat, ensure_parent=False))
+                    for index, source_file, source_stat in sources
+                ]
+
+            # File copies are I/O bound and release the GIL, so run them on threads
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for outcomes in executor.map(
+                    copy_to_destination, copy_tasks.keys(), copy_tasks.values()
+                ):
+                    for index, copied in outcomes:
+                        results['mappings'][index]['successful' if copied else 'failed'] += 1
+
+            for mapping_result in results['mappings']:
+                successful = mapping_result['successful']
+                failed = mapping_result['failed']
+                description = mapping_result['description']
 
-                results['mappings'].append(mapping_result)
                 results['total_successful'] += successful
                 results['total_failed'] += failed
 
@@ -313,12 +523,81 @@ class AssetManager:
             if results['total_failed'] > 0:
                 raise AssetManagingError(f"Failed to copy {results['total_failed']} assets")
 
+            self._save_manifest({
+                'sources': sources_digest,
+                'successful': [m['successful'] for m in results['mappings']]
+            })
+
         except Exception as e:
             logger.error(f"Asset copying process failed: {e}")
             raise AssetManagingError(f"Asset copying failed: {e}") from e
 
         return results
 
+    def _sources_digest(
+        self, copy_tasks: dict[Path, list[tuple[int, Path, os.stat_result]]]
+    ) -> str:
+        """
+        Fingerprint the sources of a copy run for comparison with the next run.
+
+        The digest covers the configured mappings and the path, size and
+        mtime of every source file. Only the digest is stored, so the build
+        output does not reveal local source paths.
+
+        Args:
+            copy_tasks: Scanned sources grouped by destination file
+
+        Returns:
+            Hex digest of the mappings and source file signatures
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for mapping in self.asset_mappings:
+            digest.update(f"{mapping['source']}\0{mapping['destination']}\n".encode())
+        for _, sources in sorted(copy_tasks.items()):
+            for index, source_file, source_stat in sources:
+                digest.update(
+                    f"{index}\0{source_file}\0{source_stat.st_size}\0{source_stat.st_mtime_ns}\n".encode()
+                )
+        return digest.hexdigest()
+
+    def _link_previous_file(self, dest_file: Path, previous_dir: Path) -> bool:
+        """
+        Hard-link an asset from the previous build into the build directory.
+
+        Args:
+            dest_file: Asset to create in the build directory
+            previous_dir: Output of the previous build
+
+        Returns:
+            True if the asset was linked, False if it has to be copied
+        """
+        try:
+            os.link(previous_dir / dest_file.relative_to(self.build_dir), dest_file)
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def _load_manifest(self, directory: Path) -> dict[str, Any] | None:
+        """Load the manifest of the last successful copy run into a directory, if any."""
+        try:
+            with open(directory / ASSET_MANIFEST_NAME, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return manifest if isinstance(manifest, dict) else None
+
+    def _save_manifest(self, manifest: dict[str, Any]) -> None:
+        """Write the manifest atomically; failures only cost the next short-circuit."""
+        manifest_path = self.build_dir / ASSET_MANIFEST_NAME
+        temp_path = manifest_path.with_suffix('.tmp')
+        try:
+            ensure_directory(self.build_dir)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, separators=(',', ':'))
+            os.replace(temp_path, manifest_path)
+        except OSError as e:
+            logger.warning(f"Could not write asset manifest {manifest_path}: {e}")
+
     def clean_build_assets(self) -> bool:
         """
         Clean asset directories in the build output.
@@ -338,6 +617,9 @@ class AssetManager:
                     shutil.rmtree(asset_dir)
                     logger.debug(f"Cleaned asset directory: {asset_dir}")
 
+            # The copied files are gone, so the last run's manifest no longer applies
+            (self.build_dir / ASSET_MANIFEST_NAME).unlink(missing_ok=True)
+
             logger.info("Build asset directories cleaned")
             return True
 
@@ -371,12 +653,11 @@ class AssetManager:
                     'exists': source_dir.exists()
                 }
 
-                if source_dir.exists() and source_dir.is_dir():
-                    for file_path in source_dir.rglob('*'):
-                        if file_path.is_file() and self.validate_file(file_path):
-                            file_size = file_path.stat().st_size
+                if source_dir.is_dir():
+                    for file_path, file_stat in self._scan_files(source_dir):
+                        if self.validate_file(file_path):
                             mapping_info['files'] += 1
-                            mapping_info['size'] += file_size
+                            mapping_info['size'] += file_stat.st_size
 
                 info['mappings'].append(mapping_info)
                 info['total_files'] += mapping_info['files']
@@ -390,6 +671,7 @@ class AssetManager:
 
 # Global asset manager instance
 _asset_manager: AssetManager | None = None
+_asset_manager_lock = threading.Lock()
 
 
 def get_asset_manager() -> AssetManager:
@@ -401,5 +683,7 @@ def get_asset_manager() -> AssetManager:
     """
     global _asset_manager
     if _asset_manager is None:
-        _asset_manager = AssetManager()
+        with _asset_manager_lock:
+            if _asset_manager is None:
+                _asset_manager = AssetManager()
     return _asset_manager
@@ -6,30 +6,314 @@ This module provides the main build orchestrator that coordinates markdown proce
 template rendering, and asset copying with safety mechanisms and progress tracking.
 """
 
+import gc
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
 import shutil
+import threading
+import time
 from collections.abc import Callable
-from dataclasses import dataclass
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from microblog.builder.asset_manager import get_asset_manager
 from microblog.builder.markdown_processor import get_markdown_processor
 from microblog.builder.template_renderer import get_template_renderer
 from microblog.content.post_service import get_post_service
+from microblog.content.validators import PostContent
 from microblog.server.config import get_config
 from microblog.utils import ensure_directory
 from microblog.utils.cache import (
     ParallelProcessor,
-    PerformanceTimer,
     get_performance_monitor,
     performance_timer,
 )
 
 logger = logging.getLogger(__name__)
 
+# Build phases with fewer tasks (posts or pages) than this run in-process;
+# starting worker processes costs more than it saves for a handful of tasks.
+PARALLEL_MIN_TASKS = 16
+
+# Progress within a phase is logged and passed to the callback at most this
+# often (seconds) unless it moved by at least PROGRESS_REPORT_STEP percent
+PROGRESS_REPORT_INTERVAL = 0.02
+PROGRESS_REPORT_STEP = 1.0
+
+# Generation 0 threshold while a build runs; rendering allocates large
+# numbers of short-lived objects, so collections are made less frequent
+BUILD_GC_THRESHOLD = (50_000, 50, 10)
+
+# The collector settings are process-wide, so overlapping builds (the
+# server's and the CLI's, say) share one tuning; see _begin_build_gc()
+_build_gc_lock = threading.Lock()
+_build_gc_users = 0
+_build_gc_saved_threshold: tuple[int, int, int] | None = None
+
+# Pages rendered from the full post list: (file, renderer method, label,
+# progress percentage reported once written)
+LISTING_PAGES = (
+    ('index.html', 'render_homepage', 'homepage', 10),
+    ('archive.html', 'render_archive', 'archive page', 80),
+    ('rss.xml', 'render_rss_feed', 'RSS feed', 100),
+)
+
+# Digests of the pages written by a build, kept in the build directory
+PAGE_MANIFEST_NAME = '.page-manifest.json'
+
+# Build components used inside worker processes, see _worker_pool()
+_worker_renderer = None
+_worker_markdown_processor = None
+_worker_previous_pages = None
+
+# Previous build the current one may reuse unchanged pages from, as
+# (build dir, backup dir, page digests) with both directories given as
+# strings ending in a separator; see _write_page()
+PreviousPages = tuple[str, str, dict[str, str]]
+
+
+def _begin_build_gc() -> None:
+    """
+    Tune the garbage collector for a build, unless another build already did.
+
+    Objects that exist before the build (configuration, templates, caches)
+    outlive it, so after collecting whatever garbage is left they are frozen
+    out of the collector's way, and collections are made less frequent.
+    """
+    global _build_gc_users, _build_gc_saved_threshold
+    with _build_gc_lock:
+        if _build_gc_users == 0:
+            _build_gc_saved_threshold = gc.get_threshold()
+            gc.collect()
+            gc.freeze()
+            gc.set_threshold(*BUILD_GC_THRESHOLD)
+        _build_gc_users += 1
+
+
+def _end_build_gc() -> None:
+    """Restore the garbage collector settings once the last running build ends."""
+    global _build_gc_users
+    with _build_gc_lock:
+        _build_gc_users -= 1
+        if _build_gc_users == 0:
+            gc.set_threshold(*_build_gc_saved_threshold)
+            gc.unfreeze()
+
+
+@lru_cache(maxsize=1)
+def _worker_context() -> BaseContext:
+    """
+    Multiprocessing context build worker processes are started with.
+
+    Workers are started from a clean server process instead of being forked
+    from the build, which may have other threads running: the asset copy,
+    or the build thread of the development server. The context is only
+    created once a pool is needed, so importing this module leaves the
+    process's multiprocessing setup alone.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+
+    context = multiprocessing.get_context('forkserver')
+    # The server imports the build modules once for all workers
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+class ProcessedPost(NamedTuple):
+    """A published post together with its converted HTML content."""
+    post: PostContent
+    html: str
+
+
+def _init_render_worker(renderer, previous_pages=None) -> None:
+    """
+    Set up a rendering worker process.
+
+    Args:
+        renderer: Template renderer sent from the building process
+        previous_pages: Previous build to reuse unchanged pages from, see
+            _write_page()
+    """
+    global _worker_renderer, _worker_previous_pages
+    _worker_renderer = renderer
+    _worker_previous_pages = previous_pages
+    _worker_renderer.preload_templates()
+
+
+def _init_markdown_worker(processor) -> None:
+    """Set up a markdown worker process with the processor sent to it."""
+    global _worker_markdown_processor
+    _worker_markdown_processor = processor
+
+
+def _process_post(post, processor=None) -> tuple[str | None, str | None]:
+    """
+    Convert a post's markdown to HTML.
+
+    Args:
+        post: Post to convert
+        processor: Markdown processor; defaults to the worker process one
+
+    Returns:
+        Tuple of (html_content, error_message); exactly one is None
+    """
+    try:
+        processor = processor if processor is not None else _worker_markdown_processor
+        return processor.process_content(post), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _write_page(
+    path: str | Path, content: str, previous_pages: PreviousPages | None = None
+) -> str:
+    """
+    Write a rendered page to disk.
+
+    The page is encoded once and written with os.write() on a raw file
+    descriptor, skipping the file object layers entirely. Short writes are
+    continued from where they stopped. A page identical to the one in the
+    previous build is hard-linked from the backup instead, so unchanged
+    pages keep their modification time for rsync and deploy tools.
+
+    Args:
+        path: File to write
+        content: Rendered page
+        previous_pages: Previous build to reuse the page from, if any
+
+    Returns:
+        Hex BLAKE2b digest of the page
+    """
+    data = content.encode('utf-8')
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if previous_pages is not None and _link_previous_page(path, digest, previous_pages):
+        return digest
+
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return digest
+
+
+def _link_previous_page(path: str | Path, digest: str, previous_pages: PreviousPages) -> bool:
+    """
+    Hard-link a page from the previous build if its content is unchanged.
+
+    Args:
+        path: Page to create in the current build
+        digest: Digest of the page content
+        previous_pages: Previous build to link the page from
+
+    Returns:
+        True if the page was linked, False if it has to be written
+    """
+    build_prefix, previous_prefix, digests = previous_pages
+    path = os.fspath(path)
+    if not path.startswith(build_prefix):
+        return False
+
+    relpath = path[len(build_prefix):]
+    if digests.get(relpath.replace(os.sep, '/')) != digest:
+        return False
+    try:
+        os.link(previous_prefix + relpath, path)
+        return True
+    except OSError:
+        return False
+
+
+def _render_listing_page(
+    method: str, posts: list, path: str, renderer=None, previous_pages=None
+) -> tuple[str | None, str | None]:
+    """
+    Render a page listing all posts (homepage, archive or feed) and write it.
+
+    Args:
+        method: Template renderer method that renders the page
+        posts: Published posts
+        path: File to write
+        renderer: Template renderer; defaults to the worker process renderer
+        previous_pages: Previous build to reuse the page from; defaults to
+            the worker process one along with the renderer
+
+    Returns:
+        Tuple of (page_digest, error_message); exactly one is None
+    """
+    try:
+        if renderer is None:
+            renderer, previous_pages = _worker_renderer, _worker_previous_pages
+        page = getattr(renderer, method)(posts)
+        return _write_page(path, page, previous_pages), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _render_post_page(
+    item: ProcessedPost, posts_dir: str, renderer=None, previous_pages=None
+) -> tuple[str | None, str | None]:
+    """
+    Render a processed post and write its page.
+
+    Args:
+        item: Processed post to render
+        posts_dir: Directory to write the page into, ending in a separator
+        renderer: Template renderer; defaults to the worker process renderer
+        previous_pages: Previous build to reuse the page from; defaults to
+            the worker process one along with the renderer
+
+    Returns:
+        Tuple of (page_digest, error_message); exactly one is None
+    """
+    try:
+        if renderer is None:
+            renderer, previous_pages = _worker_renderer, _worker_previous_pages
+        post, html = item
+        post_html = renderer.render_post(post, html)
+        return _write_page(posts_dir + post.computed_slug + '.html', post_html, previous_pages), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _render_tag_page(
+    tag: str, tag_posts: list, tags_dir: str, renderer=None, previous_pages=None
+) -> tuple[str | None, str | None]:
+    """
+    Render a tag page and write it.
+
+    Args:
+        tag: Tag to render
+        tag_posts: Posts carrying the tag
+        tags_dir: Directory to write the page into, ending in a separator
+        renderer: Template renderer; defaults to the worker process renderer
+        previous_pages: Previous build to reuse the page from; defaults to
+            the worker process one along with the renderer
+
+    Returns:
+        Tuple of (page_digest, error_message); exactly one is None
+    """
+    try:
+        if renderer is None:
+            renderer, previous_pages = _worker_renderer, _worker_previous_pages
+        tag_html = renderer.render_tag_page(tag, tag_posts)
+        return _write_page(tags_dir + tag.lower() + '.html', tag_html, previous_pages), None
+    except Exception as e:
+        return None, str(e)
+
 
 class BuildPhase(Enum):
     """Build phase enumeration for progress tracking."""
@@ -52,11 +336,34 @@ class BuildProgress:
     message: str
     percentage: float = 0.0
     details: dict[str, Any] | None = None
-    timestamp: datetime | None = None
+    timestamp: InitVar[datetime | None] = None
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    def __post_init__(self, timestamp: datetime | None) -> None:
+        # An explicitly passed timestamp is used as-is
+        if timestamp is not None:
+            self.timestamp = timestamp
+
+    def _get_timestamp(self) -> datetime:
+        """
+        Local time of the update.
+
+        Only the integer timestamp_ns is recorded when an update is created;
+        most updates are never displayed, so the datetime is built on read.
+        """
+        seconds, nanoseconds = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+    def _set_timestamp(self, value: datetime) -> None:
+        seconds = int(value.replace(microsecond=0).timestamp())
+        self.timestamp_ns = seconds * 1_000_000_000 + value.microsecond * 1000
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+
+# Assigned after the dataclass is built so the class attribute does not
+# become the default of the timestamp init argument
+BuildProgress.timestamp = property(
+    BuildProgress._get_timestamp, BuildProgress._set_timestamp
+)
 
 
 @dataclass
@@ -108,6 +415,11 @@ class BuildGenerator:
 
         self.progress_callback = progress_callback
         self.progress_history: list[BuildProgress] = []
+        self._page_digests: dict[str, str] = {}
+        self._previous_pages: PreviousPages | None = None
+        self._last_progress_phase: BuildPhase | None = None
+        self._last_progress_percent = 0.0
+        self._last_progress_ts = 0.0
         self.build_start_time: datetime | None = None
 
         # Performance optimization components
@@ -120,6 +432,11 @@ class BuildGenerator:
         """
         Report build progress and execute callback if provided.
 
+        Every update is recorded in the progress history. Logging and the
+        callback are throttled within a phase so per-post updates on large
+        sites don't dominate the build; phase changes, completion and
+        steps of PROGRESS_REPORT_STEP percent are always reported.
+
         Args:
             phase: Current build phase
             message: Progress message
@@ -134,7 +451,20 @@ class BuildGenerator:
         )
 
         self.progress_history.append(progress)
-        logger.info(f"Build progress: {phase.value} - {message} ({percentage:.1f}%)")
+
+        now = time.monotonic()
+        if (
+            phase is self._last_progress_phase
+            and percentage < 100
+            and abs(percentage - self._last_progress_percent) < PROGRESS_REPORT_STEP
+            and now - self._last_progress_ts <= PROGRESS_REPORT_INTERVAL
+        ):
+            return
+
+        self._last_progress_phase = phase
+        self._last_progress_percent = percentage
+        self._last_progress_ts = now
+        logger.info("Build progress: %s - %s (%.1f%%)", phase.value, message, percentage)
 
         if self.progress_callback:
             try:
@@ -163,13 +493,22 @@ class BuildGenerator:
                 return False
 
             # Validate required templates exist
+            # One directory listing instead of loading and compiling each
+            # template; full validation only runs when strict_validation is set
             required_templates = ['index.html', 'post.html', 'archive.html', 'rss.xml']
+            available_templates = set(self.template_renderer.env.list_templates())
             for template_name in required_templates:
-                is_valid, error = self.template_renderer.validate_template(template_name)
-                if not is_valid:
-                    logger.error(f"Required template '{template_name}' is invalid: {error}")
+                if template_name not in available_templates:
+                    logger.error(f"Required template '{template_name}' not found")
                     return False
 
+            if self.config.build.strict_validation:
+                for template_name in required_templates:
+                    is_valid, error = self.template_renderer.validate_template(template_name)
+                    if not is_valid:
+                        logger.error(f"Required template '{template_name}' is invalid: {error}")
+                        return False
+
             # Check if we have write permissions for build directory
             build_parent = self.build_dir.parent
             if not build_parent.exists():
@@ -186,6 +525,49 @@ class BuildGenerator:
             logger.error(f"Error validating build preconditions: {e}")
             return False
 
+    @staticmethod
+    def _same_filesystem(source: Path, destination: Path) -> bool:
+        """Check whether a directory can be renamed to a destination path."""
+        try:
+            return os.stat(source.parent).st_dev == os.stat(destination.parent).st_dev
+        except OSError:
+            return False
+
+    @staticmethod
+    def _move_directory(source: Path, destination: Path) -> None:
+        """Move a directory, with a single atomic rename when possible."""
+        if BuildGenerator._same_filesystem(source, destination):
+            os.rename(source, destination)
+        else:
+            shutil.move(str(source), str(destination))
+
+    @staticmethod
+    def _discard_directory(path: Path) -> None:
+        """
+        Remove a directory without waiting for its contents to be deleted.
+
+        The directory is renamed out of the way, which frees its path
+        immediately, and the renamed tree is deleted on a background thread.
+        The thread is not a daemon, so a short-lived process still finishes
+        the deletion before exiting.
+
+        Args:
+            path: Directory to remove
+        """
+        discarded = path.with_name(f"{path.name}.old.{time.time_ns()}")
+        try:
+            os.rename(path, discarded)
+        except OSError:
+            shutil.rmtree(path)
+            return
+
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(discarded,),
+            kwargs={'ignore_errors': True},
+            name=f"discard-{path.name}"
+        ).start()
+
     def _create_backup(self) -> bool:
         """
         Create backup of existing build directory.
@@ -197,12 +579,12 @@ class BuildGenerator:
             # Remove old backup if it exists
             if self.backup_dir.exists():
                 logger.info(f"Removing old backup: {self.backup_dir}")
-                shutil.rmtree(self.backup_dir)
+                self._discard_directory(self.backup_dir)
 
             # If build directory exists, move it to backup location
             if self.build_dir.exists():
                 logger.info(f"Creating backup: {self.build_dir} -> {self.backup_dir}")
-                shutil.move(str(self.build_dir), str(self.backup_dir))
+                self._move_directory(self.build_dir, self.backup_dir)
                 logger.info("Backup created successfully")
             else:
                 logger.info("No existing build directory to backup")
@@ -228,12 +610,12 @@ class BuildGenerator:
             # Remove failed build directory
             if self.build_dir.exists():
                 logger.info(f"Removing failed build directory: {self.build_dir}")
-                shutil.rmtree(self.build_dir)
+                self._discard_directory(self.build_dir)
 
             # Restore from backup if it exists
             if self.backup_dir.exists():
                 logger.info(f"Restoring from backup: {self.backup_dir} -> {self.build_dir}")
-                shutil.move(str(self.backup_dir), str(self.build_dir))
+                self._move_directory(self.backup_dir, self.build_dir)
                 logger.info("Rollback completed successfully")
                 return True
             else:
@@ -245,7 +627,7 @@ class BuildGenerator:
             return False
 
     @performance_timer("content_processing")
-    def _process_content(self) -> tuple[list, dict[str, Any]]:
+    def _process_content(self) -> tuple[list[ProcessedPost], dict[str, Any]]:
         """
         Process all markdown content to HTML using parallel processing.
 
@@ -267,66 +649,38 @@ class BuildGenerator:
                 self.performance_monitor.end_phase("content_processing")
                 return [], {'total_posts': 0, 'processed_posts': 0, 'processing_errors': 0}
 
-            def process_single_post(post):
-                """Process a single post for parallel execution."""
-                try:
-                    with PerformanceTimer(f"markdown_processing_{post.computed_slug}"):
-                        html_content = self.markdown_processor.process_content(post)
-                        return {
-                            'post': post,
-                            'html_content': html_content,
-                            'success': True
-                        }
-                except Exception as e:
-                    logger.error(f"Failed to process post '{post.frontmatter.title}': {e}")
-                    return {
-                        'post': post,
-                        'html_content': None,
-                        'success': False,
-                        'error': e
-                    }
-
-            # Process posts in parallel if enabled and we have multiple posts
-            if len(posts) > 1 and self.config.performance.enable_parallel_processing:
-                logger.info(f"Processing {len(posts)} posts in parallel")
+            # python-markdown is pure Python and holds the GIL, so larger
+            # sites are converted in worker processes rather than threads
+            with self._worker_pool(len(posts), _init_markdown_worker, self.markdown_processor) as executor:
+                parallel = executor is not None
+                if parallel:
+                    logger.info(f"Processing {len(posts)} posts in parallel")
+                    outcomes = executor.map(
+                        _process_post,
+                        posts,
+                        chunksize=self._worker_chunksize(len(posts))
+                    )
+                else:
+                    outcomes = (_process_post(post, self.markdown_processor) for post in posts)
+
+                processed_posts = []
+                processing_errors = 0
+                for completed, (post, (html_content, error)) in enumerate(
+                    zip(posts, outcomes, strict=True), start=1
+                ):
+                    if error is None:
+                        processed_posts.append(ProcessedPost(post, html_content))
+                    else:
+                        logger.error(f"Failed to process post '{post.frontmatter.title}': {error}")
+                        processing_errors += 1
 
-                def progress_callback(completed, total):
-                    progress = (completed / total) * 100
                     self._report_progress(
                         BuildPhase.CONTENT_PROCESSING,
-                        f"Processed {completed}/{total} posts",
-                        progress,
-                        {'processed': completed, 'total': total}
+                        f"Processed {completed}/{len(posts)} posts",
+                        (completed / len(posts)) * 100,
+                        {'processed': completed, 'total': len(posts)}
                     )
 
-                results = self.parallel_processor.process_in_parallel(
-                    posts,
-                    process_single_post,
-                    progress_callback
-                )
-            else:
-                # Single post - process directly
-                results = [process_single_post(posts[0])]
-                self._report_progress(
-                    BuildPhase.CONTENT_PROCESSING,
-                    f"Processed post: {posts[0].frontmatter.title}",
-                    100,
-                    {'processed': 1, 'total': 1}
-                )
-
-            # Separate successful and failed results
-            processed_posts = []
-            processing_errors = 0
-
-            for result in results:
-                if result and result.get('success', False):
-                    processed_posts.append({
-                        'post': result['post'],
-                        'html_content': result['html_content']
-                    })
-                else:
-                    processing_errors += 1
-
             if processing_errors > 0:
                 raise BuildGeneratingError(f"Failed to process {processing_errors} posts")
 
@@ -334,7 +688,7 @@ class BuildGenerator:
                 'total_posts': len(posts),
                 'processed_posts': len(processed_posts),
                 'processing_errors': processing_errors,
-                'parallel_processing': len(posts) > 1
+                'parallel_processing': parallel
             }
 
             self.performance_monitor.end_phase("content_processing")
@@ -346,13 +700,88 @@ class BuildGenerator:
             logger.error(f"Content processing failed: {e}")
             raise BuildGeneratingError(f"Content processing failed: {e}") from e
 
+    @contextmanager
+    def _reusing_previous_pages(self):
+        """
+        Let pages written in this context be reused from the previous build.
+
+        The page manifest of the build that was moved to the backup
+        directory is loaded; pages whose digest matches are hard-linked from
+        there by _write_page(). Worker processes are handed it when started.
+        """
+        try:
+            with open(self.backup_dir / PAGE_MANIFEST_NAME, encoding='utf-8') as f:
+                digests = json.load(f)
+        except (OSError, ValueError):
+            digests = None
+
+        if isinstance(digests, dict):
+            self._previous_pages = (
+                os.fspath(self.build_dir) + os.sep,
+                os.fspath(self.backup_dir) + os.sep,
+                digests
+            )
+        try:
+            yield
+        finally:
+            self._previous_pages = None
+
+    def _save_page_manifest(self) -> None:
+        """Write the digests of this build's pages for the next build to compare against."""
+        manifest_path = self.build_dir / PAGE_MANIFEST_NAME
+        temp_path = manifest_path.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._page_digests, f, separators=(',', ':'))
+            os.replace(temp_path, manifest_path)
+        except OSError as e:
+            logger.warning(f"Could not write page manifest {manifest_path}: {e}")
+
+    def _worker_pool(self, task_count: int, initializer: Callable[..., None], *initargs):
+        """
+        Create a process pool for CPU-bound build work, if worthwhile.
+
+        Markdown conversion and Jinja rendering are pure Python and hold the
+        GIL, so tasks are spread over worker processes when parallel
+        processing is enabled and there are enough of them. Each worker is
+        set up by the initializer with the given arguments, so it does not
+        depend on state inherited from this process.
+
+        Args:
+            task_count: Number of tasks to run
+            initializer: Worker initializer that sets up the build component
+            *initargs: Arguments for the initializer
+
+        Returns:
+            Context manager yielding a ProcessPoolExecutor, or None to run
+            the tasks in-process
+        """
+        if task_count < PARALLEL_MIN_TASKS or not self.config.performance.enable_parallel_processing:
+            return nullcontext()
+
+        return ProcessPoolExecutor(
+            max_workers=self._worker_count(),
+            mp_context=_worker_context(),
+            initializer=initializer,
+            initargs=initargs
+        )
+
+    def _worker_count(self) -> int:
+        """Number of worker processes used for parallel build work."""
+        max_workers = self.config.performance.max_parallel_workers
+        return max_workers if isinstance(max_workers, int) else (os.cpu_count() or 1)
+
+    def _worker_chunksize(self, task_count: int) -> int:
+        """Tasks handed to a worker process at a time."""
+        return max(1, task_count // (4 * self._worker_count()))
+
     @performance_timer("template_rendering")
-    def _render_templates(self, processed_posts: list) -> dict[str, Any]:
+    def _render_templates(self, processed_posts: list[ProcessedPost]) -> dict[str, Any]:
         """
         Render all templates and generate static pages with performance monitoring.
 
         Args:
-            processed_posts: List of processed post data
+            processed_posts: Processed posts to render
 
         Returns:
             Dictionary with rendering statistics
@@ -362,49 +791,93 @@ class BuildGenerator:
         """
         try:
             self.performance_monitor.start_phase("template_rendering")
-            posts = [item['post'] for item in processed_posts]
+            posts = [pp.post for pp in processed_posts]
+            page_digests = self._page_digests = {}
             rendering_stats = {
                 'pages_rendered': 0,
                 'rendering_errors': 0,
                 'rendered_pages': []
             }
 
-            # Render homepage
-            try:
-                homepage_html = self.template_renderer.render_homepage(posts)
-                homepage_path = self.build_dir / 'index.html'
-                with open(homepage_path, 'w', encoding='utf-8') as f:
-                    f.write(homepage_html)
-                rendering_stats['pages_rendered'] += 1
-                rendering_stats['rendered_pages'].append('index.html')
-                logger.info("Rendered homepage")
-
-                self._report_progress(
-                    BuildPhase.TEMPLATE_RENDERING,
-                    "Rendered homepage",
-                    10
-                )
-            except Exception as e:
-                logger.error(f"Failed to render homepage: {e}")
-                rendering_stats['rendering_errors'] += 1
+            # Index posts by lowercased tag in a single pass instead of
+            # filtering all posts per tag
+            tag_index: dict[str, list] = {}
+            for post in posts:
+                for tag in {t.lower() for t in post.frontmatter.tags}:
+                    tag_index.setdefault(tag, []).append(post)
+
+            all_tags = sorted(tag_index)
+            tag_posts = [tag_index[tag] for tag in all_tags]
+
+            # Page paths are joined as plain strings rather than Path objects
+            build_prefix = os.fspath(self.build_dir) + os.sep
+            posts_dir = build_prefix + 'posts' + os.sep
+            ensure_directory(Path(posts_dir))
+            tags_dir = build_prefix + 'tags' + os.sep
+            if all_tags:
+                ensure_directory(Path(tags_dir))
+
+            task_count = len(processed_posts) + len(all_tags) + len(LISTING_PAGES)
+            with self._worker_pool(
+                task_count, _init_render_worker, self.template_renderer, self._previous_pages
+            ) as executor:
+                if executor is not None:
+                    # The listing pages only need the post list, so they are
+                    # rendered alongside the post and tag pages
+                    listing_futures = {
+                        page: executor.submit(_render_listing_page, method, posts, build_prefix + page)
+                        for page, method, _, _ in LISTING_PAGES
+                    }
+                    post_outcomes = executor.map(
+                        _render_post_page,
+                        processed_posts,
+                        [posts_dir] * len(processed_posts),
+                        chunksize=self._worker_chunksize(len(processed_posts))
+                    )
+                    tag_outcomes = executor.map(
+                        _render_tag_page,
+                        all_tags,
+                        tag_posts,
+                        [tags_dir] * len(all_tags),
+                        chunksize=self._worker_chunksize(len(all_tags))
+                    )
+                else:
+                    listing_futures = None
+                    post_outcomes = (
+                        _render_post_page(pp, posts_dir, self.template_renderer, self._previous_pages)
+                        for pp in processed_posts
+                    )
+                    tag_outcomes = (
+                        _render_tag_page(
+                            tag, posts_for_tag, tags_dir, self.template_renderer, self._previous_pages
+                        )
+                        for tag, posts_for_tag in zip(all_tags, tag_posts, strict=True)
+                    )
 
-            # Render individual posts
-            posts_dir = self.build_dir / 'posts'
-            ensure_directory(posts_dir)
+                def listing_outcome(listing_page: tuple) -> tuple[str | None, str | None]:
+                    page, method = listing_page[:2]
+                    if listing_futures is not None:
+                        return listing_futures[page].result()
+                    return _render_listing_page(
+                        method, posts, build_prefix + page, self.template_renderer, self._previous_pages
+                    )
 
-            for i, item in enumerate(processed_posts):
-                try:
-                    post = item['post']
-                    html_content = item['html_content']
+                homepage, archive, rss = LISTING_PAGES
 
-                    post_html = self.template_renderer.render_post(post, html_content)
-                    post_path = posts_dir / f"{post.computed_slug}.html"
+                # Render homepage
+                self._record_listing_page(homepage, listing_outcome(homepage), rendering_stats)
 
-                    with open(post_path, 'w', encoding='utf-8') as f:
-                        f.write(post_html)
+                # Render individual posts
+                for i, (post, (digest, error)) in enumerate(zip(posts, post_outcomes, strict=True)):
+                    if error is not None:
+                        logger.error(f"Failed to render post '{post.frontmatter.title}': {error}")
+                        rendering_stats['rendering_errors'] += 1
+                        continue
 
+                    page = f"posts/{post.computed_slug}.html"
+                    page_digests[page] = digest
                     rendering_stats['pages_rendered'] += 1
-                    rendering_stats['rendered_pages'].append(f"posts/{post.computed_slug}.html")
+                    rendering_stats['rendered_pages'].append(page)
 
                     # Report progress
                     progress = 10 + ((i + 1) / len(processed_posts)) * 60
@@ -414,69 +887,23 @@ class BuildGenerator:
                         progress
                     )
 
-                except Exception as e:
-                    logger.error(f"Failed to render post '{post.frontmatter.title}': {e}")
-                    rendering_stats['rendering_errors'] += 1
-
-            # Render archive page
-            try:
-                archive_html = self.template_renderer.render_archive(posts)
-                archive_path = self.build_dir / 'archive.html'
-                with open(archive_path, 'w', encoding='utf-8') as f:
-                    f.write(archive_html)
-                rendering_stats['pages_rendered'] += 1
-                rendering_stats['rendered_pages'].append('archive.html')
-                logger.info("Rendered archive page")
-
-                self._report_progress(
-                    BuildPhase.TEMPLATE_RENDERING,
-                    "Rendered archive page",
-                    80
-                )
-            except Exception as e:
-                logger.error(f"Failed to render archive page: {e}")
-                rendering_stats['rendering_errors'] += 1
+                # Render archive page
+                self._record_listing_page(archive, listing_outcome(archive), rendering_stats)
 
-            # Render tag pages
-            all_tags = self.template_renderer.get_all_tags()
-            if all_tags:
-                tags_dir = self.build_dir / 'tags'
-                ensure_directory(tags_dir)
-
-                for tag in all_tags:
-                    try:
-                        tag_posts = [p for p in posts if tag.lower() in [t.lower() for t in p.frontmatter.tags]]
-                        tag_html = self.template_renderer.render_tag_page(tag, tag_posts)
-                        tag_path = tags_dir / f"{tag.lower()}.html"
-
-                        with open(tag_path, 'w', encoding='utf-8') as f:
-                            f.write(tag_html)
-
-                        rendering_stats['pages_rendered'] += 1
-                        rendering_stats['rendered_pages'].append(f"tags/{tag.lower()}.html")
-
-                    except Exception as e:
-                        logger.error(f"Failed to render tag page '{tag}': {e}")
+                # Render tag pages
+                for tag, (digest, error) in zip(all_tags, tag_outcomes, strict=True):
+                    if error is not None:
+                        logger.error(f"Failed to render tag page '{tag}': {error}")
                         rendering_stats['rendering_errors'] += 1
+                        continue
 
-            # Render RSS feed
-            try:
-                rss_xml = self.template_renderer.render_rss_feed(posts)
-                rss_path = self.build_dir / 'rss.xml'
-                with open(rss_path, 'w', encoding='utf-8') as f:
-                    f.write(rss_xml)
-                rendering_stats['pages_rendered'] += 1
-                rendering_stats['rendered_pages'].append('rss.xml')
-                logger.info("Rendered RSS feed")
+                    page = f"tags/{tag.lower()}.html"
+                    page_digests[page] = digest
+                    rendering_stats['pages_rendered'] += 1
+                    rendering_stats['rendered_pages'].append(page)
 
-                self._report_progress(
-                    BuildPhase.TEMPLATE_RENDERING,
-                    "Rendered RSS feed",
-                    100
-                )
-            except Exception as e:
-                logger.error(f"Failed to render RSS feed: {e}")
-                rendering_stats['rendering_errors'] += 1
+                # Render RSS feed
+                self._record_listing_page(rss, listing_outcome(rss), rendering_stats)
 
             if rendering_stats['rendering_errors'] > 0:
                 raise BuildGeneratingError(f"Template rendering had {rendering_stats['rendering_errors']} errors")
@@ -490,10 +917,46 @@ class BuildGenerator:
             logger.error(f"Template rendering failed: {e}")
             raise BuildGeneratingError(f"Template rendering failed: {e}") from e
 
-    def _copy_assets(self) -> dict[str, Any]:
+    def _record_listing_page(
+        self,
+        listing_page: tuple[str, str, str, float],
+        outcome: tuple[str | None, str | None],
+        rendering_stats: dict[str, Any]
+    ) -> None:
+        """
+        Record the outcome of rendering a listing page and report progress.
+
+        Args:
+            listing_page: Entry of LISTING_PAGES that was rendered
+            outcome: Tuple of (page_digest, error_message)
+            rendering_stats: Rendering statistics to update
+        """
+        page, _, label, progress = listing_page
+        digest, error = outcome
+        if error is not None:
+            logger.error(f"Failed to render {label}: {error}")
+            rendering_stats['rendering_errors'] += 1
+            return
+
+        self._page_digests[page] = digest
+        rendering_stats['pages_rendered'] += 1
+        rendering_stats['rendered_pages'].append(page)
+        logger.info(f"Rendered {label}")
+
+        self._report_progress(
+            BuildPhase.TEMPLATE_RENDERING,
+            f"Rendered {label}",
+            progress
+        )
+
+    def _copy_assets(self, copy_future: Future | None = None) -> dict[str, Any]:
         """
         Copy all static assets to build directory.
 
+        Args:
+            copy_future: Asset copy already started in the background, whose
+                results are waited for instead of copying again
+
         Returns:
             Dictionary with asset copying statistics
 
@@ -508,7 +971,10 @@ class BuildGenerator:
             )
 
             # Copy all assets using the asset manager
-            copy_results = self.asset_manager.copy_all_assets()
+            if copy_future is not None:
+                copy_results = copy_future.result()
+            else:
+                copy_results = self.asset_manager.copy_all_assets()
 
             self._report_progress(
                 BuildPhase.ASSET_COPYING,
@@ -538,38 +1004,40 @@ class BuildGenerator:
                 0
             )
 
-            # Check if build directory exists
-            if not self.build_dir.exists():
+            # List the build directory once; existence and sizes below come
+            # from its entries
+            try:
+                with os.scandir(self.build_dir) as entries:
+                    build_entries = {entry.name: entry for entry in entries}
+            except FileNotFoundError:
                 logger.error("Build directory does not exist")
                 return False
 
             # Check for required files
             required_files = ['index.html', 'archive.html', 'rss.xml']
-            missing_files = []
-
-            for file_name in required_files:
-                file_path = self.build_dir / file_name
-                if not file_path.exists():
-                    missing_files.append(file_name)
+            missing_files = [f for f in required_files if f not in build_entries]
 
             if missing_files:
                 logger.error(f"Missing required files: {missing_files}")
                 return False
 
             # Check if posts directory exists and has content
-            posts_dir = self.build_dir / 'posts'
-            if not posts_dir.exists():
+            posts_entry = build_entries.get('posts')
+            if posts_entry is None or not posts_entry.is_dir():
                 logger.warning("Posts directory does not exist")
             else:
-                post_files = list(posts_dir.glob('*.html'))
-                logger.info(f"Found {len(post_files)} post files in build")
+                with os.scandir(posts_entry.path) as entries:
+                    post_count = sum(
+                        1 for entry in entries
+                        if entry.name.endswith('.html') and entry.is_file(follow_symlinks=False)
+                    )
+                logger.info(f"Found {post_count} post files in build")
 
             # Verify file sizes are reasonable
-            for file_path in [self.build_dir / f for f in required_files]:
-                if file_path.exists():
-                    file_size = file_path.stat().st_size
-                    if file_size < 10:  # Very small files might indicate generation errors
-                        logger.warning(f"File {file_path.name} is suspiciously small ({file_size} bytes)")
+            for file_name in required_files:
+                file_size = build_entries[file_name].stat().st_size
+                if file_size < 10:  # Very small files might indicate generation errors
+                    logger.warning(f"File {file_name} is suspiciously small ({file_size} bytes)")
 
             self._report_progress(
                 BuildPhase.VERIFICATION,
@@ -610,6 +1078,8 @@ class BuildGenerator:
         self.build_start_time = datetime.now()
         self.performance_monitor.start_build()
 
+        _begin_build_gc()
+
         try:
             # Phase 1: Initialization and validation
             self._report_progress(
@@ -618,6 +1088,9 @@ class BuildGenerator:
                 0
             )
 
+            # Templates may have been edited since the last build
+            self.template_renderer.reload_templates()
+
             if not self._validate_build_preconditions():
                 raise BuildGeneratingError("Build preconditions validation failed")
 
@@ -640,23 +1113,30 @@ class BuildGenerator:
 
             processed_posts, content_stats = self._process_content()
 
-            # Phase 4: Render templates
-            self._report_progress(
-                BuildPhase.TEMPLATE_RENDERING,
-                "Rendering templates",
-                0
-            )
+            # Asset copying is I/O bound and independent of the pages, so it
+            # runs on its own thread while templates are rendered. Leaving
+            # the block waits for it, also when rendering fails.
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="asset-copy") as asset_executor:
+                asset_future = asset_executor.submit(self.asset_manager.copy_all_assets, self.backup_dir)
 
-            rendering_stats = self._render_templates(processed_posts)
+                # Phase 4: Render templates
+                self._report_progress(
+                    BuildPhase.TEMPLATE_RENDERING,
+                    "Rendering templates",
+                    0
+                )
 
-            # Phase 5: Copy assets
-            self._report_progress(
-                BuildPhase.ASSET_COPYING,
-                "Copying static assets",
-                0
-            )
+                with self._reusing_previous_pages():
+                    rendering_stats = self._render_templates(processed_posts)
+
+                # Phase 5: Copy assets
+                self._report_progress(
+                    BuildPhase.ASSET_COPYING,
+                    "Copying static assets",
+                    0
+                )
 
-            asset_stats = self._copy_assets()
+                asset_stats = self._copy_assets(asset_future)
 
             # Phase 6: Verify build
             self._report_progress(
@@ -668,6 +1148,8 @@ class BuildGenerator:
             if not self._verify_build_integrity():
                 raise BuildGeneratingError("Build integrity verification failed")
 
+            self._save_page_manifest()
+
             # Phase 7: Cleanup
             self._report_progress(
                 BuildPhase.CLEANUP,
@@ -678,7 +1160,8 @@ class BuildGenerator:
             self._cleanup_backup()
 
             # Build completed successfully
-            duration = (datetime.now() - self.build_start_time).total_seconds()
+            finished_at = datetime.now()
+            duration = (finished_at - self.build_start_time).total_seconds()
 
             self._report_progress(
                 BuildPhase.COMPLETED,
@@ -696,7 +1179,7 @@ class BuildGenerator:
                 'rendering': rendering_stats,
                 'assets': asset_stats,
                 'duration': duration,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': finished_at.isoformat(),
                 'performance_metrics': performance_metrics,
                 'performance_targets_met': performance_targets_met,
                 'cache_stats': self.template_renderer.get_cache_stats()
@@ -751,6 +1234,9 @@ class BuildGenerator:
                 error=e
             )
 
+        finally:
+            _end_build_gc()
+
     def get_performance_stats(self) -> dict[str, Any]:
         """Get current performance statistics."""
         return {
@@ -767,12 +1253,16 @@ class BuildGenerator:
 
 # Global build generator instance
 _build_generator: BuildGenerator | None = None
+_build_generator_lock = threading.Lock()
 
 
 def get_build_generator(progress_callback: Callable[[BuildProgress], None] | None = None) -> BuildGenerator:
     """
     Get the global build generator instance.
 
+    The instance is shared, so the given progress callback replaces the one
+    set by any previous caller.
+
     Args:
         progress_callback: Optional callback function for progress updates
 
@@ -781,14 +1271,29 @@ def get_build_generator(progress_callback: Callable[[BuildProgress], None] | Non
     """
     global _build_generator
     if _build_generator is None:
-        _build_generator = BuildGenerator(progress_callback)
+        with _build_generator_lock:
+            if _build_generator is None:
+                _build_generator = BuildGenerator(progress_callback)
+    _build_generator.progress_callback = progress_callback
     return _build_generator
 
 
+def reset_build_generator() -> None:
+    """Discard the global build generator so the next call creates a new one."""
+    global _build_generator
+    with _build_generator_lock:
+        _build_generator = None
+
+
 def build_site(progress_callback: Callable[[BuildProgress], None] | None = None) -> BuildResult:
     """
     Convenience function to build the site.
 
+    Larger sites are built with worker processes, which import the main
+    module of the program again. A script calling this function must do so
+    under an ``if __name__ == "__main__":`` guard, or every worker would
+    start a build of its own.
+
     Args:
         progress_callback: Optional callback function for progress updates
 
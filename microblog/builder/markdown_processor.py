@@ -5,16 +5,152 @@ This module provides markdown to HTML conversion with YAML frontmatter support,
 syntax highlighting, and content validation for the static site generator.
 """
 
+import hashlib
+import json
 import logging
+import os
 import re
+import threading
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import markdown
+import pygments
+import pymdownx
+import yaml
+from markdown.extensions import codehilite
+from pygments.lexers import get_lexer_by_name
+from pymdownx import highlight
 
 from microblog.content.validators import PostContent, validate_post_content
+from microblog.server.config import get_config
+from microblog.utils import (
+    ensure_directory,
+    load_frontmatter,
+    read_frontmatter_file,
+    split_frontmatter,
+)
 
 logger = logging.getLogger(__name__)
 
+# Default extensions. superfences and highlight take over fenced and
+# indented code blocks, so fenced_code and codehilite are not needed
+MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.tables',
+    'markdown.extensions.toc',
+    'pymdownx.superfences',
+    'pymdownx.highlight',
+    'pymdownx.tasklist',
+]
+
+# Inline syntax extras (==mark==, ~~tilde~~, ^^caret^^, bare links, smart
+# symbols, ...) each add passes over every text node; smartsymbols alone
+# took about a fifth of conversion time. Opt in with
+# MarkdownProcessor(extensions=FULL_MARKDOWN_EXTENSIONS)
+FULL_MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.tables',
+    'markdown.extensions.toc',
+    'markdown.extensions.codehilite',
+    'pymdownx.superfences',
+    'pymdownx.highlight',
+    'pymdownx.inlinehilite',
+    'pymdownx.magiclink',
+    'pymdownx.betterem',
+    'pymdownx.caret',
+    'pymdownx.mark',
+    'pymdownx.tilde',
+    'pymdownx.smartsymbols',
+    'pymdownx.tasklist',
+]
+
+MARKDOWN_EXTENSION_CONFIGS = {
+    # Guessing runs every Pygments lexer's analyser over each code
+    # block without a language and dominated conversion time
+    'pymdownx.highlight': {
+        'css_class': 'highlight',
+        'guess_lang': False,
+        'use_pygments': True,
+        'linenums': False,
+    },
+    'pymdownx.superfences': {
+        'css_class': 'highlight',
+    },
+    'pymdownx.tasklist': {
+        'custom_checkbox': True,
+    },
+    'markdown.extensions.codehilite': {
+        'css_class': 'highlight',
+        'use_pygments': True,
+        'guess_lang': False,
+        'linenums': False,
+    },
+    'markdown.extensions.toc': {
+        'permalink': True,
+        'baselevel': 2,
+        'permalink_title': 'Link to this heading',
+    },
+    'markdown.extensions.fenced_code': {
+        'lang_prefix': 'language-',
+    }
+}
+
+
+def _cache_fingerprint(extensions: list[str]) -> bytes:
+    """
+    Describe everything besides the text that converted HTML depends on.
+
+    The extension setup and library versions are part of every cache key,
+    so changing any of them invalidates the cache.
+
+    Args:
+        extensions: Enabled markdown extensions
+
+    Returns:
+        Fingerprint bytes to prefix cache keys with
+    """
+    return repr((
+        extensions,
+        MARKDOWN_EXTENSION_CONFIGS,
+        markdown.__version__,
+        pymdownx.__version__,
+        pygments.__version__,
+    )).encode('utf-8')
+
+
+@lru_cache(maxsize=256)
+def _cached_lexer(name: str, options: tuple) -> Any:
+    return get_lexer_by_name(name, **dict(options))
+
+
+def _get_lexer_by_name(name: str, **options: Any) -> Any:
+    """
+    Look up a Pygments lexer, reusing instances across code blocks.
+
+    Pygments resolves aliases by scanning its whole lexer table on every
+    call; lexers are stateless while tokenizing, so one instance per
+    name and option set is shared.
+
+    Args:
+        name: Lexer alias such as 'python'
+        **options: Lexer options
+
+    Returns:
+        Pygments lexer instance
+    """
+    try:
+        return _cached_lexer(name, tuple(sorted(options.items())))
+    except TypeError:
+        # Unhashable option values cannot be cached
+        return get_lexer_by_name(name, **options)
+
+
+# Both highlighters import the lookup by name, so it is replaced there
+highlight.get_lexer_by_name = _get_lexer_by_name
+codehilite.get_lexer_by_name = _get_lexer_by_name
+
 
 class MarkdownProcessingError(Exception):
     """Raised when markdown processing fails."""
@@ -31,13 +167,60 @@ class MarkdownProcessor:
     - Table of contents generation
     - Content validation integration
     - Error handling and logging
+
+    A markdown.Markdown instance keeps per-document state between reset()
+    and convert(), so each thread gets its own instance and TOC; a single
+    processor can be shared by request handlers and worker processes.
     """
 
-    def __init__(self):
-        """Initialize the markdown processor with extensions."""
+    def __init__(self, extensions: list[str] | None = None):
+        """
+        Initialize the markdown processor with extensions.
+
+        Args:
+            extensions: Markdown extensions to enable. Defaults to
+                MARKDOWN_EXTENSIONS; FULL_MARKDOWN_EXTENSIONS adds the
+                inline syntax extras
+        """
+        self.extensions = list(extensions if extensions is not None else MARKDOWN_EXTENSIONS)
+        self._cache_fingerprint = _cache_fingerprint(self.extensions)
+        self._local = threading.local()
         self.markdown_instance = self._create_markdown_instance()
+        self.cache_dir = self._create_cache_dir()
         logger.info("Markdown processor initialized")
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the per-thread state, which cannot be pickled, for worker processes."""
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a processor sent to a worker process."""
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    @property
+    def markdown_instance(self) -> markdown.Markdown:
+        """The calling thread's markdown instance, created on first use."""
+        instance = getattr(self._local, 'markdown_instance', None)
+        if instance is None:
+            instance = self._local.markdown_instance = self._create_markdown_instance()
+        return instance
+
+    @markdown_instance.setter
+    def markdown_instance(self, instance: markdown.Markdown) -> None:
+        self._local.markdown_instance = instance
+
+    @property
+    def _cached_toc(self) -> tuple[str, list] | None:
+        """Table of contents of the calling thread's last cached conversion."""
+        return getattr(self._local, 'cached_toc', None)
+
+    @_cached_toc.setter
+    def _cached_toc(self, toc: tuple[str, list] | None) -> None:
+        self._local.cached_toc = toc
+
     def _create_markdown_instance(self) -> markdown.Markdown:
         """
         Create a configured markdown instance with extensions.
@@ -45,57 +228,75 @@ class MarkdownProcessor:
         Returns:
             Configured markdown.Markdown instance
         """
-        extensions = [
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.tables',
-            'markdown.extensions.toc',
-            'markdown.extensions.codehilite',
-            'pymdownx.superfences',
-            'pymdownx.highlight',
-            'pymdownx.inlinehilite',
-            'pymdownx.magiclink',
-            'pymdownx.betterem',
-            'pymdownx.caret',
-            'pymdownx.mark',
-            'pymdownx.tilde',
-            'pymdownx.smartsymbols',
-            'pymdownx.tasklist',
-        ]
-
-        extension_configs = {
-            'pymdownx.highlight': {
-                'css_class': 'highlight',
-                'guess_lang': True,
-                'use_pygments': True,
-                'linenums': False,
-            },
-            'pymdownx.superfences': {
-                'css_class': 'highlight',
-            },
-            'pymdownx.tasklist': {
-                'custom_checkbox': True,
-            },
-            'markdown.extensions.codehilite': {
-                'css_class': 'highlight',
-                'use_pygments': True,
-                'guess_lang': True,
-                'linenums': False,
-            },
-            'markdown.extensions.toc': {
-                'permalink': True,
-                'baselevel': 2,
-                'permalink_title': 'Link to this heading',
-            },
-            'markdown.extensions.fenced_code': {
-                'lang_prefix': 'language-',
-            }
-        }
-
         return markdown.Markdown(
-            extensions=extensions,
-            extension_configs=extension_configs
+            extensions=self.extensions,
+            extension_configs=MARKDOWN_EXTENSION_CONFIGS
         )
 
+    def _create_cache_dir(self) -> Path | None:
+        """
+        Create the on-disk cache of converted posts.
+
+        Returns:
+            Cache directory, or None if it is unavailable
+        """
+        try:
+            cache_dir = Path(get_config().build.cache_dir) / 'markdown'
+            ensure_directory(cache_dir)
+            return cache_dir
+        except Exception as e:
+            logger.warning(f"Markdown cache disabled: {e}")
+            return None
+
+    def _convert_cached(self, markdown_text: str) -> str:
+        """
+        Convert markdown to HTML, reusing an earlier conversion of the same text.
+
+        Results are stored under a hash of the text and the extension setup,
+        so edited posts and configuration changes simply miss. The table of
+        contents is stored alongside for get_toc().
+
+        Args:
+            markdown_text: Raw markdown content
+
+        Returns:
+            Rendered HTML string
+        """
+        if self.cache_dir is None:
+            return self._convert(markdown_text)
+
+        key = hashlib.blake2b(self._cache_fingerprint + markdown_text.encode('utf-8'), digest_size=20).hexdigest()
+        cache_path = self.cache_dir / key[:2] / key[2:]
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                record = json.load(f)
+            html_content = record['html']
+            self._cached_toc = (record['toc'], record['toc_tokens'])
+            return html_content
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        html_content = self._convert(markdown_text)
+        record = {'html': html_content, 'toc': self.get_toc(), 'toc_tokens': self.get_toc_tokens()}
+
+        # Worker processes may convert the same text at once; each writes its
+        # own temporary file and the rename makes the result visible atomically
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            ensure_directory(cache_path.parent)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(record, f, separators=(',', ':'))
+            os.replace(temp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not cache converted markdown {cache_path}: {e}")
+        return html_content
+
+    def _convert(self, markdown_text: str) -> str:
+        """Run the markdown pipeline on a clean instance."""
+        self._cached_toc = None
+        self.markdown_instance.reset()
+        return self.markdown_instance.convert(markdown_text)
+
     def process_content(self, post: PostContent) -> str:
         """
         Process markdown content to HTML.
@@ -110,11 +311,8 @@ class MarkdownProcessor:
             MarkdownProcessingError: If processing fails
         """
         try:
-            # Reset the markdown instance for clean processing
-            self.markdown_instance.reset()
-
-            # Convert markdown to HTML
-            html_content = self.markdown_instance.convert(post.content)
+            # Convert markdown to HTML; unchanged posts come from the cache
+            html_content = self._convert_cached(post.content)
 
             logger.debug(f"Processed markdown content for post: {post.frontmatter.title}")
             return html_content
@@ -136,11 +334,8 @@ class MarkdownProcessor:
             MarkdownProcessingError: If processing fails
         """
         try:
-            # Reset the markdown instance for clean processing
-            self.markdown_instance.reset()
-
             # Convert markdown to HTML
-            html_content = self.markdown_instance.convert(markdown_text)
+            html_content = self._convert(markdown_text)
 
             logger.debug("Processed raw markdown text")
             return html_content
@@ -174,6 +369,34 @@ class MarkdownProcessor:
         except Exception as e:
             raise MarkdownProcessingError(f"Failed to process file content: {e}") from e
 
+    def process_file_path(self, file_path: Path) -> tuple[dict[str, Any], str]:
+        """
+        Process a markdown file with frontmatter from disk.
+
+        Unlike process_file_content(), the whole file is never held as one
+        string; large files are memory-mapped and only the frontmatter and
+        body are decoded.
+
+        Args:
+            file_path: Path to the markdown file
+
+        Returns:
+            Tuple of (frontmatter_dict, rendered_html)
+
+        Raises:
+            MarkdownProcessingError: If reading or processing fails
+        """
+        try:
+            parts = read_frontmatter_file(file_path)
+            frontmatter_data, markdown_content = self._parse_frontmatter_parts(parts)
+            html_content = self.process_markdown_text(markdown_content)
+
+            logger.debug(f"Processed markdown file: {file_path}")
+            return frontmatter_data, html_content
+
+        except Exception as e:
+            raise MarkdownProcessingError(f"Failed to process file {file_path}: {e}") from e
+
     def validate_and_process(self, frontmatter_data: dict[str, Any], content: str, file_path=None) -> tuple[PostContent, str]:
         """
         Validate post content and process markdown to HTML.
@@ -217,27 +440,35 @@ class MarkdownProcessor:
         Raises:
             MarkdownProcessingError: If parsing fails
         """
-        try:
-            import yaml
+        return self._parse_frontmatter_parts(split_frontmatter(file_content))
+
+    def _parse_frontmatter_parts(self, parts: tuple[str, str] | None) -> tuple[dict[str, Any], str]:
+        """
+        Parse split frontmatter and content.
+
+        Args:
+            parts: Tuple of (frontmatter_yaml, markdown_content) from
+                split_frontmatter(), or None if there was no frontmatter
 
-            # Match YAML frontmatter pattern
-            frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-            match = re.match(frontmatter_pattern, file_content, re.DOTALL)
+        Returns:
+            Tuple of (frontmatter_dict, markdown_content)
 
-            if not match:
+        Raises:
+            MarkdownProcessingError: If parsing fails
+        """
+        try:
+            if parts is None:
                 raise MarkdownProcessingError("Invalid markdown file format: missing YAML frontmatter")
 
-            frontmatter_yaml = match.group(1)
-            content = match.group(2)
+            frontmatter_yaml, content = parts
 
             # Parse YAML frontmatter
-            frontmatter_data = yaml.safe_load(frontmatter_yaml)
+            frontmatter_data = load_frontmatter(frontmatter_yaml)
             if frontmatter_data is None:
                 frontmatter_data = {}
 
             # Convert date string back to date object if needed
             if 'date' in frontmatter_data and isinstance(frontmatter_data['date'], str):
-                from datetime import datetime
                 frontmatter_data['date'] = datetime.fromisoformat(frontmatter_data['date']).date()
 
             return frontmatter_data, content
@@ -254,6 +485,8 @@ class MarkdownProcessor:
         Returns:
             HTML table of contents string
         """
+        if self._cached_toc is not None:
+            return self._cached_toc[0]
         if hasattr(self.markdown_instance, 'toc'):
             return self.markdown_instance.toc
         return ""
@@ -265,6 +498,8 @@ class MarkdownProcessor:
         Returns:
             List of TOC tokens
         """
+        if self._cached_toc is not None:
+            return self._cached_toc[1]
         if hasattr(self.markdown_instance, 'toc_tokens'):
             return self.markdown_instance.toc_tokens
         return []
@@ -324,16 +559,22 @@ class MarkdownProcessor:
 
 # Global markdown processor instance
 _markdown_processor: MarkdownProcessor | None = None
+_markdown_processor_lock = threading.Lock()
 
 
 def get_markdown_processor() -> MarkdownProcessor:
     """
     Get the global markdown processor instance.
 
+    The instance is safe to share between threads, each of which converts
+    with its own markdown pipeline.
+
     Returns:
         MarkdownProcessor instance
     """
     global _markdown_processor
     if _markdown_processor is None:
-        _markdown_processor = MarkdownProcessor()
+        with _markdown_processor_lock:
+            if _markdown_processor is None:
+                _markdown_processor = MarkdownProcessor()
     return _markdown_processor
@@ -5,20 +5,106 @@ This module provides template rendering functionality for the static site genera
 including template inheritance, context management, and RSS feed generation.
 """
 
+import hashlib
 import logging
-from datetime import datetime
+import re
+import threading
+from datetime import datetime, time, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
-
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-from microblog.content.post_service import PostContent, get_post_service
+from xml.sax.saxutils import escape as xml_escape
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+
+from microblog.content.post_service import (
+    PostContent,
+    get_post_service,
+    group_posts_by_year,
+)
 from microblog.server.config import get_config
-from microblog.utils import get_templates_dir
+from microblog.utils import ensure_directory, get_templates_dir
 from microblog.utils.cache import PerformanceTimer, get_template_cache
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Site page templates compiled up front by preload_templates(); the
+# dashboard and auth templates live in subdirectories
+PAGE_TEMPLATE_SUFFIXES = ('.html', '.xml')
+
+# Excerpts only need the start of a post; see _create_excerpt()
+EXCERPT_SCAN_FACTOR = 4
+
+# Distinct (content, length) excerpts remembered across template renders
+EXCERPT_CACHE_SIZE = 4096
+
+# RFC 2822 names are fixed English, whatever the process locale
+_RFC2822_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_RFC2822_MONTHS = (
+    'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec',
+)
+
+# saxutils.escape covers &, < and >; quotes matter inside attributes
+_XML_ATTRIBUTE_ENTITIES = {'"': '&quot;'}
+
+
+def _clean_excerpt_text(content: str) -> str:
+    """Strip HTML tags and collapse whitespace to single spaces."""
+    # Plain text skips the regex; str.split() collapses whitespace faster
+    # than any regex substitution
+    if '<' in content:
+        content = _HTML_TAG_RE.sub(' ', content)
+    return ' '.join(content.split())
+
+
+@lru_cache(maxsize=EXCERPT_CACHE_SIZE)
+def _create_excerpt(content: str, length: int) -> str:
+    """
+    Create a plain text excerpt, cut at a word boundary.
+
+    Args:
+        content: Source content, possibly HTML
+        length: Maximum excerpt length
+
+    Returns:
+        Truncated excerpt with ellipsis
+    """
+    clean_content = None
+    scan_length = length * EXCERPT_SCAN_FACTOR
+    if 0 < scan_length < len(content):
+        # Clean only the start of the content, cut before any tag left
+        # open at the cut. If that alone is longer than the excerpt, the
+        # rest of the content cannot change the result.
+        head = content[:scan_length]
+        open_tag = head.find('<', head.rfind('>') + 1)
+        if open_tag != -1:
+            head = head[:open_tag]
+        clean_content = _clean_excerpt_text(head)
+        if len(clean_content) <= length:
+            clean_content = None
+
+    if clean_content is None:
+        clean_content = _clean_excerpt_text(content)
+        if len(clean_content) <= length:
+            return clean_content
+
+    # Find the last word boundary before the limit
+    truncated = clean_content[:length]
+    last_space = truncated.rfind(' ')
+    if last_space > 0:
+        truncated = truncated[:last_space]
+
+    return truncated + '...'
+
 
 class TemplateRenderingError(Exception):
     """Raised when template rendering fails."""
@@ -45,12 +131,31 @@ class TemplateRenderer:
             templates_dir: Directory containing templates. Defaults to project templates/
         """
         self.templates_dir = templates_dir or get_templates_dir()
-        self.env = self._create_jinja_environment()
         self.config = get_config()
+        self.env = self._create_jinja_environment()
+        self._compiled_templates: dict[str, Template] = {}
         self.post_service = get_post_service()
         self.template_cache = get_template_cache()
+        # (post service generation, sorted tags), see get_all_tags()
+        self._tags_cache: tuple[int, list[str]] | None = None
+        self._set_base_context()
         logger.info(f"Template renderer initialized with directory: {self.templates_dir}")
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the Jinja environment and shared services for worker processes."""
+        state = self.__dict__.copy()
+        for name in ('env', '_compiled_templates', 'post_service', 'template_cache'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Rebuild a renderer sent to a worker process."""
+        self.__dict__.update(state)
+        self.env = self._create_jinja_environment()
+        self._compiled_templates = {}
+        self.post_service = get_post_service()
+        self.template_cache = get_template_cache()
+
     def _create_jinja_environment(self) -> Environment:
         """
         Create and configure the Jinja2 environment.
@@ -63,13 +168,15 @@ class TemplateRenderer:
             loader=loader,
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            bytecode_cache=self._create_bytecode_cache()
         )
 
         # Add custom filters
         env.filters['dateformat'] = self._format_date
         env.filters['rfc2822'] = self._format_rfc2822
         env.filters['excerpt'] = self._create_excerpt
+        env.filters['xmlescape'] = self._escape_xml
 
         # Add custom globals
         env.globals['now'] = datetime.now
@@ -77,6 +184,24 @@ class TemplateRenderer:
 
         return env
 
+    def _create_bytecode_cache(self) -> FileSystemBytecodeCache | None:
+        """
+        Create the on-disk cache of compiled templates.
+
+        Compiled templates are reused across builds and worker processes, so
+        later loads skip parsing and compiling the template source.
+
+        Returns:
+            Bytecode cache, or None if the cache directory is unavailable
+        """
+        try:
+            cache_dir = Path(self.config.build.cache_dir) / 'jinja'
+            ensure_directory(cache_dir)
+            return FileSystemBytecodeCache(str(cache_dir))
+        except Exception as e:
+            logger.warning(f"Template bytecode cache disabled: {e}")
+            return None
+
     def _format_date(self, date_obj, format_str: str = '%B %d, %Y') -> str:
         """
         Format a date object for display.
@@ -105,15 +230,47 @@ class TemplateRenderer:
         if hasattr(date_obj, 'strftime'):
             # Convert date to datetime if needed
             if not hasattr(date_obj, 'hour'):
-                from datetime import datetime, time
                 date_obj = datetime.combine(date_obj, time())
-            return date_obj.strftime('%a, %d %b %Y %H:%M:%S %z')
+
+            # Built directly rather than with strftime, whose %a and %b
+            # follow the locale; naive times are treated as UTC
+            offset = date_obj.utcoffset()
+            if offset is None:
+                zone = '+0000'
+            else:
+                minutes = offset // timedelta(minutes=1)
+                sign = '-' if minutes < 0 else '+'
+                zone = f"{sign}{abs(minutes) // 60:02d}{abs(minutes) % 60:02d}"
+
+            return (
+                f"{_RFC2822_WEEKDAYS[date_obj.weekday()]}, {date_obj.day:02d} "
+                f"{_RFC2822_MONTHS[date_obj.month - 1]} {date_obj.year:04d} "
+                f"{date_obj.hour:02d}:{date_obj.minute:02d}:{date_obj.second:02d} {zone}"
+            )
         return str(date_obj)
 
+    def _escape_xml(self, value) -> str:
+        """
+        Escape a value for XML text and attributes.
+
+        The RSS template turns autoescaping off and escapes only the fields
+        that can hold user text, leaving slugs and dates untouched.
+
+        Args:
+            value: Value to escape
+
+        Returns:
+            XML-escaped string
+        """
+        return xml_escape(str(value), _XML_ATTRIBUTE_ENTITIES)
+
     def _create_excerpt(self, content: str, length: int = 150) -> str:
         """
         Create an excerpt from content.
 
+        The homepage and every tag page excerpt the same posts, so results
+        are memoized across renders.
+
         Args:
             content: Source content
             length: Maximum excerpt length
@@ -121,26 +278,32 @@ class TemplateRenderer:
         Returns:
             Truncated excerpt with ellipsis
         """
-        import re
-        # Remove HTML tags for plain text excerpt
-        clean_content = re.sub(r'<[^>]+>', ' ', content)
-        # Normalize whitespace
-        clean_content = ' '.join(clean_content.split())
+        return _create_excerpt(content, length)
 
-        if len(clean_content) <= length:
-            return clean_content
+    def _get_base_context(self) -> dict[str, Any]:
+        """
+        Get the base template context with site configuration.
 
-        # Find the last word boundary before the limit
-        truncated = clean_content[:length]
-        last_space = truncated.rfind(' ')
-        if last_space > 0:
-            truncated = truncated[:last_space]
+        The context is built once per renderer and shared by every render,
+        so callers merge it into a new dict rather than modifying it. It is
+        rebuilt when the year changes, as the renderer lives as long as the
+        server process.
 
-        return truncated + '...'
+        Returns:
+            Dictionary with base template context
+        """
+        if self._base_context['current_year'] != datetime.now().year:
+            self._set_base_context()
+        return self._base_context
 
-    def _get_base_context(self) -> dict[str, Any]:
+    def _set_base_context(self) -> None:
+        """Build the base context and the post page context derived from it."""
+        self._base_context = self._create_base_context()
+        self._post_page_context = {**self._base_context, 'page_type': 'post'}
+
+    def _create_base_context(self) -> dict[str, Any]:
         """
-        Get the base template context with site configuration.
+        Build the base template context from the site configuration.
 
         Returns:
             Dictionary with base template context
@@ -158,13 +321,16 @@ class TemplateRenderer:
             'current_year': datetime.now().year,
         }
 
-    def render_template(self, template_name: str, context: dict[str, Any] | None = None) -> str:
+    def render_template(self, template_name: str, context: dict[str, Any] | None = None,
+                        cache_key: str | None = None) -> str:
         """
         Render a template with the given context.
 
         Args:
             template_name: Name of the template file
             context: Additional context variables
+            cache_key: Short key identifying the context for the rendered-output
+                cache; when omitted the whole context is hashed
 
         Returns:
             Rendered HTML string
@@ -175,7 +341,7 @@ class TemplateRenderer:
         try:
             with PerformanceTimer(f"template_render_{template_name}"):
                 # Check cache for rendered output first
-                cached_output = self.template_cache.get_rendered_output(template_name, context)
+                cached_output = self.template_cache.get_rendered_output(template_name, context, cache_key)
                 if cached_output is not None:
                     logger.debug(f"Template cache hit: {template_name}")
                     return cached_output
@@ -188,15 +354,13 @@ class TemplateRenderer:
                 )
 
                 # Merge base context with provided context
-                render_context = self._get_base_context()
-                if context:
-                    render_context.update(context)
+                render_context = {**self._get_base_context(), **(context or {})}
 
                 # Render template
                 result = template.render(render_context)
 
                 # Cache the rendered output
-                self.template_cache.put_rendered_output(template_name, context, result)
+                self.template_cache.put_rendered_output(template_name, context, result, cache_key)
 
                 logger.debug(f"Rendered and cached template: {template_name}")
                 return result
@@ -204,6 +368,65 @@ class TemplateRenderer:
         except Exception as e:
             raise TemplateRenderingError(f"Failed to render template '{template_name}': {e}") from e
 
+    def get_compiled(self, template_name: str) -> Template:
+        """
+        Get a compiled template by name, loading it only once per build.
+
+        reload_templates() forgets the loaded templates at the start of each
+        build, so the environment checks the template files again then.
+
+        Args:
+            template_name: Name of the template file
+
+        Returns:
+            Compiled Jinja2 template
+        """
+        template = self._compiled_templates.get(template_name)
+        if template is None:
+            template = self._compiled_templates[template_name] = self.env.get_template(template_name)
+        return template
+
+    def preload_templates(self) -> int:
+        """
+        Compile every page template ahead of rendering.
+
+        Called as each rendering worker process starts, so its tasks render
+        straight away; the bytecode cache is filled for the next build as
+        well, and later loads skip parsing the template sources.
+
+        Returns:
+            Number of templates loaded
+        """
+        loaded = 0
+        page_templates = self.env.list_templates(
+            filter_func=lambda name: '/' not in name and name.endswith(PAGE_TEMPLATE_SUFFIXES)
+        )
+        for template_name in page_templates:
+            try:
+                self.get_compiled(template_name)
+                loaded += 1
+            except Exception as e:
+                logger.warning(f"Failed to preload template '{template_name}': {e}")
+        logger.debug(f"Preloaded {loaded} templates")
+        return loaded
+
+    def _render_uncached(self, template_name: str, context: dict[str, Any]) -> str:
+        """
+        Render a template without going through the rendered-output cache.
+
+        Used for pages whose context holds the full post list, where building
+        the output cache key means formatting every post.
+
+        Args:
+            template_name: Name of the template file
+            context: Additional context variables
+
+        Returns:
+            Rendered HTML string
+        """
+        render_context = {**self._get_base_context(), **context}
+        return self.get_compiled(template_name).render(render_context)
+
     def render_homepage(self, posts: list[PostContent] | None = None, page: int = 1) -> str:
         """
         Render the homepage with recent posts.
@@ -228,7 +451,7 @@ class TemplateRenderer:
                 'page_type': 'homepage',
             }
 
-            return self.render_template('index.html', context)
+            return self._render_uncached('index.html', context)
 
         except Exception as e:
             raise TemplateRenderingError(f"Failed to render homepage: {e}") from e
@@ -237,6 +460,11 @@ class TemplateRenderer:
         """
         Render a single post page.
 
+        Builds call this once per post, so the shared part of the context
+        is prepared once per renderer and the compiled template is taken
+        straight from the compiled-template map; only the rendered-output
+        cache lookup remains per page.
+
         Args:
             post: Post content object
             html_content: Rendered markdown content
@@ -254,7 +482,21 @@ class TemplateRenderer:
                 'page_type': 'post',
             }
 
-            return self.render_template('post.html', context)
+            # The page only depends on the frontmatter and converted content;
+            # keying on those skips formatting the raw markdown into the key
+            key_source = f"{post.frontmatter!r}\0{html_content}".encode()
+            cache_key = hashlib.blake2b(key_source, digest_size=16).hexdigest()
+
+            cached_output = self.template_cache.get_rendered_output('post.html', context, cache_key)
+            if cached_output is not None:
+                return cached_output
+
+            self._get_base_context()
+            result = self.get_compiled('post.html').render(
+                {**self._post_page_context, 'post': post, 'content': html_content}
+            )
+            self.template_cache.put_rendered_output('post.html', context, result, cache_key)
+            return result
 
         except Exception as e:
             raise TemplateRenderingError(f"Failed to render post '{post.frontmatter.title}': {e}") from e
@@ -273,16 +515,13 @@ class TemplateRenderer:
             TemplateRenderingError: If rendering fails
         """
         try:
+            # Group posts by year for archive display; the post service keeps
+            # the grouping of all published posts between renders
             if posts is None:
-                posts = self.post_service.get_published_posts()
-
-            # Group posts by year for archive display
-            posts_by_year = {}
-            for post in posts:
-                year = post.frontmatter.date.year
-                if year not in posts_by_year:
-                    posts_by_year[year] = []
-                posts_by_year[year].append(post)
+                posts_by_year = self.post_service.get_posts_by_year()
+                posts = [post for year_posts in posts_by_year.values() for post in year_posts]
+            else:
+                posts_by_year = group_posts_by_year(posts)
 
             context = {
                 'posts': posts,
@@ -290,7 +529,7 @@ class TemplateRenderer:
                 'page_type': 'archive',
             }
 
-            return self.render_template('archive.html', context)
+            return self._render_uncached('archive.html', context)
 
         except Exception as e:
             raise TemplateRenderingError(f"Failed to render archive: {e}") from e
@@ -319,7 +558,7 @@ class TemplateRenderer:
                 'page_type': 'tag',
             }
 
-            return self.render_template('tag.html', context)
+            return self._render_uncached('tag.html', context)
 
         except Exception as e:
             raise TemplateRenderingError(f"Failed to render tag page '{tag}': {e}") from e
@@ -341,33 +580,14 @@ class TemplateRenderer:
             if posts is None:
                 posts = self.post_service.get_published_posts(limit=20)
 
-            # Ensure posts have proper datetime for RSS
-            from datetime import datetime, time
-            processed_posts = []
-            for post in posts:
-                # Create a copy and ensure datetime
-                post_data = {
-                    'frontmatter': post.frontmatter,
-                    'content': post.content,
-                    'computed_slug': post.computed_slug,
-                    'is_draft': post.is_draft,
-                }
-
-                # Convert date to datetime if needed
-                if hasattr(post.frontmatter.date, 'hour'):
-                    post_data['pub_date'] = post.frontmatter.date
-                else:
-                    post_data['pub_date'] = datetime.combine(post.frontmatter.date, time())
-
-                processed_posts.append(post_data)
-
+            # Posts provide their datetime for RSS through PostContent.pub_date
             context = {
-                'posts': processed_posts,
+                'posts': posts,
                 'build_date': datetime.now(),
                 'page_type': 'rss',
             }
 
-            return self.render_template('rss.xml', context)
+            return self._render_uncached('rss.xml', context)
 
         except Exception as e:
             raise TemplateRenderingError(f"Failed to render RSS feed: {e}") from e
@@ -380,13 +600,17 @@ class TemplateRenderer:
             Sorted list of unique tags
         """
         try:
-            posts = self.post_service.get_published_posts()
-            all_tags = set()
+            # Reuse the list until the post files change
+            generation = self.post_service.generation()
+            cached = self._tags_cache
+            if cached is not None and cached[0] == generation:
+                return list(cached[1])
 
-            for post in posts:
-                all_tags.update(tag.lower() for tag in post.frontmatter.tags)
+            posts = self.post_service.get_published_posts()
+            all_tags = sorted({tag.lower() for post in posts for tag in post.frontmatter.tags})
 
-            return sorted(all_tags)
+            self._tags_cache = (generation, all_tags)
+            return list(all_tags)
 
         except Exception as e:
             logger.error(f"Failed to get all tags: {e}")
@@ -408,9 +632,14 @@ class TemplateRenderer:
         except Exception as e:
             return False, str(e)
 
+    def reload_templates(self) -> None:
+        """Forget the loaded templates, so edited template files are picked up."""
+        self._compiled_templates.clear()
+
     def clear_template_cache(self):
         """Clear all template caches."""
         self.template_cache.clear_all()
+        self._compiled_templates.clear()
         logger.info("Template cache cleared")
 
     def get_cache_stats(self) -> dict[str, Any]:
@@ -420,11 +649,13 @@ class TemplateRenderer:
     def invalidate_template_cache(self, template_name: str):
         """Invalidate cache for a specific template."""
         self.template_cache.invalidate_template(template_name)
+        self._compiled_templates.pop(template_name, None)
         logger.debug(f"Invalidated cache for template: {template_name}")
 
 
 # Global template renderer instance
 _template_renderer: TemplateRenderer | None = None
+_template_renderer_lock = threading.Lock()
 
 
 def get_template_renderer() -> TemplateRenderer:
@@ -436,5 +667,7 @@ def get_template_renderer() -> TemplateRenderer:
     """
     global _template_renderer
     if _template_renderer is None:
-        _template_renderer = TemplateRenderer()
+        with _template_renderer_lock:
+            if _template_renderer is None:
+                _template_renderer = TemplateRenderer()
     return _template_renderer
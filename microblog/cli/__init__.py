@@ -0,0 +1,118 @@
+"""
+Click-based CLI interface for microblog.
+
+This package provides command-line tools for building, serving, and managing
+the microblog application. Each command lives in its own module, which is
+only imported when that command runs or help lists it; the commands in turn
+import the builder, server and database themselves, so `microblog --version`
+loads little beyond Click.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import click
+
+# Command modules, each defining a command named after the module
+_SUBMODULES = ('build', 'serve', 'create_user', 'init', 'status')
+
+# Command name -> module defining it
+LAZY_COMMANDS = {name.replace('_', '-'): f'{__name__}.{name}' for name in _SUBMODULES}
+
+__all__ = ['LAZY_COMMANDS', 'LazyGroup', 'echo_error', 'load_config_option', 'main', *_SUBMODULES]
+
+
+def __getattr__(name: str):
+    """Import command modules on first attribute access (PEP 562)."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List the command modules alongside the loaded attributes."""
+    return sorted({*globals(), *_SUBMODULES})
+
+
+def echo_error(message: str, verbose: bool = False) -> None:
+    """
+    Print an error message, followed by the traceback in verbose mode.
+
+    Must be called from an exception handler. traceback is only imported
+    when the traceback is actually printed.
+
+    Args:
+        message: Error message
+        verbose: Whether to print the current traceback
+    """
+    click.echo(click.style(message, fg="red"))
+    if verbose:
+        import traceback
+        click.echo(traceback.format_exc())
+
+
+def load_config_option(config_manager, config: str, verbose: bool = False) -> None:
+    """
+    Load the configuration file given with --config, exiting on failure.
+
+    Args:
+        config_manager: Configuration manager to point at the file
+        config: Path of the configuration file
+        verbose: Whether to confirm the load
+    """
+    config_manager.config_path = Path(config)
+    try:
+        config_manager.load_config()
+    except Exception as e:
+        echo_error(f"ERROR: Failed to load configuration from {config}: {e}")
+        sys.exit(1)
+
+    if verbose:
+        click.echo(f"Loaded configuration from {config}")
+
+
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand's module on first use."""
+
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs):
+        """
+        Initialize the group.
+
+        Args:
+            lazy_commands: Command name to module path mapping
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eagerly added and lazy command names without importing them."""
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a command, importing its module if it is not loaded yet."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            module_path = self.lazy_commands[cmd_name]
+            module = importlib.import_module(module_path)
+            command = getattr(module, module_path.rpartition('.')[2])
+            self.add_command(command, cmd_name)
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
+@click.version_option(version="0.1.0", prog_name="microblog")
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+@click.pass_context
+def main(ctx: click.Context, verbose: bool) -> None:
+    """
+    Microblog - A lightweight, self-hosted blogging platform.
+
+    Generate static HTML sites from markdown content with a dynamic
+    dashboard for content management.
+    """
+    ctx.ensure_object(dict)
+    ctx.obj["verbose"] = verbose
+
+    if verbose:
+        click.echo("Verbose mode enabled")
@@ -0,0 +1,6 @@
+"""Run the microblog CLI with `python -m microblog.cli`."""
+
+from microblog.cli import main
+
+if __name__ == "__main__":
+    main()
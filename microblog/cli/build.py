@@ -0,0 +1,196 @@
+"""
+`microblog build` command.
+
+Generates the static site from markdown content, optionally rebuilding
+whenever the content directory changes.
+"""
+
+import sys
+
+import click
+
+from microblog.cli import echo_error, load_config_option
+from microblog.utils import get_content_dir
+
+# watchfiles yields a batch once changes stop for WATCH_STEP_MS, or after
+# WATCH_DEBOUNCE_MS at most, so a burst of editor saves or a checkout that
+# rewrites many files is one rebuild
+WATCH_DEBOUNCE_MS = 200
+WATCH_STEP_MS = 50
+
+# Styled prefixes for the per-build status lines, which recur on every
+# rebuild in watch mode; each line ends with _STYLE_RESET. When stdout is
+# not a terminal click.echo would strip the ANSI codes again on every line,
+# so piped and CI output gets the plain prefixes from the start.
+_USE_COLOR = sys.stdout.isatty()
+
+
+def _style(message: str, **styles) -> str:
+    """Apply click styling only when stdout is a terminal."""
+    return click.style(message, **styles) if _USE_COLOR else message
+
+
+_OK = _style("✓ ", fg="green", reset=False)
+_FAIL = _style("✗ ", fg="red", reset=False)
+_STYLE_RESET = _style("", reset=True)
+
+
+@click.command()
+@click.option(
+    "--output", "-o", default="build", help="Output directory for generated site"
+)
+@click.option(
+    "--force", "-f", is_flag=True, help="Force rebuild even if no changes detected"
+)
+@click.option(
+    "--watch", "-w", is_flag=True, help="Watch for changes and rebuild automatically"
+)
+@click.option(
+    "--config", "-c", type=click.Path(exists=True), help="Override configuration file path"
+)
+@click.pass_context
+def build(ctx: click.Context, output: str, force: bool, watch: bool, config: str) -> None:
+    """
+    Build the static site from markdown content.
+
+    Processes all markdown files in the content directory and generates
+    a complete static HTML site with template rendering and asset copying.
+    """
+    from microblog.builder.generator import BuildPhase, BuildProgress, build_site
+    from microblog.server.config import get_config_manager
+
+    verbose = ctx.obj.get("verbose", False)
+
+    if verbose:
+        click.echo(f"Building site to {output} directory...")
+        click.echo(f"Force rebuild: {force}")
+        click.echo(f"Watch mode: {watch}")
+        if config:
+            click.echo(f"Using configuration: {config}")
+
+    # Initialize configuration manager with custom config if provided
+    config_manager = get_config_manager()
+    if config:
+        load_config_option(config_manager, config, verbose)
+
+    # Override output directory if provided
+    if output != "build":
+        try:
+            app_config = config_manager.config
+            app_config.build.output_dir = output
+            if verbose:
+                click.echo(f"Output directory overridden to: {output}")
+        except Exception as e:
+            click.echo(click.style(f"ERROR: Failed to override output directory: {e}", fg="red"))
+            sys.exit(1)
+
+    def progress_callback(progress: BuildProgress) -> None:
+        """Progress callback for verbose output and build status reporting."""
+        # Non-verbose mode only reports the outcome; skip all formatting
+        if not verbose:
+            if progress.phase is BuildPhase.COMPLETED:
+                click.echo(f"{_OK}{progress.message}{_STYLE_RESET}")
+            elif progress.phase is BuildPhase.FAILED:
+                click.echo(f"{_FAIL}{progress.message}{_STYLE_RESET}")
+            return
+
+        timestamp = progress.timestamp.strftime("%H:%M:%S") if progress.timestamp else ""
+        details = progress.details
+        detail_info = (
+            f" ({details.get('processed', 0)}/{details.get('total', 0)})"
+            if details and 'processed' in details else ""
+        )
+        click.echo(f"[{timestamp}] {progress.phase.value}: {progress.message}{detail_info} ({progress.percentage:.1f}%)")
+
+    def perform_build() -> bool:
+        """Perform a single build operation."""
+        try:
+            if verbose:
+                click.echo("Starting build process...")
+
+            result = build_site(progress_callback)
+
+            if result.success:
+                if not verbose:  # Only show summary if not verbose (verbose already showed detailed progress)
+                    click.echo(f"{_OK}Build completed successfully in {result.duration:.1f}s{_STYLE_RESET}")
+
+                if verbose and result.stats:
+                    click.echo("\nBuild Statistics:")
+                    if 'content' in result.stats:
+                        content_stats = result.stats['content']
+                        click.echo(f"  Posts processed: {content_stats.get('processed_posts', 0)}")
+                    if 'rendering' in result.stats:
+                        rendering_stats = result.stats['rendering']
+                        click.echo(f"  Pages rendered: {rendering_stats.get('pages_rendered', 0)}")
+                    if 'assets' in result.stats:
+                        asset_stats = result.stats['assets']
+                        click.echo(f"  Assets copied: {asset_stats.get('total_successful', 0)}")
+
+                return True
+            else:
+                if result.error:
+                    click.echo(f"{_FAIL}Build failed: {result.error}{_STYLE_RESET}")
+                else:
+                    click.echo(f"{_FAIL}{result.message}{_STYLE_RESET}")
+                return False
+
+        except Exception as e:
+            echo_error(f"✗ Build failed with exception: {e}", verbose)
+            return False
+
+    # Perform initial build
+    if not perform_build():
+        sys.exit(1)
+
+    # Watch mode implementation
+    if watch:
+        if verbose:
+            click.echo("\n" + "="*50)
+            click.echo("Watch mode enabled - watching for changes...")
+            click.echo("Press Ctrl+C to stop watching")
+            click.echo("="*50)
+        else:
+            click.echo("Watch mode enabled. Press Ctrl+C to stop.")
+
+        content_dir = get_content_dir()
+        if not content_dir.exists():
+            click.echo(click.style(f"ERROR: Content directory does not exist: {content_dir}", fg="red"))
+            sys.exit(1)
+
+        from watchfiles import watch as watch_files
+
+        try:
+            # Changes made while a rebuild runs arrive together as the next batch
+            for changes in watch_files(
+                content_dir,
+                debounce=WATCH_DEBOUNCE_MS,
+                step=WATCH_STEP_MS,
+                yield_on_timeout=False,
+            ):
+                if verbose:
+                    click.echo(f"\nDetected changes: {len(changes)} file(s)")
+                    for change_type, file_path in changes:
+                        click.echo(f"  {change_type}: {file_path}")
+                else:
+                    click.echo("\nDetected changes, rebuilding...")
+
+                # Rebuild after changes
+                if verbose:
+                    click.echo("\nRebuilding due to changes...")
+
+                success = perform_build()
+
+                if verbose:
+                    if success:
+                        click.echo("Rebuild completed. Watching for more changes...")
+                    else:
+                        click.echo("Rebuild failed. Watching for more changes...")
+
+        except KeyboardInterrupt:
+            if verbose:
+                click.echo("\nWatch mode stopped by user")
+            else:
+                click.echo("\nStopped watching")
+        except Exception as e:
+            click.echo(click.style(f"ERROR: Watch mode failed: {e}", fg="red"))
+            sys.exit(1)
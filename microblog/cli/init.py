@@ -0,0 +1,32 @@
+"""
+`microblog init` command.
+
+Scaffolds the directory structure for a new blog.
+"""
+
+import click
+
+
+@click.command()
+@click.pass_context
+def init(ctx: click.Context) -> None:
+    """
+    Initialize a new microblog project.
+
+    Creates the necessary directory structure and configuration
+    files for a new blog.
+    """
+    verbose = ctx.obj.get("verbose", False)
+
+    if verbose:
+        click.echo("Initializing new microblog project...")
+
+    # TODO: Implement actual initialization logic in future iterations
+    click.echo(
+        "Project initialization will be implemented in the next iteration\n"
+        "Would create:\n"
+        "  - content/posts/\n"
+        "  - content/pages/\n"
+        "  - content/images/\n"
+        "  - content/_data/config.yaml"
+    )
@@ -0,0 +1,122 @@
+"""
+`microblog serve` command.
+
+Runs the microblog application, dashboard included, under uvicorn.
+"""
+
+import signal
+import sys
+
+import click
+
+from microblog.cli import echo_error, load_config_option
+
+
+@click.command()
+@click.option("--host", "-h", default=None, help="Host to bind the server")
+@click.option("--port", "-p", default=None, type=int, help="Port to bind the server")
+@click.option("--reload", is_flag=True, help="Enable auto-reload for development")
+@click.option(
+    "--dashboard-only", is_flag=True, help="Serve only the dashboard (no static site)"
+)
+@click.option(
+    "--config", "-c", type=click.Path(exists=True), help="Override configuration file path"
+)
+@click.pass_context
+def serve(
+    ctx: click.Context, host: str, port: int, reload: bool, dashboard_only: bool, config: str
+) -> None:
+    """
+    Start the development or production server.
+
+    Serves the microblog application with dashboard access. In development mode,
+    provides hot-reload capabilities for configuration and code changes.
+    """
+    import uvicorn
+
+    from microblog.server.app import get_app, get_dev_app
+    from microblog.server.config import get_config_manager
+
+    verbose = ctx.obj.get("verbose", False)
+
+    try:
+        # Initialize configuration manager
+        config_manager = get_config_manager(dev_mode=reload)
+
+        # Load custom config if provided
+        if config:
+            load_config_option(config_manager, config, verbose)
+
+        app_config = config_manager.config
+
+        # Determine host and port (CLI options override config)
+        server_host = host or app_config.server.host
+        server_port = port or app_config.server.port
+
+        # Choose app based on development mode
+        if reload:
+            app_factory = get_dev_app
+            mode_name = "development"
+        else:
+            app_factory = get_app
+            mode_name = "production"
+
+        if verbose:
+            click.echo(f"Starting {mode_name} server on {server_host}:{server_port}")
+            click.echo(f"Auto-reload: {reload}")
+            click.echo(f"Dashboard only: {dashboard_only}")
+            if config:
+                click.echo(f"Using configuration: {config}")
+
+        # Show startup message
+        click.echo(click.style(f"Starting microblog server in {mode_name} mode", fg="green"))
+        click.echo(f"Server will be available at: http://{server_host}:{server_port}")
+
+        if reload:
+            click.echo("Development mode: Hot-reload enabled")
+        else:
+            click.echo("Production mode: Optimized for performance")
+
+        click.echo("Press Ctrl+C to stop the server")
+
+        # Set up graceful shutdown handling
+        shutdown_event = None
+
+        def signal_handler(signum, frame):
+            """Handle shutdown signals gracefully."""
+            nonlocal shutdown_event
+            if verbose:
+                click.echo(f"\nReceived signal {signum}, shutting down gracefully...")
+            else:
+                click.echo("\nShutting down server...")
+
+            if shutdown_event and hasattr(shutdown_event, 'set'):
+                shutdown_event.set()
+
+        # Register signal handlers for graceful shutdown
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+
+        # Configure uvicorn log level based on verbose mode
+        log_level = "debug" if verbose else "info"
+
+        # Start the server
+        uvicorn.run(
+            app_factory,
+            host=server_host,
+            port=server_port,
+            reload=reload,
+            log_level=log_level,
+            access_log=verbose,
+            reload_dirs=["microblog/"] if reload else None,
+            reload_includes=["*.py", "*.yaml", "*.yml"] if reload else None,
+        )
+
+    except KeyboardInterrupt:
+        if verbose:
+            click.echo("\nServer stopped by user")
+        else:
+            click.echo("\nServer stopped")
+    except Exception as e:
+        echo_error(f"ERROR: Failed to start server: {e}", verbose)
+        sys.exit(1)
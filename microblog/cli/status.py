@@ -0,0 +1,63 @@
+"""
+`microblog status` command.
+
+Reports on the content and build directories.
+"""
+
+import os
+import sys
+
+import click
+
+from microblog.utils import get_build_dir, get_content_dir, get_project_root
+
+
+@click.command()
+@click.pass_context
+def status(ctx: click.Context) -> None:
+    """
+    Show the current status of the microblog project.
+
+    Displays information about content, build status, and configuration.
+    """
+    verbose = ctx.obj.get("verbose", False)
+
+    project_root = get_project_root()
+    content_dir = get_content_dir()
+    build_dir = get_build_dir()
+
+    # Collected and written in one go rather than a write per line
+    lines = [
+        "Microblog Status",
+        "=" * 40,
+        f"Project root: {project_root}",
+        f"Content directory: {content_dir}",
+        f"Build directory: {build_dir}",
+    ]
+
+    # Scanning the posts directory shows both directories exist; only
+    # check which one is missing when it fails
+    try:
+        # Directory entries know their type, so no per-file stat() is needed
+        with os.scandir(content_dir / "posts") as entries:
+            post_count = sum(
+                1 for entry in entries
+                if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)
+            )
+        lines.append(f"Posts found: {post_count}")
+    except OSError:
+        if content_dir.exists():
+            lines.append("Posts directory: Not found")
+        else:
+            lines.append("Content directory: Not found")
+
+    if build_dir.exists():
+        lines.append("Build directory: Exists")
+    else:
+        lines.append("Build directory: Not found")
+
+    if verbose:
+        lines.append(f"Python executable: {sys.executable}")
+        lines.append(f"Working directory: {os.getcwd()}")
+
+    click.echo("\n".join(lines))
@@ -5,17 +5,69 @@ This module provides secure image upload capabilities including validation,
 filename sanitization, storage management, and markdown snippet generation.
 """
 
+import asyncio
 import logging
-import re
+import os
 import secrets
 from pathlib import Path
 from typing import Any, BinaryIO
 
-from microblog.builder.asset_manager import get_asset_manager
+from microblog.builder.asset_manager import MAX_ASSET_SIZE, get_asset_manager
 from microblog.utils import ensure_directory, get_content_dir
 
 logger = logging.getLogger(__name__)
 
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico', '.bmp'})
+
+# Leading bytes of each binary image format; WebP and SVG are checked
+# separately in _has_image_signature()
+_IMAGE_SIGNATURES = {
+    '.png': (b'\x89PNG\r\n\x1a\n',),
+    '.jpg': (b'\xff\xd8\xff',),
+    '.jpeg': (b'\xff\xd8\xff',),
+    '.gif': (b'GIF87a', b'GIF89a'),
+    '.ico': (b'\x00\x00\x01\x00',),
+    '.bmp': (b'BM',),
+}
+
+# Linux only: lets uploads be written to an unnamed inode and linked into
+# place once complete, see ImageService._write_new_image()
+_O_TMPFILE = getattr(os, 'O_TMPFILE', 0)
+
+# SVG files may open with an XML declaration, comments or a doctype, so the
+# root element is looked for within this many leading bytes
+_SVG_SNIFF_BYTES = 4096
+
+
+def _has_image_signature(data: bytes, extension: str) -> bool:
+    """
+    Check that file content starts the way its image format requires.
+
+    Args:
+        data: File content
+        extension: Lowercase file extension, including the dot
+
+    Returns:
+        True if the content matches the format, False otherwise
+    """
+    if extension == '.webp':
+        return data[:4] == b'RIFF' and data[8:12] == b'WEBP'
+    if extension == '.svg':
+        return b'<svg' in data[:_SVG_SNIFF_BYTES]
+    return data.startswith(_IMAGE_SIGNATURES.get(extension, ()))
+
+
+def _is_plain_filename(filename: str) -> bool:
+    """Check that a filename names an entry directly inside a directory."""
+    return (
+        bool(filename)
+        and filename not in ('.', '..')
+        and '/' not in filename
+        and '\0' not in filename
+        and (os.sep == '/' or os.sep not in filename)
+        and (os.altsep is None or os.altsep not in filename)
+    )
+
 
 class ImageUploadError(Exception):
     """Raised when image upload operations fail."""
@@ -47,6 +99,12 @@ class ImageService:
 
         # Ensure images directory exists
         ensure_directory(self.images_dir)
+        self._images_dir_resolved = os.path.realpath(self.images_dir)
+
+        # Names known to be taken in images_dir, so collisions are usually
+        # found without a stat() per candidate name
+        with os.scandir(self.images_dir) as entries:
+            self._existing_names: set[str] = {entry.name for entry in entries}
 
         logger.info("Image service initialized")
 
@@ -68,12 +126,18 @@ class ImageService:
         base_name = path.stem
         extension = path.suffix.lower()
 
-        # Remove or replace dangerous characters
-        # Keep only alphanumeric, hyphens, underscores, and dots
-        sanitized_base = re.sub(r'[^\w\-_.]', '_', base_name)
-
-        # Remove consecutive underscores only (preserve dots for file extensions)
-        sanitized_base = re.sub(r'_+', '_', sanitized_base)
+        # Keep only alphanumeric characters, hyphens and dots; every run of
+        # other characters and underscores becomes a single underscore
+        kept = []
+        in_run = False
+        for char in base_name:
+            if char.isalnum() or char in '-.':
+                kept.append(char)
+                in_run = False
+            elif not in_run:
+                kept.append('_')
+                in_run = True
+        sanitized_base = ''.join(kept)
 
         # Remove leading/trailing underscores and dots
         sanitized_base = sanitized_base.strip('_.')
@@ -103,30 +167,27 @@ class ImageService:
         base_name = path.stem
         extension = path.suffix
 
-        # Check if file already exists
-        target_path = self.images_dir / sanitized
-        if not target_path.exists():
-            return sanitized
-
-        # Generate unique name with random suffix
-        counter = 1
+        # Try the name itself, then numbered names, then random suffixes
+        counter = 0
         while True:
-            # Try with counter first
-            new_name = f"{base_name}_{counter}{extension}"
-            target_path = self.images_dir / new_name
-            if not target_path.exists():
-                return new_name
-
+            if counter == 0:
+                new_name = sanitized
+            elif counter <= 10:
+                new_name = f"{base_name}_{counter}{extension}"
+            else:
+                new_name = f"{base_name}_{secrets.token_hex(4)}{extension}"
             counter += 1
 
-            # After 100 attempts, use random suffix
-            if counter > 100:
-                random_suffix = secrets.token_hex(4)
-                new_name = f"{base_name}_{random_suffix}{extension}"
-                target_path = self.images_dir / new_name
-                if not target_path.exists():
-                    return new_name
-                counter = 1  # Reset counter for another round
+            if new_name in self._existing_names:
+                continue
+
+            # Files can also be added outside this service, so confirm the
+            # name that looks free before handing it out
+            if (self.images_dir / new_name).exists():
+                self._existing_names.add(new_name)
+                continue
+
+            return new_name
 
     def validate_image_file(self, file_path: Path) -> bool:
         """
@@ -148,9 +209,8 @@ class ImageService:
 
             # Additional check to ensure it's an image
             extension = file_path.suffix.lower()
-            image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico', '.bmp'}
 
-            if extension not in image_extensions:
+            if extension not in IMAGE_EXTENSIONS:
                 raise ImageValidationError(f"File extension '{extension}' is not allowed for images")
 
             return True
@@ -161,6 +221,73 @@ class ImageService:
             logger.error(f"Error validating image file {file_path}: {e}")
             raise ImageValidationError(f"Validation failed: {str(e)}") from e
 
+    def _validate_image_bytes(self, data: bytes, filename: str) -> None:
+        """
+        Validate uploaded image content before anything is written.
+
+        Args:
+            data: Binary content of the file
+            filename: Name the file will be stored under
+
+        Raises:
+            ImageValidationError: If the content is not an acceptable image
+        """
+        extension = Path(filename).suffix.lower()
+
+        if extension not in IMAGE_EXTENSIONS:
+            raise ImageValidationError(f"File extension '{extension}' is not allowed for images")
+
+        if len(data) > MAX_ASSET_SIZE:
+            raise ImageValidationError(f"File is too large ({len(data)} bytes)")
+
+        if not _has_image_signature(data, extension):
+            raise ImageValidationError(f"File content is not a valid '{extension}' image")
+
+    def _write_new_image(self, target_path: Path, data: bytes) -> None:
+        """
+        Create an image file that only becomes visible once fully written.
+
+        On Linux the data goes to an unnamed O_TMPFILE inode that is then
+        linked into place, so image listings never see a partial file and
+        nothing is left behind on a crash. Elsewhere, or on filesystems
+        without O_TMPFILE support, the file is created directly and removed
+        again if the write fails. An existing file is never replaced.
+
+        Args:
+            target_path: Path of the new image
+            data: Content to write
+
+        Raises:
+            FileExistsError: If target_path already exists
+        """
+        if _O_TMPFILE:
+            try:
+                fd = os.open(self.images_dir, _O_TMPFILE | os.O_WRONLY, 0o644)
+            except OSError as e:
+                logger.debug(f"O_TMPFILE not available in {self.images_dir}: {e}")
+            else:
+                with open(fd, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    try:
+                        os.link(f"/proc/self/fd/{fd}", target_path)
+                        return
+                    except FileExistsError:
+                        raise
+                    except OSError as e:
+                        # e.g. /proc is not mounted
+                        logger.debug(f"Could not link temporary image into place: {e}")
+
+        try:
+            with open(target_path, 'xb') as f:
+                f.write(data)
+        except FileExistsError:
+            raise
+        except Exception:
+            # Do not leave a partially written image behind
+            target_path.unlink(missing_ok=True)
+            raise
+
     def save_uploaded_file(self, file_content: bytes, filename: str) -> dict[str, Any]:
         """
         Save uploaded file content to the images directory.
@@ -177,42 +304,34 @@ class ImageService:
             ImageValidationError: If file validation fails
         """
         try:
-            # Generate unique filename
-            unique_filename = self.generate_unique_filename(filename)
-            target_path = self.images_dir / unique_filename
-
-            # Write file temporarily for validation
-            temp_path = target_path.with_suffix(target_path.suffix + '.tmp')
-            try:
-                with open(temp_path, 'wb') as f:
-                    f.write(file_content)
-
-                # Validate the temporary file
-                self.validate_image_file(temp_path)
-
-                # Move to final location
-                temp_path.rename(target_path)
-
-                logger.info(f"Image saved successfully: {target_path}")
-
-                # Generate relative URL for markdown
-                relative_url = f"/images/{unique_filename}"
-                markdown_snippet = f"![{Path(filename).stem}]({relative_url})"
+            # Validate in memory, then create the file in a single write
+            self._validate_image_bytes(file_content, self.sanitize_filename(filename))
+
+            while True:
+                unique_filename = self.generate_unique_filename(filename)
+                target_path = self.images_dir / unique_filename
+                try:
+                    self._write_new_image(target_path, file_content)
+                    break
+                except FileExistsError:
+                    # A concurrent upload took the name first; pick another
+                    self._existing_names.add(unique_filename)
+            self._existing_names.add(unique_filename)
+
+            logger.info(f"Image saved successfully: {target_path}")
+
+            # Generate relative URL for markdown
+            relative_url = f"/images/{unique_filename}"
+            markdown_snippet = f"![{Path(filename).stem}]({relative_url})"
 
-                return {
-                    'filename': unique_filename,
-                    'path': str(target_path),
-                    'relative_path': str(target_path.relative_to(self.content_dir)),
-                    'url': relative_url,
-                    'markdown': markdown_snippet,
-                    'size': len(file_content)
-                }
-
-            except Exception:
-                # Clean up temp file if it exists
-                if temp_path.exists():
-                    temp_path.unlink()
-                raise
+            return {
+                'filename': unique_filename,
+                'path': str(target_path),
+                'relative_path': str(target_path.relative_to(self.content_dir)),
+                'url': relative_url,
+                'markdown': markdown_snippet,
+                'size': len(file_content)
+            }
 
         except ImageValidationError:
             raise
@@ -224,22 +343,31 @@ class ImageService:
         """
         Save uploaded file from a file object (async version).
 
+        Reading the upload and saving it block on file I/O, so both run on
+        worker threads and the event loop keeps serving other requests.
+
         Args:
             file_object: File object to read from
             filename: Original filename
 
         Returns:
             Dictionary with save results including path and markdown snippet
+
+        Raises:
+            ImageUploadError: If save operation fails
+            ImageValidationError: If file validation fails
         """
         try:
             # Read file content
-            file_content = file_object.read()
+            file_content = await asyncio.to_thread(file_object.read)
 
             # Reset file pointer in case it's needed elsewhere
             file_object.seek(0)
 
-            return self.save_uploaded_file(file_content, filename)
+            return await asyncio.to_thread(self.save_uploaded_file, file_content, filename)
 
+        except ImageValidationError:
+            raise
         except Exception as e:
             logger.error(f"Error saving uploaded file object '{filename}': {e}")
             raise ImageUploadError(f"Failed to save file: {str(e)}") from e
@@ -255,18 +383,24 @@ class ImageService:
             True if deletion successful, False otherwise
         """
         try:
+            # Only plain names within the images directory can be deleted
+            if not _is_plain_filename(filename):
+                logger.error(f"Attempted to delete file outside images directory: {filename}")
+                return False
+
             image_path = self.images_dir / filename
 
             if not image_path.exists():
                 logger.warning(f"Attempted to delete non-existent image: {filename}")
                 return False
 
-            # Basic security check - ensure file is within images directory
-            if not str(image_path.resolve()).startswith(str(self.images_dir.resolve())):
+            # A symlink must not lead outside the images directory either
+            if not os.path.realpath(image_path).startswith(self._images_dir_resolved + os.sep):
                 logger.error(f"Attempted to delete file outside images directory: {filename}")
                 return False
 
             image_path.unlink()
+            self._existing_names.discard(filename)
             logger.info(f"Image deleted successfully: {filename}")
             return True
 
@@ -278,6 +412,9 @@ class ImageService:
         """
         List all images in the images directory.
 
+        Files without an image extension are left out. The remaining checks
+        reuse each entry's stat result; no file is opened.
+
         Returns:
             List of dictionaries with image information
         """
@@ -287,22 +424,32 @@ class ImageService:
             if not self.images_dir.exists():
                 return images
 
-            for image_path in self.images_dir.glob('*'):
-                if image_path.is_file() and self.asset_manager.validate_file(image_path):
+            relative_dir = str(self.images_dir.relative_to(self.content_dir))
+
+            # One directory read; DirEntry answers is_file() and caches stat()
+            with os.scandir(self.images_dir) as entries:
+                for entry in entries:
+                    # Only image files are listed, so anything else is
+                    # skipped on its name before any syscall
+                    if os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTENSIONS:
+                        continue
                     try:
-                        stat = image_path.stat()
-                        relative_url = f"/images/{image_path.name}"
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                        if not self.asset_manager.validate_file(Path(entry.path), stat):
+                            continue
 
                         images.append({
-                            'filename': image_path.name,
-                            'path': str(image_path),
-                            'relative_path': str(image_path.relative_to(self.content_dir)),
-                            'url': relative_url,
+                            'filename': entry.name,
+                            'path': entry.path,
+                            'relative_path': os.path.join(relative_dir, entry.name),
+                            'url': f"/images/{entry.name}",
                             'size': stat.st_size,
                             'modified': stat.st_mtime
                         })
                     except Exception as e:
-                        logger.error(f"Error getting info for image {image_path}: {e}")
+                        logger.error(f"Error getting info for image {entry.path}: {e}")
 
             # Sort by modification time, newest first
             images.sort(key=lambda x: x['modified'], reverse=True)
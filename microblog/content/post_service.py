@@ -6,17 +6,32 @@ with YAML frontmatter, including draft/publish workflow management.
 """
 
 import logging
-import re
-from datetime import date
+import os
+import threading
+from dataclasses import asdict
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 # No longer using Pydantic
-from microblog.utils import ensure_directory, get_content_dir
-
-from .validators import PostContent, validate_post_content
+from microblog.utils import (
+    dump_yaml,
+    ensure_directory,
+    get_content_dir,
+    load_frontmatter,
+    read_frontmatter_file,
+    read_frontmatter_yaml,
+    split_frontmatter,
+)
+
+from .validators import (
+    PostContent,
+    PostFrontmatter,
+    validate_frontmatter_dict,
+    validate_post_content,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,8 +72,47 @@ class PostService:
         """
         self.posts_dir = posts_dir or get_content_dir() / "posts"
         ensure_directory(self.posts_dir)
+        self._generation = 0
+        self._posts_snapshot: frozenset | None = None
+        # (generation, published posts grouped by year), see get_posts_by_year()
+        self._posts_by_year_cache: tuple[int, dict[int, list[PostContent]]] | None = None
+        # Parsed posts keyed by file path, stamped with (st_mtime_ns, st_size),
+        # and the file each slug was last loaded from, see _load_post_from_file()
+        self._post_cache: dict[Path, tuple[tuple[int, int], PostContent]] = {}
+        self._slug_index: dict[str, Path] = {}
+        # Guards both, as the server shares the service between request threads
+        self._cache_lock = threading.Lock()
         logger.info(f"Post service initialized with directory: {self.posts_dir}")
 
+    def generation(self) -> int:
+        """
+        Get a counter that increases whenever the post files change.
+
+        Lets callers cache data derived from the posts. Only the names,
+        sizes and modification times of the post files are checked, which
+        is much cheaper than loading them, and edits made outside this
+        service are noticed too.
+
+        Returns:
+            Current generation number
+        """
+        try:
+            with os.scandir(self.posts_dir) as entries:
+                snapshot = frozenset(
+                    (entry.name, stat.st_mtime_ns, stat.st_size)
+                    for entry in entries
+                    if entry.name.endswith('.md')
+                    for stat in (entry.stat(),)
+                )
+        except OSError as e:
+            logger.debug(f"Could not scan posts directory {self.posts_dir}: {e}")
+            snapshot = None
+
+        if snapshot is None or snapshot != self._posts_snapshot:
+            self._posts_snapshot = snapshot
+            self._generation += 1
+        return self._generation
+
     def create_post(
         self,
         title: str,
@@ -89,11 +143,10 @@ class PostService:
             PostFileError: If file creation fails
         """
         try:
-            # Prepare frontmatter data
-            from datetime import date as date_class
+            # Prepare frontmatter data; the date parameter shadows the class
             frontmatter_data = {
                 'title': title,
-                'date': date or date_class.today(),
+                'date': date or datetime.now().date(),
                 'draft': draft
             }
 
@@ -120,7 +173,6 @@ class PostService:
             # Update the post with file path and timestamps
             if file_path.exists():
                 stat = file_path.stat()
-                from datetime import datetime
                 post.file_path = str(file_path)
                 post.created_at = datetime.fromtimestamp(stat.st_ctime).isoformat()
                 post.modified_at = datetime.fromtimestamp(stat.st_mtime).isoformat()
@@ -148,8 +200,23 @@ class PostService:
             PostNotFoundError: If post is not found
             PostFileError: If file reading fails
         """
-        # Find all markdown files and check their slugs
-        for file_path in self.posts_dir.glob("*.md"):
+        # Try the file this slug was last loaded from before scanning
+        indexed_path = self._slug_index.get(slug)
+        if indexed_path is not None:
+            try:
+                post = self._load_post_from_file(indexed_path)
+                if post.computed_slug == slug and (include_drafts or not post.is_draft):
+                    return post
+            except PostFileError:
+                with self._cache_lock:
+                    self._slug_index.pop(slug, None)
+
+        # Find all markdown files and check their slugs. Posts are saved as
+        # YYYY-MM-DD-<slug>.md, so files named after the slug go first and
+        # usually the rest are never loaded.
+        suffix = f"-{slug}.md"
+        file_paths = sorted(self._scan_post_files(), key=lambda path: not path.name.endswith(suffix))
+        for file_path in file_paths:
             try:
                 post = self._load_post_from_file(file_path)
                 if post.computed_slug == slug:
@@ -223,7 +290,6 @@ class PostService:
             old_file_path = Path(existing_post.file_path) if existing_post.file_path else None
 
             # Prepare updated frontmatter
-            from dataclasses import asdict
             frontmatter_data = asdict(existing_post.frontmatter)
 
             if title is not None:
@@ -244,7 +310,6 @@ class PostService:
 
             # Convert date back to date object if it's a string
             if 'date' in frontmatter_data and isinstance(frontmatter_data['date'], str):
-                from datetime import datetime
                 frontmatter_data['date'] = datetime.fromisoformat(frontmatter_data['date']).date()
 
             # Validate the updated post
@@ -259,12 +324,12 @@ class PostService:
             # If filename changed, remove the old file
             if old_file_path and old_file_path != new_file_path and old_file_path.exists():
                 old_file_path.unlink()
+                self._forget_post(old_file_path)
                 logger.info(f"Removed old post file: {old_file_path.name}")
 
             # Update the post with file path and timestamps
             if new_file_path.exists():
                 stat = new_file_path.stat()
-                from datetime import datetime
                 updated_post.file_path = str(new_file_path)
                 updated_post.created_at = datetime.fromtimestamp(stat.st_ctime).isoformat()
                 updated_post.modified_at = datetime.fromtimestamp(stat.st_mtime).isoformat()
@@ -298,6 +363,7 @@ class PostService:
                 file_path = Path(post.file_path)
                 if file_path.exists():
                     file_path.unlink()
+                    self._forget_post(file_path)
                     logger.info(f"Deleted post: {post.frontmatter.title} ({file_path.name})")
                     return True
             return False
@@ -323,32 +389,47 @@ class PostService:
         Returns:
             List of PostContent objects, sorted by date (newest first)
         """
-        posts = []
+        def matches(frontmatter: PostFrontmatter) -> bool:
+            # Filter drafts
+            if not include_drafts and frontmatter.draft:
+                return False
 
-        for file_path in self.posts_dir.glob("*.md"):
-            try:
-                post = self._load_post_from_file(file_path)
+            # Filter by tag
+            if tag_filter and tag_filter.lower() not in [tag.lower() for tag in frontmatter.tags]:
+                return False
 
-                # Filter drafts
-                if not include_drafts and post.is_draft:
-                    continue
+            return True
 
-                # Filter by tag
-                if tag_filter and tag_filter.lower() not in [tag.lower() for tag in post.frontmatter.tags]:
-                    continue
+        if not limit or limit <= 0:
+            posts = [post for post in self._load_all_posts() if matches(post.frontmatter)]
 
-                posts.append(post)
+            # Sort by date (newest first)
+            posts.sort(key=lambda p: p.frontmatter.date, reverse=True)
+            return posts
 
+        # Only the newest posts are returned, so filter and sort on the
+        # frontmatter alone and fully load just the posts that make the cut
+        candidates = []
+        for file_path in self._scan_post_files():
+            try:
+                frontmatter = self._load_frontmatter(file_path)
             except Exception as e:
                 logger.warning(f"Failed to load post {file_path}: {e}")
                 continue
+            if matches(frontmatter):
+                candidates.append((frontmatter.date, file_path))
 
-        # Sort by date (newest first)
-        posts.sort(key=lambda p: p.frontmatter.date, reverse=True)
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
 
-        # Apply limit
-        if limit and limit > 0:
-            posts = posts[:limit]
+        posts = []
+        for _, file_path in candidates:
+            try:
+                posts.append(self._load_post_from_file(file_path))
+            except Exception as e:
+                logger.warning(f"Failed to load post {file_path}: {e}")
+                continue
+            if len(posts) == limit:
+                break
 
         return posts
 
@@ -400,6 +481,26 @@ class PostService:
         """
         return self.list_posts(include_drafts=False, tag_filter=tag_filter, limit=limit)
 
+    def get_posts_by_year(self) -> dict[int, list[PostContent]]:
+        """
+        Get published posts grouped by year.
+
+        The grouping is kept until the post files change, so repeated
+        archive renders do not reload and regroup every post. The returned
+        mapping is shared and must not be modified.
+
+        Returns:
+            Dictionary of year to published posts, newest first
+        """
+        generation = self.generation()
+        cached = self._posts_by_year_cache
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        posts_by_year = group_posts_by_year(self.get_published_posts())
+        self._posts_by_year_cache = (generation, posts_by_year)
+        return posts_by_year
+
     def get_draft_posts(self, tag_filter: str | None = None, limit: int | None = None) -> list[PostContent]:
         """
         Get only draft posts.
@@ -414,10 +515,60 @@ class PostService:
         posts = self.list_posts(include_drafts=True, tag_filter=tag_filter, limit=limit)
         return [post for post in posts if post.is_draft]
 
+    def _scan_post_files(self) -> list[Path]:
+        """
+        List the post files with a single os.scandir() pass.
+
+        Cached posts whose files are gone are dropped along the way.
+
+        Returns:
+            List of post file paths, in no particular order
+        """
+        try:
+            with os.scandir(self.posts_dir) as entries:
+                file_paths = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith('.md') and entry.is_file()
+                ]
+        except OSError as e:
+            logger.warning(f"Failed to scan posts directory {self.posts_dir}: {e}")
+            return []
+
+        # Drop cached posts whose files are gone
+        present = set(file_paths)
+        with self._cache_lock:
+            stale_paths = [path for path in self._post_cache if path not in present]
+        for stale_path in stale_paths:
+            self._forget_post(stale_path)
+
+        return file_paths
+
+    def _load_all_posts(self) -> list[PostContent]:
+        """
+        Load every post in the posts directory.
+
+        Posts that fail to load are logged and skipped.
+
+        Returns:
+            List of PostContent objects, in no particular order
+        """
+        posts = []
+        for file_path in self._scan_post_files():
+            try:
+                posts.append(self._load_post_from_file(file_path))
+            except Exception as e:
+                logger.warning(f"Failed to load post {file_path}: {e}")
+        return posts
+
     def _load_post_from_file(self, file_path: Path) -> PostContent:
         """
         Load a post from a markdown file with YAML frontmatter.
 
+        Parsed posts are cached until the file's modification time or size
+        changes, so repeated listings and lookups skip the YAML parsing.
+        Cached posts are shared between callers and must not be modified.
+
         Args:
             file_path: Path to the markdown file
 
@@ -428,22 +579,78 @@ class PostService:
             PostFileError: If file reading or parsing fails
         """
         try:
-            with open(file_path, encoding='utf-8') as f:
-                file_content = f.read()
+            stat = file_path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = self._post_cache.get(file_path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            # Large posts are split without decoding the whole file
+            parts = read_frontmatter_file(file_path)
 
             # Parse frontmatter and content
-            frontmatter_data, content = self._parse_markdown_file(file_content)
+            frontmatter_data, content = self._parse_frontmatter_parts(parts)
 
             # Validate and create post
             post = validate_post_content(frontmatter_data, content, file_path)
 
+            with self._cache_lock:
+                self._post_cache[file_path] = (stamp, post)
+                self._slug_index[post.computed_slug] = file_path
             return post
 
         except FileNotFoundError as e:
+            self._forget_post(file_path)
             raise PostFileError(f"Post file not found: {file_path}") from e
         except Exception as e:
             raise PostFileError(f"Failed to load post from {file_path}: {e}") from e
 
+    def _load_frontmatter(self, file_path: Path) -> PostFrontmatter:
+        """
+        Load just the frontmatter of a post file.
+
+        A cached post is used when the file is unchanged; otherwise only the
+        frontmatter is read from the file, leaving the body unread.
+
+        Args:
+            file_path: Path to the markdown file
+
+        Returns:
+            PostFrontmatter object
+
+        Raises:
+            PostFileError: If file reading or parsing fails
+        """
+        try:
+            stat = file_path.stat()
+            cached = self._post_cache.get(file_path)
+            if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+                return cached[1].frontmatter
+
+            frontmatter_yaml = read_frontmatter_yaml(file_path)
+            parts = (frontmatter_yaml, '') if frontmatter_yaml is not None else None
+            frontmatter_data, _ = self._parse_frontmatter_parts(parts)
+            return validate_frontmatter_dict(frontmatter_data)
+
+        except FileNotFoundError as e:
+            raise PostFileError(f"Post file not found: {file_path}") from e
+        except Exception as e:
+            raise PostFileError(f"Failed to load frontmatter from {file_path}: {e}") from e
+
+    def _forget_post(self, file_path: Path) -> None:
+        """
+        Drop the cached parse of a post file and its slug index entry.
+
+        Args:
+            file_path: Path to the markdown file
+        """
+        with self._cache_lock:
+            cached = self._post_cache.pop(file_path, None)
+            if cached is not None:
+                slug = cached[1].computed_slug
+                if self._slug_index.get(slug) == file_path:
+                    self._slug_index.pop(slug, None)
+
     def _save_post_to_file(self, post: PostContent, file_path: Path) -> None:
         """
         Save a post to a markdown file with YAML frontmatter.
@@ -460,20 +667,22 @@ class PostService:
             ensure_directory(file_path.parent)
 
             # Convert frontmatter to dict and serialize
-            from dataclasses import asdict
             frontmatter_dict = asdict(post.frontmatter)
 
             # Convert date to string for YAML serialization
             if 'date' in frontmatter_dict:
                 frontmatter_dict['date'] = frontmatter_dict['date'].isoformat()
 
-            # Create the complete file content
-            frontmatter_yaml = yaml.dump(frontmatter_dict, default_flow_style=False, sort_keys=False)
-            file_content = f"---\n{frontmatter_yaml}---\n\n{post.content}"
+            frontmatter_yaml = dump_yaml(frontmatter_dict)
 
-            # Write to file
+            # Write the pieces in turn rather than joining them first, which
+            # would copy the whole post body
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(file_content)
+                f.writelines(("---\n", frontmatter_yaml, "---\n\n", post.content))
+
+            # A rewrite can keep the same size and, on coarse filesystems,
+            # the same modification time, so drop the cached parse outright
+            self._forget_post(file_path)
 
         except Exception as e:
             raise PostFileError(f"Failed to save post to {file_path}: {e}") from e
@@ -491,25 +700,35 @@ class PostService:
         Raises:
             PostFileError: If parsing fails
         """
-        try:
-            # Match YAML frontmatter pattern
-            frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-            match = re.match(frontmatter_pattern, file_content, re.DOTALL)
+        return self._parse_frontmatter_parts(split_frontmatter(file_content))
+
+    def _parse_frontmatter_parts(self, parts: tuple[str, str] | None) -> tuple[dict[str, Any], str]:
+        """
+        Parse split frontmatter and content.
+
+        Args:
+            parts: Tuple of (frontmatter_yaml, markdown_content) from
+                split_frontmatter(), or None if there was no frontmatter
+
+        Returns:
+            Tuple of (frontmatter_dict, markdown_content)
 
-            if not match:
+        Raises:
+            PostFileError: If parsing fails
+        """
+        try:
+            if parts is None:
                 raise PostFileError("Invalid markdown file format: missing YAML frontmatter")
 
-            frontmatter_yaml = match.group(1)
-            content = match.group(2)
+            frontmatter_yaml, content = parts
 
             # Parse YAML frontmatter
-            frontmatter_data = yaml.safe_load(frontmatter_yaml)
+            frontmatter_data = load_frontmatter(frontmatter_yaml)
             if frontmatter_data is None:
                 frontmatter_data = {}
 
             # Convert date string back to date object if needed
             if 'date' in frontmatter_data and isinstance(frontmatter_data['date'], str):
-                from datetime import datetime
                 frontmatter_data['date'] = datetime.fromisoformat(frontmatter_data['date']).date()
 
             return frontmatter_data, content
@@ -520,8 +739,25 @@ class PostService:
             raise PostFileError(f"Failed to parse markdown file: {e}") from e
 
 
+def group_posts_by_year(posts: list[PostContent]) -> dict[int, list[PostContent]]:
+    """
+    Group posts by the year of their date, keeping their order.
+
+    Args:
+        posts: Posts to group
+
+    Returns:
+        Dictionary of year to posts, in order of first appearance
+    """
+    posts_by_year: dict[int, list[PostContent]] = {}
+    for post in posts:
+        posts_by_year.setdefault(post.frontmatter.date.year, []).append(post)
+    return posts_by_year
+
+
 # Global post service instance
 _post_service: PostService | None = None
+_post_service_lock = threading.Lock()
 
 
 def get_post_service() -> PostService:
@@ -533,5 +769,7 @@ def get_post_service() -> PostService:
     """
     global _post_service
     if _post_service is None:
-        _post_service = PostService()
+        with _post_service_lock:
+            if _post_service is None:
+                _post_service = PostService()
     return _post_service
@@ -7,7 +7,7 @@ and content, following the data model specification.
 
 import re
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, time
 from typing import Any
 
 
@@ -78,6 +78,14 @@ class PostContent:
 
         return slug or 'untitled'
 
+    @property
+    def pub_date(self) -> datetime:
+        """Get the publication date as a datetime, at midnight for plain dates."""
+        post_date = self.frontmatter.date
+        if isinstance(post_date, datetime):
+            return post_date
+        return datetime.combine(post_date, time())
+
     @property
     def filename(self) -> str:
         """Get the expected filename for this post."""
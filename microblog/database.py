@@ -10,12 +10,20 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from microblog.auth.models import User
+from microblog.auth.models import (
+    User,
+    close_connection,
+    connection_lock,
+    get_connection,
+)
 from microblog.auth.password import hash_password
 from microblog.utils import ensure_directory, get_project_root
 
 logger = logging.getLogger(__name__)
 
+# Databases already set up by this process, see setup_database_if_needed()
+_ready_databases: set[Path] = set()
+
 
 def get_database_path() -> Path:
     """
@@ -130,11 +138,10 @@ def get_admin_user(db_path: Path | None = None) -> User | None:
         if User.user_exists(db_path):
             # Get the first (and only) user - we could query by role but
             # since there's only one user, this is simpler
-            import sqlite3
-            with sqlite3.connect(db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute("SELECT * FROM users LIMIT 1")
-                row = cursor.fetchone()
+            with connection_lock():
+                row = get_connection(db_path).execute(
+                    "SELECT * FROM users LIMIT 1"
+                ).fetchone()
 
                 if row:
                     return User(
@@ -173,6 +180,9 @@ def setup_database_if_needed(db_path: Path | None = None) -> bool:
     """
     Set up the database if it doesn't exist or is incomplete.
 
+    Setup only runs once per database file and process, unless the file
+    has been removed since.
+
     Args:
         db_path: Optional custom database path
 
@@ -182,11 +192,15 @@ def setup_database_if_needed(db_path: Path | None = None) -> bool:
     if db_path is None:
         db_path = get_database_path()
 
+    if db_path in _ready_databases and db_path.exists():
+        return True
+
     try:
-        # Always initialize (create tables if they don't exist)
+        # Initialize (create tables if they don't exist)
         if not init_database(db_path):
             return False
 
+        _ready_databases.add(db_path)
         logger.info("Database setup completed")
         return True
 
@@ -209,6 +223,9 @@ def reset_database(db_path: Path | None = None) -> bool:
         db_path = get_database_path()
 
     try:
+        close_connection(db_path)
+        _ready_databases.discard(db_path)
+
         if db_path.exists():
             db_path.unlink()
             logger.info(f"Database reset: {db_path} removed")
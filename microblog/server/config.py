@@ -7,6 +7,7 @@ for the microblog application.
 
 import asyncio
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +32,8 @@ class BuildConfig(BaseModel):
     """Build-related configuration settings."""
     output_dir: str = Field(default='build', max_length=100)
     backup_dir: str = Field(default='build.bak', max_length=100)
+    cache_dir: str = Field(default='.cache', max_length=100)
+    strict_validation: bool = Field(default=False)
     posts_per_page: int = Field(default=10, ge=1, le=100)
 
 
@@ -120,6 +123,7 @@ class ConfigManager:
         self.config_path = config_path or get_content_dir() / "_data" / "config.yaml"
         self.dev_mode = dev_mode
         self._config: AppConfig | None = None
+        self._load_lock = threading.Lock()
         self._watcher_task: asyncio.Task | None = None
         self._callbacks: list = []
 
@@ -127,7 +131,10 @@ class ConfigManager:
     def config(self) -> AppConfig:
         """Get the current configuration. Loads if not already loaded."""
         if self._config is None:
-            self.load_config()
+            # Threads asking for the config at once share a single load
+            with self._load_lock:
+                if self._config is None:
+                    self.load_config()
         return self._config
 
     def load_config(self) -> AppConfig:
@@ -296,6 +303,7 @@ class ConfigManager:
 
 # Global configuration manager instance
 _config_manager: ConfigManager | None = None
+_config_manager_lock = threading.Lock()
 
 
 def get_config_manager(dev_mode: bool = False) -> ConfigManager:
@@ -310,7 +318,9 @@ def get_config_manager(dev_mode: bool = False) -> ConfigManager:
     """
     global _config_manager
     if _config_manager is None:
-        _config_manager = ConfigManager(dev_mode=dev_mode)
+        with _config_manager_lock:
+            if _config_manager is None:
+                _config_manager = ConfigManager(dev_mode=dev_mode)
     return _config_manager
 
 
@@ -346,6 +356,8 @@ def create_default_config_file(config_path: Path | None = None) -> Path:
         'build': {
             'output_dir': 'build',
             'backup_dir': 'build.bak',
+            'cache_dir': '.cache',
+            'strict_validation': False,
             'posts_per_page': 10
         },
         'server': {
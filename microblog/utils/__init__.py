@@ -5,8 +5,18 @@ This package provides common utilities including logging, monitoring, and helper
 """
 
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
+from microblog.utils.frontmatter import (
+    dump_yaml,
+    load_frontmatter,
+    load_yaml,
+    read_frontmatter_file,
+    read_frontmatter_yaml,
+    split_frontmatter,
+)
+
 
 def ensure_directory(path: Path) -> None:
     """Ensure a directory exists, creating it if necessary."""
@@ -23,37 +33,50 @@ def safe_copy_file(src: Path, dest: Path) -> bool:
         return False
 
 
+# The project layout is fixed for the life of the process, so the directory
+# helpers are computed once
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).parent.parent.parent
 
 
+@lru_cache(maxsize=1)
 def get_content_dir() -> Path:
     """Get the content directory path."""
     return get_project_root() / "content"
 
 
+@lru_cache(maxsize=1)
 def get_build_dir() -> Path:
     """Get the build directory path."""
     return get_project_root() / "build"
 
 
+@lru_cache(maxsize=1)
 def get_templates_dir() -> Path:
     """Get the templates directory path."""
     return get_project_root() / "templates"
 
 
+@lru_cache(maxsize=1)
 def get_static_dir() -> Path:
     """Get the static directory path."""
     return get_project_root() / "static"
 
 
 __all__ = [
+    "dump_yaml",
     "ensure_directory",
     "get_build_dir",
     "get_content_dir",
     "get_project_root",
     "get_static_dir",
     "get_templates_dir",
+    "load_frontmatter",
+    "load_yaml",
+    "read_frontmatter_file",
+    "read_frontmatter_yaml",
     "safe_copy_file",
-]
\ No newline at end of file
+    "split_frontmatter",
+]
@@ -137,8 +137,12 @@ class TemplateCache:
         logger.info(f"Template cache initialized (compiled: {compiled_cache_size}, "
                    f"rendered: {rendered_cache_size if enable_rendered_cache else 'disabled'})")
 
-    def _get_cache_key(self, template_path: str, context: dict[str, Any] | None = None) -> str:
-        """Generate cache key for template and context."""
+    def _get_cache_key(self, template_path: str, context: dict[str, Any] | None = None,
+                       cache_key: str | None = None) -> str:
+        """Generate cache key for template and context, or for a caller-supplied key."""
+        if cache_key is not None:
+            return f"{template_path}:{cache_key}"
+
         if context is None:
             return template_path
 
@@ -183,20 +187,22 @@ class TemplateCache:
         logger.debug(f"Compiled and cached template: {template_path}")
         return template
 
-    def get_rendered_output(self, template_path: str, context: dict[str, Any] | None = None) -> str | None:
+    def get_rendered_output(self, template_path: str, context: dict[str, Any] | None = None,
+                            cache_key: str | None = None) -> str | None:
         """Get rendered output from cache."""
         if self.rendered_cache is None:
             return None
 
-        cache_key = self._get_cache_key(template_path, context)
+        cache_key = self._get_cache_key(template_path, context, cache_key)
         return self.rendered_cache.get(cache_key)
 
-    def put_rendered_output(self, template_path: str, context: dict[str, Any] | None, output: str):
+    def put_rendered_output(self, template_path: str, context: dict[str, Any] | None, output: str,
+                            cache_key: str | None = None):
         """Cache rendered output."""
         if self.rendered_cache is None:
             return
 
-        cache_key = self._get_cache_key(template_path, context)
+        cache_key = self._get_cache_key(template_path, context, cache_key)
         self.rendered_cache.put(cache_key, output)
         logger.debug(f"Cached rendered output: {cache_key}")
 
@@ -421,6 +427,7 @@ class BuildPerformanceMonitor:
 
 # Global cache instances
 _template_cache: TemplateCache | None = None
+_template_cache_lock = Lock()
 _performance_monitor: BuildPerformanceMonitor | None = None
 
 
@@ -428,14 +435,16 @@ def get_template_cache() -> TemplateCache:
     """Get the global template cache instance."""
     global _template_cache
     if _template_cache is None:
-        config = get_config()
-        # Use performance configuration settings
-        perf_config = config.performance
-        _template_cache = TemplateCache(
-            compiled_cache_size=perf_config.template_cache_size,
-            rendered_cache_size=perf_config.rendered_cache_size,
-            enable_rendered_cache=perf_config.enable_rendered_output_caching
-        )
+        with _template_cache_lock:
+            if _template_cache is None:
+                config = get_config()
+                # Use performance configuration settings
+                perf_config = config.performance
+                _template_cache = TemplateCache(
+                    compiled_cache_size=perf_config.template_cache_size,
+                    rendered_cache_size=perf_config.rendered_cache_size,
+                    enable_rendered_cache=perf_config.enable_rendered_output_caching
+                )
     return _template_cache
 
 
@@ -0,0 +1,306 @@
+"""
+Frontmatter and YAML parsing for post files.
+
+Posts are markdown files opening with a '---' fenced block of YAML
+frontmatter. This module splits files into frontmatter and body, parses
+the frontmatter, and serializes it back.
+"""
+
+import mmap
+import os
+import re
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml's C loader and emitter when PyYAML was built with them; they
+# handle the same safe subset of YAML as SafeLoader and SafeDumper
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Plain words YAML 1.1 resolves to booleans and null
+_YAML_WORDS = {
+    **dict.fromkeys(('yes', 'Yes', 'YES', 'true', 'True', 'TRUE', 'on', 'On', 'ON'), True),
+    **dict.fromkeys(('no', 'No', 'NO', 'false', 'False', 'FALSE', 'off', 'Off', 'OFF'), False),
+    **dict.fromkeys(('null', 'Null', 'NULL'), None),
+}
+_FRONTMATTER_KEY_RE = re.compile(r'([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?')
+_SEQUENCE_ITEM_RE = re.compile(r'( *)- +(.*)')
+_INT_RE = re.compile(r'0|[1-9][0-9]*')
+_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+_BLOCK_UNSAFE = frozenset(':#')
+_FLOW_UNSAFE = frozenset(':#,[]{}')
+_UNSUPPORTED = object()
+
+# Posts at least this large are memory-mapped instead of read whole
+LARGE_POST_BYTES = 100 * 1024
+# Characters read at first when only the frontmatter is wanted; doubled
+# until the closing fence is found
+FRONTMATTER_READ_CHARS = 4096
+# ASCII characters str.isspace() accepts, other than '\r'
+_ASCII_WHITESPACE = frozenset(b' \t\n\x0b\x0c\x1c\x1d\x1e\x1f')
+
+
+def load_yaml(text: str) -> Any:
+    """Parse YAML safely, using libyaml when available."""
+    return yaml.load(text, Loader=_YAML_LOADER)
+
+
+def dump_yaml(data: Any) -> str:
+    """Serialize data as block-style YAML in key order, using libyaml when available."""
+    return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
+
+
+def load_frontmatter(text: str) -> Any:
+    """
+    Parse post frontmatter YAML.
+
+    Frontmatter in the shape the post service writes (top-level keys with
+    plain or quoted scalars, dates, or lists of those) is parsed directly,
+    without going through a YAML parser. Anything else is handed to
+    load_yaml(); both give the same result.
+
+    Args:
+        text: Frontmatter YAML
+
+    Returns:
+        Parsed frontmatter
+    """
+    data = _parse_simple_frontmatter(text)
+    return data if data is not None else load_yaml(text)
+
+
+def _parse_simple_frontmatter(text: str) -> dict[str, Any] | None:
+    """Parse flat frontmatter, or return None if it needs a YAML parser."""
+    data: dict[str, Any] = {}
+    sequence_key = None
+    sequence: list[Any] = []
+    sequence_indent = None
+
+    for line in text.split('\n'):
+        if not line.strip():
+            continue
+        if not line.isprintable():
+            return None
+
+        item = _SEQUENCE_ITEM_RE.fullmatch(line)
+        if item:
+            indent, value = item.groups()
+            if sequence_key is None or sequence_indent not in (None, indent):
+                return None
+            value = _parse_simple_scalar(value.rstrip(), _BLOCK_UNSAFE)
+            if value is _UNSUPPORTED:
+                return None
+            if not sequence:
+                data[sequence_key] = sequence
+            sequence.append(value)
+            sequence_indent = indent
+            continue
+
+        entry = _FRONTMATTER_KEY_RE.fullmatch(line)
+        if not entry or entry.group(1) in _YAML_WORDS:
+            return None
+        key, value = entry.group(1), (entry.group(2) or '').rstrip()
+
+        sequence_key = None
+        sequence_indent = None
+        if not value:
+            # Either null or the start of a block sequence
+            data[key] = None
+            sequence_key = key
+            sequence = []
+        elif value == '{}':
+            data[key] = {}
+        elif value[0] == '[' and value[-1] == ']':
+            items = value[1:-1].strip()
+            data[key] = [_parse_simple_scalar(i.strip(), _FLOW_UNSAFE) for i in items.split(',')] if items else []
+            if _UNSUPPORTED in data[key]:
+                return None
+        else:
+            data[key] = _parse_simple_scalar(value, _BLOCK_UNSAFE)
+            if data[key] is _UNSUPPORTED:
+                return None
+
+    return data or None
+
+
+def _parse_simple_scalar(value: str, unsafe: frozenset[str]) -> Any:
+    """Parse a single-line scalar the way YAML would, or return _UNSUPPORTED."""
+    if not value:
+        return _UNSUPPORTED
+
+    first = value[0]
+    if first == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != "'" or "'" in inner.replace("''", ''):
+            return _UNSUPPORTED
+        return inner.replace("''", "'")
+    if first == '"':
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != '"' or '"' in inner or '\\' in inner:
+            return _UNSUPPORTED
+        return inner
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if _DATE_RE.fullmatch(value):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return _UNSUPPORTED
+    if not first.isalpha() or not unsafe.isdisjoint(value):
+        return _UNSUPPORTED
+    return _YAML_WORDS.get(value, value)
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos."""
+    length = len(text)
+    while pos < length and text[pos].isspace():
+        pos += 1
+    return pos
+
+
+def split_frontmatter(file_content: str) -> tuple[str, str] | None:
+    """
+    Split markdown file content into its YAML frontmatter and body.
+
+    The content must open with a '---' fence and the frontmatter ends at the
+    next '---' line; either fence may be followed by whitespace up to the end
+    of its line. Plain string searches are used instead of the equivalent
+    regular expression, which backtracked over the whole file.
+
+    Args:
+        file_content: Raw file content
+
+    Returns:
+        Tuple of (frontmatter_yaml, markdown_content), or None if the
+        content has no frontmatter
+    """
+    if not file_content.startswith('---'):
+        return None
+
+    # Prefer the last line break after the opening fence, then earlier ones
+    opening_end = _skip_whitespace(file_content, 3)
+    opening = file_content.rfind('\n', 3, opening_end)
+    while opening >= 0:
+        start = opening + 1
+        closing = file_content.find('\n---', start)
+        while closing >= 0:
+            fence_end = closing + 4
+            body = file_content.rfind('\n', fence_end, _skip_whitespace(file_content, fence_end))
+            if body >= 0:
+                return file_content[start:closing], file_content[body + 1:]
+            closing = file_content.find('\n---', closing + 1)
+        opening = file_content.rfind('\n', 3, opening)
+
+    return None
+
+
+def read_frontmatter_file(path: Path) -> tuple[str, str] | None:
+    """
+    Read a markdown file and split it into its YAML frontmatter and body.
+
+    Large files are memory-mapped and the closing fence is located on the
+    raw bytes, so only the frontmatter and body slices are ever decoded
+    rather than the whole file followed by a copy of its body. The result
+    is the same as split_frontmatter() on the file's text.
+
+    Args:
+        path: Path to the markdown file
+
+    Returns:
+        Tuple of (frontmatter_yaml, markdown_content), or None if the
+        file has no frontmatter
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= LARGE_POST_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                parts = _split_mapped_frontmatter(mapped)
+            if parts is not _UNSUPPORTED:
+                return parts
+
+    # Text mode translates '\r\n' and '\r' line endings
+    with open(path, encoding='utf-8') as f:
+        return split_frontmatter(f.read())
+
+
+def read_frontmatter_yaml(path: Path) -> str | None:
+    """
+    Read only the YAML frontmatter of a markdown file.
+
+    The file is read in growing chunks until the closing fence is found, so
+    the body of a long post is neither read nor decoded. The result is the
+    same as the frontmatter from read_frontmatter_file().
+
+    Args:
+        path: Path to the markdown file
+
+    Returns:
+        Frontmatter YAML, or None if the file has no frontmatter
+    """
+    with open(path, encoding='utf-8') as f:
+        text = f.read(FRONTMATTER_READ_CHARS)
+        if not text.startswith('---'):
+            return None
+
+        while True:
+            opening_end = _skip_whitespace(text, 3)
+            if opening_end < len(text):
+                # split_frontmatter() starts from the last line break after
+                # the opening fence; a closing fence found for it here is
+                # the one the whole file would give
+                opening = text.rfind('\n', 3, opening_end)
+                if opening < 0:
+                    return None
+                parts = split_frontmatter('---' + text[opening:])
+                if parts is not None:
+                    return parts[0]
+
+            more = f.read(len(text))
+            if not more:
+                # Whole file read; earlier line breaks may still apply
+                parts = split_frontmatter(text)
+                return parts[0] if parts is not None else None
+            text += more
+
+
+def _split_mapped_frontmatter(mapped: mmap.mmap) -> Any:
+    """Split a mapped UTF-8 file like split_frontmatter(), or _UNSUPPORTED."""
+    if mapped[:3] != b'---' or mapped.find(b'\r') >= 0:
+        return _UNSUPPORTED
+
+    # split_frontmatter() tries each line break after the opening fence,
+    # which the scan below does not follow; only a single one is handled
+    size = len(mapped)
+    opening_end = 3
+    while opening_end < size and mapped[opening_end] in _ASCII_WHITESPACE:
+        opening_end += 1
+    if opening_end < size and mapped[opening_end] >= 0x80:
+        return _UNSUPPORTED
+    first_break = mapped.find(b'\n', 3, opening_end)
+    if first_break >= 0 and mapped.find(b'\n', first_break + 1, opening_end) >= 0:
+        return _UNSUPPORTED
+
+    closing = mapped.find(b'\n---', 3)
+    if closing < 0:
+        return None
+
+    # The split point is past any whitespace after the fence; non-ASCII
+    # bytes there may be Unicode whitespace
+    end = closing + 4
+    while end < size and mapped[end] in _ASCII_WHITESPACE:
+        end += 1
+    if end < size and mapped[end] >= 0x80:
+        return _UNSUPPORTED
+
+    # Only the first fence is tried: retrying later ones would re-decode
+    # an ever longer prefix, so a post whose first fence does not split
+    # goes through the decoded text instead
+    with memoryview(mapped) as view:
+        parts = split_frontmatter(str(view[:end], 'utf-8'))
+        if parts is None:
+            return _UNSUPPORTED
+        frontmatter_yaml, body_start = parts
+        return frontmatter_yaml, body_start + str(view[end:], 'utf-8')
@@ -16,6 +16,9 @@ from fastapi.testclient import TestClient
 
 from microblog.server.app import create_app
 
+# Smallest content passing the image signature check for a .jpg upload
+JPEG_BYTES = b'\xff\xd8\xff\xe0\x00\x10JFIF\x00'
+
 
 class TestHTMXInteractions:
     """Test HTMX interactions and dynamic functionality."""
@@ -334,7 +337,7 @@ class TestHTMXInteractions:
     def test_htmx_image_upload_api(self, authenticated_client):
         """Test HTMX image upload API endpoint."""
         # Create mock image file
-        image_content = b"fake-image-content"
+        image_content = JPEG_BYTES
         image_file = BytesIO(image_content)
 
         mock_upload_result = {
@@ -347,7 +350,7 @@ class TestHTMXInteractions:
         mock_image_service = Mock()
         mock_image_service.save_uploaded_file_async = AsyncMock(return_value=mock_upload_result)
 
-        with patch('microblog.content.image_service.get_image_service', return_value=mock_image_service):
+        with patch('microblog.server.routes.api.get_image_service', return_value=mock_image_service):
             # Upload image via HTMX API
             files = {'file': ('test-image.jpg', image_file, 'image/jpeg')}
             response = authenticated_client.post("/api/images/upload", files=files)
@@ -381,7 +384,7 @@ class TestHTMXInteractions:
 
     def test_htmx_image_upload_service_errors(self, authenticated_client):
         """Test HTMX image upload service errors."""
-        image_file = BytesIO(b"fake-image-content")
+        image_file = BytesIO(JPEG_BYTES)
 
         mock_image_service = Mock()
         from microblog.content.image_service import (
@@ -392,7 +395,7 @@ class TestHTMXInteractions:
         # Test validation error
         mock_image_service.save_uploaded_file_async = AsyncMock(side_effect=ImageValidationError("Invalid image format"))
 
-        with patch('microblog.content.image_service.get_image_service', return_value=mock_image_service):
+        with patch('microblog.server.routes.api.get_image_service', return_value=mock_image_service):
             files = {'file': ('invalid.txt', image_file, 'text/plain')}
             response = authenticated_client.post("/api/images/upload", files=files)
 
@@ -404,7 +407,7 @@ class TestHTMXInteractions:
         # Test upload error
         mock_image_service.save_uploaded_file_async = AsyncMock(side_effect=ImageUploadError("Upload failed"))
 
-        with patch('microblog.content.image_service.get_image_service', return_value=mock_image_service):
+        with patch('microblog.server.routes.api.get_image_service', return_value=mock_image_service):
             files = {'file': ('test.jpg', image_file, 'image/jpeg')}
             response = authenticated_client.post("/api/images/upload", files=files)
 
@@ -413,6 +416,21 @@ class TestHTMXInteractions:
             assert "Upload error" in html_content
             assert "Upload failed" in html_content
 
+    def test_htmx_image_upload_rejects_wrong_signature(self, authenticated_client, temp_project_dir):
+        """Test content not matching the image extension is a validation error."""
+        from microblog.content.image_service import ImageService
+
+        with patch('microblog.content.image_service.get_content_dir', return_value=temp_project_dir['content']):
+            image_service = ImageService()
+
+        with patch('microblog.server.routes.api.get_image_service', return_value=image_service):
+            files = {'file': ('photo.png', BytesIO(JPEG_BYTES), 'image/png')}
+            response = authenticated_client.post("/api/images/upload", files=files)
+
+        assert response.status_code == 422
+        assert "Validation error" in response.text
+        assert list(temp_project_dir['images'].iterdir()) == []
+
     def test_htmx_image_gallery_api(self, authenticated_client):
         """Test HTMX image gallery API endpoint."""
         mock_images = [
@@ -431,7 +449,7 @@ class TestHTMXInteractions:
         mock_image_service = Mock()
         mock_image_service.list_images.return_value = mock_images
 
-        with patch('microblog.content.image_service.get_image_service', return_value=mock_image_service):
+        with patch('microblog.server.routes.api.get_image_service', return_value=mock_image_service):
             response = authenticated_client.get("/api/images")
 
             assert response.status_code == 200
@@ -450,7 +468,7 @@ class TestHTMXInteractions:
         mock_image_service = Mock()
         mock_image_service.list_images.return_value = []
 
-        with patch('microblog.content.image_service.get_image_service', return_value=mock_image_service):
+        with patch('microblog.server.routes.api.get_image_service', return_value=mock_image_service):
             response = authenticated_client.get("/api/images")
 
             assert response.status_code == 200
@@ -766,7 +784,7 @@ class TestHTMXInteractions:
         # Mock required services
         with patch('microblog.content.post_service.get_post_service') as mock_post_service, \
              patch('microblog.builder.markdown_processor.get_markdown_processor') as mock_processor, \
-             patch('microblog.content.image_service.get_image_service') as mock_image_service, \
+             patch('microblog.server.routes.api.get_image_service') as mock_image_service, \
              patch('microblog.server.build_service.get_build_service') as mock_build_service:
 
             # Setup mocks
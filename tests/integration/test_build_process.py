@@ -693,6 +693,7 @@ document.addEventListener('DOMContentLoaded', function() {
         mock_template_renderer = Mock()
         mock_template_renderer.templates_dir = structure['templates']
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
         mock_template_renderer.render_homepage.side_effect = Exception("Template rendering failed")
 
         with patch('microblog.builder.generator.get_config', return_value=mock_config):
@@ -825,6 +826,7 @@ Some more content here to make the post substantial.
         # Create mock dependencies for the build
         mock_template_renderer = Mock()
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
         mock_template_renderer.templates_dir = structure['templates']
         mock_template_renderer.render_homepage.return_value = "<html>test homepage</html>"
         mock_template_renderer.render_archive.return_value = "<html>test archive</html>"
@@ -12,10 +12,11 @@ import sqlite3
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from microblog.auth.models import User
+from microblog.auth.models import User, close_connection, get_connection
 from microblog.auth.password import (
     BCRYPT_ROUNDS,
     get_password_info,
@@ -89,6 +90,15 @@ class TestPasswordUtils:
         assert verify_password("password", "invalid_hash") is False
         assert verify_password("password", "not_a_bcrypt_hash") is False
 
+    def test_verify_password_rejects_malformed_bcrypt_hash(self):
+        """Test malformed bcrypt hashes are rejected without calling bcrypt."""
+        hashed = hash_password("password")
+
+        with patch("microblog.auth.password.bcrypt.checkpw") as mock_checkpw:
+            assert verify_password("password", hashed[:-1]) is False
+            assert verify_password("password", "$2a$" + hashed[4:]) is False
+            mock_checkpw.assert_not_called()
+
     def test_needs_update_bcrypt_current_cost(self):
         """Test needs_update with current cost factor."""
         password = "test_password"
@@ -177,6 +187,7 @@ class TestUserModel:
             yield db_path
         finally:
             # Cleanup
+            close_connection(db_path)
             if db_path.exists():
                 try:
                     db_path.unlink()
@@ -451,6 +462,74 @@ class TestUserModel:
         # Should succeed even with non-existent user_id (UPDATE affects 0 rows)
         assert result is True
 
+    def test_connection_reused(self, initialized_db):
+        """Test queries share one connection per database file."""
+        conn = get_connection(initialized_db)
+
+        assert User.user_exists(initialized_db) is False
+        assert get_connection(initialized_db) is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_connection_reopened_after_database_replaced(self, initialized_db):
+        """Test a deleted database file is not served from a stale connection."""
+        User.create_user(
+            username="admin",
+            email="admin@example.com",
+            password_hash=hash_password("test_password"),
+            db_path=initialized_db
+        )
+        assert User.user_exists(initialized_db) is True
+
+        initialized_db.unlink()
+        User.create_table(initialized_db)
+
+        assert User.user_exists(initialized_db) is False
+
+    def test_setup_database_runs_once_per_file(self, temp_db):
+        """Test database setup is skipped once done, until the file is removed."""
+        from microblog.database import reset_database, setup_database_if_needed
+
+        with patch('microblog.database.init_database', return_value=True) as init_database:
+            assert setup_database_if_needed(temp_db) is True
+            assert setup_database_if_needed(temp_db) is True
+            assert init_database.call_count == 1
+
+            reset_database(temp_db)
+            assert setup_database_if_needed(temp_db) is True
+            assert init_database.call_count == 2
+
+    def test_get_by_username_cached(self, initialized_db):
+        """Test repeated lookups are served from the user cache."""
+        User.create_user(
+            username="admin",
+            email="admin@example.com",
+            password_hash=hash_password("test_password"),
+            db_path=initialized_db
+        )
+
+        first = User.get_by_username("admin", initialized_db)
+        assert User.get_by_username("admin", initialized_db) is first
+        assert User.get_by_id(first.user_id, initialized_db) is first
+
+    def test_update_password_invalidates_user_cache(self, initialized_db):
+        """Test a password change is visible to the next lookup."""
+        User.create_user(
+            username="admin",
+            email="admin@example.com",
+            password_hash=hash_password("old_password"),
+            db_path=initialized_db
+        )
+        user = User.get_by_username("admin", initialized_db)
+        new_hash = hash_password("new_password")
+
+        # Update through a separate instance so the cached object is not mutated
+        other = User(user.user_id, user.username, user.email, user.password_hash)
+        assert other.update_password(new_hash, initialized_db) is True
+
+        fetched = User.get_by_id(user.user_id, initialized_db)
+        assert fetched is not user
+        assert fetched.password_hash == new_hash
+
     def test_to_dict(self, initialized_db):
         """Test converting user to dictionary."""
         password_hash = hash_password("test_password")
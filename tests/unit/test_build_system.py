@@ -5,29 +5,48 @@ This module tests all major build system components including markdown processin
 template rendering, asset management, and atomic build operations with failure scenarios.
 """
 
+import gc
+import os
+import shutil
+import subprocess
+import sys
 import tempfile
+import threading
 import time
 from datetime import date, datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
+import microblog.builder.generator as generator_module
 from microblog.builder.asset_manager import (
     AssetManager,
     AssetManagingError,
     get_asset_manager,
 )
 from microblog.builder.generator import (
+    BUILD_GC_THRESHOLD,
+    PAGE_MANIFEST_NAME,
+    PARALLEL_MIN_TASKS,
     BuildGenerator,
     BuildPhase,
     BuildProgress,
     BuildResult,
+    ProcessedPost,
+    _begin_build_gc,
+    _end_build_gc,
+    _init_render_worker,
+    _write_page,
     get_build_generator,
+    reset_build_generator,
 )
 from microblog.builder.markdown_processor import (
+    FULL_MARKDOWN_EXTENSIONS,
     MarkdownProcessingError,
     MarkdownProcessor,
+    _get_lexer_by_name,
     get_markdown_processor,
 )
 from microblog.builder.template_renderer import (
@@ -38,6 +57,35 @@ from microblog.builder.template_renderer import (
 from microblog.content.validators import PostContent, PostFrontmatter
 
 
+class WorkerMarkdownProcessor:
+    """Markdown processor stand-in that can be sent to worker processes."""
+
+    def process_content(self, post):
+        return f"<p>{post.content}</p>"
+
+
+class WorkerTemplateRenderer:
+    """Template renderer stand-in recording the process that rendered a page."""
+
+    def preload_templates(self):
+        return 0
+
+    def render_homepage(self, posts):
+        return f"<html>home {os.getpid()}</html>"
+
+    def render_archive(self, posts):
+        return "<html>archive</html>"
+
+    def render_rss_feed(self, posts):
+        return "<rss></rss>"
+
+    def render_post(self, post, content):
+        return f"<html>post {os.getpid()}</html>"
+
+    def render_tag_page(self, tag, posts):
+        return "<html>tag</html>"
+
+
 @pytest.fixture
 def temp_content_structure():
     """Create temporary content structure for testing."""
@@ -111,6 +159,17 @@ class TestBuildProgress:
 
         assert progress.timestamp == custom_time
 
+    def test_build_progress_timestamp_from_ns(self):
+        """Test the timestamp is derived from the recorded nanosecond time."""
+        progress = BuildProgress(
+            BuildPhase.INITIALIZING,
+            "Starting",
+            timestamp_ns=1_700_000_000_123_456_789
+        )
+
+        expected = datetime.fromtimestamp(1_700_000_000).replace(microsecond=123456)
+        assert progress.timestamp == expected
+
 
 class TestBuildResult:
     """Test BuildResult data class."""
@@ -156,6 +215,48 @@ class TestMarkdownProcessor:
         assert processor.markdown_instance is not None
         assert hasattr(processor.markdown_instance, 'convert')
 
+    def test_markdown_instance_per_thread(self):
+        """Test each thread converts with its own markdown instance."""
+        processor = MarkdownProcessor()
+        instances = []
+
+        def convert(text):
+            instances.append(processor.markdown_instance)
+            return processor.process_markdown_text(text)
+
+        threads = [threading.Thread(target=convert, args=(f"# Title {i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(instance) for instance in instances}) == 4
+        assert processor.markdown_instance not in instances
+
+    def test_markdown_processor_pickles_for_worker_processes(self):
+        """Test the processor can be sent to spawned worker processes."""
+        import pickle
+
+        processor = MarkdownProcessor()
+        processor.process_markdown_text("# Before")
+
+        restored = pickle.loads(pickle.dumps(processor))
+
+        assert restored.cache_dir == processor.cache_dir
+        assert "After" in restored.process_markdown_text("# After")
+
+    def test_lexer_lookup_reuses_instances(self):
+        """Test code blocks of one language share a cached lexer."""
+        first = _get_lexer_by_name('python', stripnl=False)
+
+        assert _get_lexer_by_name('python', stripnl=False) is first
+        assert _get_lexer_by_name('python', stripnl=True) is not first
+        assert _get_lexer_by_name('python', hl_lines=[1]).name == 'Python'
+
+        processor = MarkdownProcessor()
+        html = processor.process_markdown_text("```python\nx = 1\n```")
+        assert 'class="highlight"' in html
+
     def test_process_markdown_text_basic(self):
         """Test basic markdown text processing."""
         processor = MarkdownProcessor()
@@ -190,6 +291,16 @@ def hello():
         # Check for the function name and content in the highlighted code
         assert "hello" in html and ("def" in html or "nf" in html)
 
+    def test_process_markdown_text_code_block_without_language(self):
+        """Test code blocks without a language are not run through lexer guessing."""
+        processor = MarkdownProcessor()
+
+        with patch('pymdownx.highlight.guess_lexer') as guess_lexer:
+            html = processor.process_markdown_text("```\nimport os\nx = os.getcwd()\n```\n")
+
+        guess_lexer.assert_not_called()
+        assert "<code>import os\nx = os.getcwd()\n</code>" in html
+
     def test_process_markdown_text_tables(self):
         """Test markdown table processing."""
         processor = MarkdownProcessor()
@@ -230,6 +341,32 @@ def hello():
         assert "Test Content" in html
         assert "<p>" in html
 
+    def test_process_content_reuses_cached_conversion(self, tmp_path):
+        """Test unchanged posts are served from the on-disk markdown cache."""
+        processor = MarkdownProcessor()
+        processor.cache_dir = tmp_path
+
+        post = PostContent(
+            frontmatter=PostFrontmatter(title="Cached", date=date(2023, 1, 1)),
+            content="# Cached\n\n## Section\n\nBody text."
+        )
+
+        first = processor.process_content(post)
+        toc = processor.get_toc()
+
+        fresh = MarkdownProcessor()
+        fresh.cache_dir = tmp_path
+        with patch.object(fresh.markdown_instance, 'convert') as convert:
+            second = fresh.process_content(post)
+
+        convert.assert_not_called()
+        assert second == first
+        assert fresh.get_toc() == toc
+        assert "Section" in fresh.get_toc()
+
+        post.content += "\nMore."
+        assert "More." in fresh.process_content(post)
+
     def test_process_markdown_text_error_handling(self):
         """Test error handling in markdown processing."""
         processor = MarkdownProcessor()
@@ -343,6 +480,21 @@ This is a test post."""
         assert "<h2" in html  # Due to baselevel=2 in TOC config
         assert "Test Content" in html
 
+    def test_process_file_path_matches_file_content(self, tmp_path):
+        """Test processing a file from disk, including memory-mapped large files."""
+        from microblog.utils.frontmatter import LARGE_POST_BYTES
+
+        processor = MarkdownProcessor()
+        file_content = "---\ntitle: Large Post\ndate: 2023-01-01\n---\n\n# Heading\n\n"
+        file_content += "Body text.\n" * (LARGE_POST_BYTES // 10)
+        file_path = tmp_path / "large.md"
+        file_path.write_text(file_content, encoding='utf-8')
+
+        assert processor.process_file_path(file_path) == processor.process_file_content(file_content)
+
+        with pytest.raises(MarkdownProcessingError, match="Failed to process file"):
+            processor.process_file_path(tmp_path / "missing.md")
+
     def test_process_file_content_error_handling(self):
         """Test error handling in process_file_content."""
         processor = MarkdownProcessor()
@@ -463,11 +615,24 @@ title: Test Post
 
 # Content"""
 
-        # Mock yaml.safe_load to raise a non-YAML exception
-        with patch('yaml.safe_load', side_effect=RuntimeError("Unexpected error")):
+        # Mock the YAML loader to raise a non-YAML exception
+        with patch('microblog.builder.markdown_processor.load_frontmatter', side_effect=RuntimeError("Unexpected error")):
             with pytest.raises(MarkdownProcessingError, match="Failed to parse frontmatter"):
                 processor._parse_frontmatter(file_content)
 
+    @pytest.mark.parametrize("file_content,expected", [
+        ("---\ntitle: A\n---\nBody", ("title: A", "Body")),
+        ("---  \ntitle: A\n---\t\n\nBody\n---\nMore", ("title: A", "Body\n---\nMore")),
+        ("---\na: 1\n---x\nb: 2\n---\nBody", ("a: 1\n---x\nb: 2", "Body")),
+        ("---\ntitle: A\n---", None),
+        ("title: A\n---\nBody", None),
+    ])
+    def test_split_frontmatter_matches_delimiter_rules(self, file_content, expected):
+        """Test the frontmatter scan follows the opening/closing delimiter rules."""
+        from microblog.utils.frontmatter import split_frontmatter
+
+        assert split_frontmatter(file_content) == expected
+
     def test_get_toc_available(self):
         """Test getting table of contents when available."""
         processor = MarkdownProcessor()
@@ -574,6 +739,20 @@ def test():
         assert 'class="task-list' in result or 'type="checkbox"' in result  # Task list extension
 
 
+    def test_inline_syntax_extras_are_opt_in(self):
+        """Test the inline syntax extensions only run when enabled."""
+        text = "A ==marked== word (c) and https://example.com"
+
+        default_html = MarkdownProcessor().process_markdown_text(text)
+        full = MarkdownProcessor(extensions=FULL_MARKDOWN_EXTENSIONS)
+        full_html = full.process_markdown_text(text)
+
+        assert "<mark>" not in default_html and "&copy;" not in default_html
+        assert "<mark>marked</mark>" in full_html
+        assert "&copy;" in full_html
+        assert '<a href="https://example.com"' in full_html
+        assert full._cache_fingerprint != MarkdownProcessor()._cache_fingerprint
+
 class TestTemplateRenderer:
     """Test TemplateRenderer functionality."""
 
@@ -668,6 +847,92 @@ class TestTemplateRenderer:
                 assert renderer.templates_dir == temp_templates_dir
                 assert renderer.env is not None
 
+    def test_template_bytecode_cache(self, temp_templates_dir, mock_config):
+        """Test compiled templates are written to the configured cache directory."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            mock_config.build.cache_dir = cache_dir
+
+            with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+                with patch('microblog.builder.template_renderer.get_post_service'):
+                    renderer = TemplateRenderer(temp_templates_dir)
+                    renderer.render_template('index.html', {'posts': []})
+
+                    assert renderer.env.auto_reload is True
+                    assert list((Path(cache_dir) / "jinja").glob("__jinja2_*.cache"))
+
+    def test_template_renderer_pickles_for_worker_processes(self, temp_templates_dir):
+        """Test the renderer can be sent to worker processes and renders there."""
+        import pickle
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config = SimpleNamespace(
+                site=SimpleNamespace(
+                    title="Test Blog", url="https://test.example.com",
+                    author="Test Author", description="Test Description"
+                ),
+                build=SimpleNamespace(cache_dir=cache_dir, posts_per_page=5)
+            )
+
+            with patch('microblog.builder.template_renderer.get_config', return_value=config):
+                with patch('microblog.builder.template_renderer.get_post_service'):
+                    renderer = TemplateRenderer(temp_templates_dir)
+                    renderer.preload_templates()
+
+                    restored = pickle.loads(pickle.dumps(renderer))
+
+                    assert restored.env is not renderer.env
+                    assert restored._compiled_templates == {}
+                    assert "Test Blog" in restored.render_template('index.html', {'posts': []})
+
+    def test_render_tag_page_reuses_compiled_template(self, temp_templates_dir, mock_config):
+        """Test tag pages load the tag template once per build."""
+        (temp_templates_dir / "tag.html").write_text("<h1>{{ tag }} - {{ site.title }}</h1>")
+
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+
+                with patch.object(renderer.env, 'get_template', wraps=renderer.env.get_template) as get_template:
+                    python_html = renderer.render_tag_page('python', [])
+                    web_html = renderer.render_tag_page('web', [])
+
+                assert python_html == "<h1>python - Test Blog</h1>"
+                assert web_html == "<h1>web - Test Blog</h1>"
+                get_template.assert_called_once_with('tag.html')
+
+    def test_reload_templates_picks_up_edits(self, temp_templates_dir, mock_config):
+        """Test edited templates are used once the loaded templates are forgotten."""
+        tag_template = temp_templates_dir / "tag.html"
+        tag_template.write_text("<h1>{{ tag }}</h1>")
+
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+                assert renderer.render_tag_page('python', []) == "<h1>python</h1>"
+
+                tag_template.write_text("<h2>{{ tag }}</h2>")
+                os.utime(tag_template, ns=(time.time_ns() + 10**9,) * 2)
+                renderer.reload_templates()
+
+                assert renderer.render_tag_page('python', []) == "<h2>python</h2>"
+
+    def test_preload_templates(self, temp_templates_dir, mock_config):
+        """Test page templates are compiled up front and server templates skipped."""
+        (temp_templates_dir / "dashboard").mkdir()
+        (temp_templates_dir / "dashboard" / "posts.html").write_text("<h1>Posts</h1>")
+        (temp_templates_dir / "notes.txt").write_text("not a template")
+
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+
+                assert renderer.preload_templates() == 4
+                assert sorted(renderer._compiled_templates) == ['archive.html', 'index.html', 'post.html', 'rss.xml']
+
+                with patch.object(renderer.env, 'get_template') as get_template:
+                    renderer.render_archive([])
+                get_template.assert_not_called()
+
     def test_render_template_basic(self, temp_templates_dir, mock_config):
         """Test basic template rendering."""
         with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
@@ -717,10 +982,55 @@ class TestTemplateRenderer:
                 assert html_content in html
                 assert "January 01, 2023" in html
 
+    def test_render_post_cache_key(self, temp_templates_dir, mock_config):
+        """Test post pages are cached under a key of their frontmatter and HTML."""
+        from microblog.utils.cache import TemplateCache
+
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+                renderer.template_cache = TemplateCache()
+
+                post = PostContent(
+                    frontmatter=PostFrontmatter(title="Cached Post", date=date(2023, 1, 1)),
+                    content="Body"
+                )
+
+                with patch.object(renderer.template_cache, '_get_cache_key',
+                                  wraps=renderer.template_cache._get_cache_key) as get_cache_key:
+                    first = renderer.render_post(post, "<p>Body</p>")
+                    assert renderer.render_post(post, "<p>Body</p>") == first
+
+                for call in get_cache_key.call_args_list:
+                    assert call.args[2] is not None
+                assert renderer.template_cache.rendered_cache.stats.hits == 1
+
+                post.frontmatter.title = "Renamed Post"
+                assert "Renamed Post" in renderer.render_post(post, "<p>Body</p>")
+                assert "<p>Edited</p>" in renderer.render_post(post, "<p>Edited</p>")
+
+    def test_render_post_reuses_compiled_template(self, temp_templates_dir, mock_config):
+        """Test post pages load the post template once per build."""
+
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+                posts = [
+                    PostContent(frontmatter=PostFrontmatter(title=f"Post {i}", date=date(2023, 1, i + 1)), content="Body")
+                    for i in range(3)
+                ]
+
+                with patch.object(renderer.env, 'get_template', wraps=renderer.env.get_template) as get_template:
+                    pages = [renderer.render_post(post, f"<p>Body {i}</p>") for i, post in enumerate(posts)]
+
+                get_template.assert_called_once_with('post.html')
+                assert all(f"Post {i}" in page and f"<p>Body {i}</p>" in page for i, page in enumerate(pages))
+                assert "page_type" not in renderer._get_base_context()
+
     def test_render_archive(self, temp_templates_dir, mock_config):
         """Test archive page rendering."""
         mock_post_service = Mock()
-        mock_post_service.get_published_posts.return_value = []
+        mock_post_service.get_posts_by_year.return_value = {}
 
         with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
             with patch('microblog.builder.template_renderer.get_post_service', return_value=mock_post_service):
@@ -746,6 +1056,74 @@ class TestTemplateRenderer:
                 assert "<rss version" in xml
                 assert "Test Blog" in xml
 
+    def test_render_rss_feed_uses_post_pub_date(self, temp_templates_dir, mock_config):
+        """Test feed items get their publication date straight from the posts."""
+        post = PostContent(
+            frontmatter=PostFrontmatter(title="Dated", date=date(2023, 1, 2)),
+            content="Body"
+        )
+
+        assert post.pub_date == datetime(2023, 1, 2, 0, 0)
+
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+
+                xml = renderer.render_rss_feed([post])
+
+                assert "<pubDate>Mon, 02 Jan 2023 00:00:00 +0000</pubDate>" in xml
+
+    def test_render_rss_feed_escapes_user_text(self, mock_config):
+        """Test the project feed template escapes titles, descriptions and tags."""
+        import xml.etree.ElementTree as ET
+
+        from microblog.utils import get_templates_dir
+
+        mock_config.site.author = 'Ann & "Bob"'
+        post = PostContent(
+            frontmatter=PostFrontmatter(
+                title="Fish & <Chips>",
+                date=date(2023, 1, 2),
+                tags=["c&c"],
+                description="1 < 2",
+            ),
+            content="Body"
+        )
+
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(get_templates_dir())
+
+                xml = renderer.render_rss_feed([post])
+
+        item = ET.fromstring(xml).find('channel/item')
+        assert item.findtext('title') == "Fish & <Chips>"
+        assert item.findtext('description') == "1 < 2"
+        assert item.findtext('category') == "c&c"
+        assert item.findtext('author') == 'Ann & "Bob"'
+
+    def test_get_all_tags_cached_until_posts_change(self, temp_templates_dir, mock_config):
+        """Test the tag list is only rebuilt when the post generation moves."""
+        mock_post_service = Mock()
+        mock_post_service.generation.return_value = 1
+        mock_post_service.get_published_posts.return_value = [
+            SimpleNamespace(frontmatter=SimpleNamespace(tags=["Python", "web"])),
+            SimpleNamespace(frontmatter=SimpleNamespace(tags=["python"])),
+        ]
+
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service', return_value=mock_post_service):
+                renderer = TemplateRenderer(temp_templates_dir)
+
+                assert renderer.get_all_tags() == ["python", "web"]
+                renderer.get_all_tags().append("mutated")
+                assert renderer.get_all_tags() == ["python", "web"]
+                assert mock_post_service.get_published_posts.call_count == 1
+
+                mock_post_service.generation.return_value = 2
+                mock_post_service.get_published_posts.return_value = []
+                assert renderer.get_all_tags() == []
+
     def test_validate_template_valid(self, temp_templates_dir, mock_config):
         """Test template validation for valid template."""
         with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
@@ -817,6 +1195,21 @@ class TestTemplateRenderer:
                 assert "25 Dec 2023" in rfc_formatted
                 assert "15:30:45" in rfc_formatted
 
+    def test_rfc2822_filter_dates_and_offsets(self, temp_templates_dir, mock_config):
+        """Test RFC2822 formatting of plain dates, naive and aware datetimes."""
+        from datetime import timedelta, timezone
+
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+
+                assert renderer._format_rfc2822(date(2024, 2, 29)) == "Thu, 29 Feb 2024 00:00:00 +0000"
+                assert renderer._format_rfc2822(datetime(2023, 12, 25, 15, 30, 45)) == "Mon, 25 Dec 2023 15:30:45 +0000"
+
+                aware = datetime(2023, 7, 1, 8, 5, 9, tzinfo=timezone(timedelta(hours=-5, minutes=-30)))
+                assert renderer._format_rfc2822(aware) == aware.strftime('%a, %d %b %Y %H:%M:%S %z')
+                assert renderer._format_rfc2822(aware).endswith(" -0530")
+
     def test_create_excerpt_no_truncation(self, temp_templates_dir, mock_config):
         """Test excerpt creation with short content."""
         with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
@@ -844,6 +1237,38 @@ class TestTemplateRenderer:
                 assert "bold" in excerpt
                 assert "links" in excerpt
 
+    def test_create_excerpt_long_content_ignores_tail(self, temp_templates_dir, mock_config):
+        """Test long content is excerpted from its start without cutting into tags."""
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+
+                # The scan window ends inside the link tag, and the markup
+                # leaves fewer plain-text characters than the window holds
+                head = "<p>" + "<em>word</em> " * 3 + "<a href='" + "x" * 40 + "'>link</a></p>"
+                long_content = head + "<p>" + "tail " * 1000 + "</p>"
+
+                excerpt = renderer._create_excerpt(long_content, 20)
+
+                assert excerpt == "word word word link..."
+                assert "href" not in renderer._create_excerpt(long_content, 30)
+
+    def test_create_excerpt_memoized_across_renders(self, temp_templates_dir, mock_config):
+        """Test excerpting the same content again reuses the earlier result."""
+        from microblog.builder.template_renderer import _create_excerpt
+
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+                content = "<p>Shared between the homepage and tag pages.</p>"
+
+                first = renderer._create_excerpt(content, 20)
+                hits = _create_excerpt.cache_info().hits
+                second = renderer._create_excerpt(content, 20)
+
+                assert second == first
+                assert _create_excerpt.cache_info().hits == hits + 1
+
     def test_render_homepage_with_posts(self, temp_templates_dir, mock_config):
         """Test homepage rendering with posts."""
         # Use mock objects instead of real PostContent to avoid computed_slug issues
@@ -882,7 +1307,7 @@ class TestTemplateRenderer:
     def test_render_archive_error_handling(self, temp_templates_dir, mock_config):
         """Test archive rendering error handling."""
         mock_post_service = Mock()
-        mock_post_service.get_published_posts.side_effect = Exception("Service error")
+        mock_post_service.get_posts_by_year.side_effect = Exception("Service error")
 
         with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
             with patch('microblog.builder.template_renderer.get_post_service', return_value=mock_post_service):
@@ -976,6 +1401,35 @@ class TestTemplateRenderer:
                 assert context['site']['description'] == "Test Description"
                 assert 'current_year' in context  # This is what's actually in the context
 
+    def test_base_context_built_once(self, temp_templates_dir, mock_config):
+        """Test renders share the base context without modifying it."""
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+                base_context = renderer._get_base_context()
+                base_copy = dict(base_context)
+
+                renderer.render_template('index.html', {'posts': [], 'site': {'title': 'Override'}})
+                renderer.render_archive([])
+
+                assert renderer._get_base_context() is base_context
+                assert base_context == base_copy
+
+    def test_base_context_follows_year_change(self, temp_templates_dir, mock_config):
+        """Test a long-lived renderer picks up the new year."""
+        with patch('microblog.builder.template_renderer.get_config', return_value=mock_config):
+            with patch('microblog.builder.template_renderer.get_post_service'):
+                renderer = TemplateRenderer(temp_templates_dir)
+                year = renderer._get_base_context()['current_year']
+
+                with patch('microblog.builder.template_renderer.datetime') as mock_datetime:
+                    mock_datetime.now.return_value = datetime(year + 1, 1, 1)
+                    context = renderer._get_base_context()
+
+                assert context['current_year'] == year + 1
+                assert context['site']['title'] == "Test Blog"
+                assert renderer._post_page_context['current_year'] == year + 1
+
     def test_template_render_with_template_error(self, temp_templates_dir, mock_config):
         """Test template rendering when template has errors."""
         # Create a template with syntax errors
@@ -1017,7 +1471,7 @@ class TestAssetManager:
 
                     assert manager.content_dir == temp_content_structure['content']
                     assert manager.static_dir == temp_content_structure['static']
-                    assert len(manager.allowed_extensions) > 0
+                    assert len(manager.ALLOWED_EXTENSIONS) > 0
 
     def test_validate_file_valid_image(self, mock_config, temp_content_structure):
         """Test file validation for valid image file."""
@@ -1031,6 +1485,20 @@ class TestAssetManager:
 
                     assert is_valid is True
 
+    def test_validate_file_uses_known_stat(self, mock_config, temp_content_structure):
+        """Test file validation reuses a stat result the caller already has."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+
+                    image_file = temp_content_structure['content'] / "images" / "test.jpg"
+                    file_stat = image_file.stat()
+                    missing_file = image_file.with_name("missing.jpg")
+
+                    assert manager.validate_file(missing_file, file_stat) is True
+                    assert manager.validate_file(missing_file) is False
+
     def test_validate_file_invalid_extension(self, mock_config, temp_content_structure):
         """Test file validation for invalid file extension."""
         with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
@@ -1070,6 +1538,41 @@ class TestAssetManager:
                     assert success is True
                     assert dest_file.exists()
                     assert dest_file.read_bytes() == source_file.read_bytes()
+                    assert dest_file.stat().st_mtime_ns == source_file.stat().st_mtime_ns
+                    assert manager.needs_update(source_file, dest_file) is False
+
+    def test_copy_file_validates_with_known_stat(self, mock_config, temp_content_structure):
+        """Test file copying hands its known source stat to validation."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+
+                    source_file = temp_content_structure['content'] / "images" / "test.jpg"
+                    dest_file = temp_content_structure['build'] / "images" / "test.jpg"
+                    source_stat = source_file.stat()
+
+                    with patch.object(manager, 'validate_file', wraps=manager.validate_file) as validate:
+                        assert manager.copy_file(source_file, dest_file, source_stat) is True
+
+                    validate.assert_called_once_with(source_file, source_stat)
+
+    def test_copy_file_falls_back_when_copy_file_range_fails(self, mock_config, temp_content_structure):
+        """Test copying falls back to shutil.copyfile when copy_file_range is refused."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+
+                    source_file = temp_content_structure['content'] / "images" / "test.jpg"
+                    dest_file = temp_content_structure['build'] / "images" / "test.jpg"
+
+                    with patch('microblog.builder.asset_manager.os.copy_file_range',
+                               side_effect=OSError(18, "Invalid cross-device link"), create=True):
+                        success = manager.copy_file(source_file, dest_file)
+
+                    assert success is True
+                    assert dest_file.read_bytes() == source_file.read_bytes()
 
     def test_copy_file_invalid_source(self, mock_config, temp_content_structure):
         """Test copying invalid source file."""
@@ -1154,7 +1657,7 @@ class TestAssetManager:
                     hash2 = manager.calculate_file_hash(test_file)
 
                     assert hash1 == hash2
-                    assert len(hash1) == 32  # MD5 hash length
+                    assert len(hash1) == 32  # 16-byte BLAKE2b digest
 
     def test_get_asset_info(self, mock_config, temp_content_structure):
         """Test getting asset information."""
@@ -1170,6 +1673,30 @@ class TestAssetManager:
                     assert 'total_size' in info
                     assert info['total_files'] >= 3  # At least 3 valid files
 
+    def test_directory_scan_reused_until_directory_changes(self, mock_config, temp_content_structure):
+        """Test directory listings are cached and invalidated by directory mtime."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+                    images_dir = temp_content_structure['content'] / "images"
+
+                    first_info = manager.get_asset_info()
+
+                    with patch('microblog.builder.asset_manager.os.scandir') as mock_scandir:
+                        second_info = manager.get_asset_info()
+                        mock_scandir.assert_not_called()
+
+                    assert second_info == first_info
+
+                    import os
+                    (images_dir / "new.gif").write_bytes(b"gif data")
+                    mtime_ns = images_dir.stat().st_mtime_ns + 1_000_000
+                    os.utime(images_dir, ns=(mtime_ns, mtime_ns))
+
+                    third_info = manager.get_asset_info()
+                    assert third_info['total_files'] == first_info['total_files'] + 1
+
     def test_validate_file_non_existent(self, mock_config, temp_content_structure):
         """Test file validation for non-existent file."""
         with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
@@ -1195,22 +1722,39 @@ class TestAssetManager:
 
                     assert is_valid is False
 
-    def test_validate_file_mime_type_executable(self, mock_config, temp_content_structure):
-        """Test file validation for executable MIME type."""
+    def test_validate_file_suspicious_name_components(self, mock_config, temp_content_structure):
+        """Test suspicious names are matched as name components, case-insensitively."""
         with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
             with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
                 with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
                     manager = AssetManager()
 
-                    # Create a file with executable extension that might be allowed but has bad MIME type
-                    exec_file = temp_content_structure['content'] / "images" / "test.zip"
-                    exec_file.write_bytes(b"fake executable content")
+                    images_dir = temp_content_structure['content'] / "images"
+                    for name in ("prod.env.json", "WEB.CONFIG.xml", "config.ini.txt", "site.htaccess.txt", "environment.txt"):
+                        (images_dir / name).write_text("config")
 
-                    # Mock mimetypes to return executable MIME type
-                    with patch('mimetypes.guess_type', return_value=('application/x-executable', None)):
-                        is_valid = manager.validate_file(exec_file)
+                    assert manager.validate_file(images_dir / "prod.env.json") is False
+                    assert manager.validate_file(images_dir / "WEB.CONFIG.xml") is False
+                    assert manager.validate_file(images_dir / "config.ini.txt") is False
+                    assert manager.validate_file(images_dir / "site.htaccess.txt") is False
+                    assert manager.validate_file(images_dir / "environment.txt") is True
 
-                    assert is_valid is False
+    def test_validate_file_rejects_extension_without_stat(self, mock_config, temp_content_structure):
+        """Test disallowed extensions are rejected from the name alone."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+
+                    images_dir = temp_content_structure['content'] / "images"
+                    with patch.object(Path, 'stat') as mock_stat:
+                        assert manager.validate_file(images_dir / "test.exe") is False
+                        assert manager.validate_file(images_dir / ".jpg") is False
+                        assert manager.validate_file(images_dir / "test.") is False
+                    mock_stat.assert_not_called()
+
+                    (images_dir / "PHOTO.JPG").write_bytes(b"fake image data")
+                    assert manager.validate_file(images_dir / "PHOTO.JPG") is True
 
     def test_validate_file_exception_handling(self, mock_config, temp_content_structure):
         """Test file validation exception handling."""
@@ -1221,8 +1765,8 @@ class TestAssetManager:
 
                     valid_file = temp_content_structure['content'] / "images" / "test.jpg"
 
-                    # Mock file.is_file() to raise an exception
-                    with patch.object(Path, 'is_file', side_effect=OSError("Permission denied")):
+                    # Mock file.stat() to raise an exception
+                    with patch.object(Path, 'stat', side_effect=OSError("Permission denied")):
                         is_valid = manager.validate_file(valid_file)
 
                     assert is_valid is False
@@ -1282,6 +1826,27 @@ class TestAssetManager:
 
                     assert needs_update is True
 
+    def test_needs_update_exact_mtime(self, mock_config, temp_content_structure):
+        """Test needs_update compares nanosecond mtimes without a fuzzy window."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+
+                    source_file = temp_content_structure['content'] / "images" / "test.jpg"
+                    dest_file = temp_content_structure['build'] / "images" / "test.jpg"
+                    dest_file.parent.mkdir(parents=True, exist_ok=True)
+                    dest_file.write_bytes(source_file.read_bytes())
+
+                    import os
+                    source_mtime_ns = source_file.stat().st_mtime_ns
+                    os.utime(dest_file, ns=(source_mtime_ns, source_mtime_ns))
+                    assert manager.needs_update(source_file, dest_file) is False
+
+                    # A sub-second change with the same size is still detected
+                    os.utime(dest_file, ns=(source_mtime_ns, source_mtime_ns - 1000))
+                    assert manager.needs_update(source_file, dest_file) is True
+
     def test_copy_file_exception_handling(self, mock_config, temp_content_structure):
         """Test copy_file exception handling."""
         with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
@@ -1292,12 +1857,29 @@ class TestAssetManager:
                     source_file = temp_content_structure['content'] / "images" / "test.jpg"
                     dest_file = temp_content_structure['build'] / "images" / "test.jpg"
 
-                    # Mock shutil.copy2 to raise an exception
-                    with patch('shutil.copy2', side_effect=OSError("Copy failed")):
+                    # Mock the content copy to raise an exception
+                    with patch('microblog.builder.asset_manager._copy_file_contents', side_effect=OSError("Copy failed")):
                         success = manager.copy_file(source_file, dest_file)
 
                     assert success is False
 
+    def test_copy_directory_assets_creates_each_parent_once(self, mock_config, temp_content_structure):
+        """Test destination directories are created once per parent, not per file."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+
+                    source_dir = temp_content_structure['content'] / "images"
+                    dest_dir = temp_content_structure['build'] / "images"
+
+                    with patch('microblog.builder.asset_manager.ensure_directory') as mock_ensure:
+                        mock_ensure.side_effect = lambda path: path.mkdir(parents=True, exist_ok=True)
+                        successful, _ = manager.copy_directory_assets(source_dir, dest_dir)
+
+                    assert successful == 2
+                    mock_ensure.assert_called_once_with(dest_dir)
+
     def test_copy_directory_assets_nonexistent_source(self, mock_config, temp_content_structure):
         """Test copying from non-existent source directory."""
         with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
@@ -1323,13 +1905,115 @@ class TestAssetManager:
                     source_dir = temp_content_structure['content'] / "images"
                     dest_dir = temp_content_structure['build'] / "images"
 
-                    # Mock rglob to raise an exception
-                    with patch.object(Path, 'rglob', side_effect=OSError("Permission denied")):
+                    # Mock scandir to raise an exception
+                    with patch('microblog.builder.asset_manager.os.scandir', side_effect=OSError("Permission denied")):
                         successful, failed = manager.copy_directory_assets(source_dir, dest_dir)
 
                     assert successful == 0
                     assert failed == 1
 
+    def test_copy_all_assets_success(self, mock_config, temp_content_structure):
+        """Test copy_all_assets copies every mapping and reports per-mapping counts."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+                    manager.build_dir = temp_content_structure['build']
+                    for mapping in manager.asset_mappings:
+                        mapping['destination'] = manager.build_dir / mapping['destination'].name
+
+                    (temp_content_structure['content'] / "images" / "test.exe").unlink()
+                    (temp_content_structure['content'] / "images" / ".htaccess").unlink()
+
+                    results = manager.copy_all_assets()
+
+                    assert results['total_successful'] == 4
+                    assert results['total_failed'] == 0
+                    assert [m['successful'] for m in results['mappings']] == [2, 1, 1, 0]
+                    assert (manager.build_dir / "images" / "test.jpg").exists()
+                    assert (manager.build_dir / "css" / "style.css").exists()
+                    assert (manager.build_dir / "js" / "script.js").exists()
+
+    def test_copy_all_assets_skips_unchanged_sources(self, mock_config, temp_content_structure):
+        """Test a repeated copy is skipped via the manifest until a source changes."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+                    manager.build_dir = temp_content_structure['build']
+                    for mapping in manager.asset_mappings:
+                        mapping['destination'] = manager.build_dir / mapping['destination'].name
+
+                    (temp_content_structure['content'] / "images" / "test.exe").unlink()
+                    (temp_content_structure['content'] / "images" / ".htaccess").unlink()
+
+                    first = manager.copy_all_assets()
+                    assert (manager.build_dir / ".asset-manifest.json").exists()
+
+                    with patch.object(manager, 'copy_file') as mock_copy:
+                        second = manager.copy_all_assets()
+                    mock_copy.assert_not_called()
+                    assert second == first
+
+                    (temp_content_structure['static'] / "css" / "style.css").write_text("body { color: blue; }")
+                    with patch.object(manager, 'copy_file', return_value=True) as mock_copy:
+                        manager.copy_all_assets()
+                    assert mock_copy.call_count == 4
+
+    def test_copy_all_assets_restores_deleted_output(self, mock_config, temp_content_structure):
+        """Test an asset removed from the build directory is copied again."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+                    manager.build_dir = temp_content_structure['build']
+                    for mapping in manager.asset_mappings:
+                        mapping['destination'] = manager.build_dir / mapping['destination'].name
+
+                    (temp_content_structure['content'] / "images" / "test.exe").unlink()
+                    (temp_content_structure['content'] / "images" / ".htaccess").unlink()
+
+                    first = manager.copy_all_assets()
+                    deleted = manager.build_dir / "css" / "style.css"
+                    deleted.unlink()
+
+                    with patch.object(manager, 'copy_file', wraps=manager.copy_file) as mock_copy:
+                        second = manager.copy_all_assets()
+                    assert mock_copy.call_count == 1
+                    assert second == first
+                    assert deleted.exists()
+
+    def test_copy_all_assets_links_unchanged_from_previous_build(self, mock_config, temp_content_structure):
+        """Test unchanged assets are hard-linked from a previous build moved aside."""
+        with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
+            with patch('microblog.builder.asset_manager.get_content_dir', return_value=temp_content_structure['content']):
+                with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
+                    manager = AssetManager()
+                    manager.build_dir = temp_content_structure['build']
+                    for mapping in manager.asset_mappings:
+                        mapping['destination'] = manager.build_dir / mapping['destination'].name
+
+                    (temp_content_structure['content'] / "images" / "test.exe").unlink()
+                    (temp_content_structure['content'] / "images" / ".htaccess").unlink()
+
+                    first = manager.copy_all_assets()
+                    previous_dir = manager.build_dir.with_name("previous")
+                    manager.build_dir.rename(previous_dir)
+
+                    with patch.object(manager, 'copy_file') as mock_copy:
+                        second = manager.copy_all_assets(previous_dir)
+                    mock_copy.assert_not_called()
+                    assert second == first
+                    linked = manager.build_dir / "css" / "style.css"
+                    assert linked.stat().st_ino == (previous_dir / "css" / "style.css").stat().st_ino
+                    assert (manager.build_dir / ".asset-manifest.json").exists()
+
+                    shutil.rmtree(manager.build_dir)
+                    (temp_content_structure['static'] / "css" / "style.css").write_text("body { color: blue; }")
+                    with patch.object(manager, 'copy_file', return_value=True) as mock_copy:
+                        manager.copy_all_assets(previous_dir)
+                    assert mock_copy.call_count == 4
+
     def test_copy_all_assets_with_failures(self, mock_config, temp_content_structure):
         """Test copy_all_assets with some failures."""
         with patch('microblog.builder.asset_manager.get_config', return_value=mock_config):
@@ -1337,13 +2021,11 @@ class TestAssetManager:
                 with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
                     manager = AssetManager()
 
-                    # Mock copy_directory_assets to return some failures
-                    def mock_copy_directory_assets(source_dir, dest_dir):
-                        if 'images' in str(source_dir):
-                            return 1, 2  # 1 success, 2 failures
-                        return 0, 0
+                    # Mock copy_file to fail for some files
+                    def mock_copy_file(source_path, dest_path, source_stat=None, ensure_parent=True):
+                        return source_path.suffix != '.png'
 
-                    with patch.object(manager, 'copy_directory_assets', side_effect=mock_copy_directory_assets):
+                    with patch.object(manager, 'copy_file', side_effect=mock_copy_file):
                         with pytest.raises(AssetManagingError, match="Failed to copy"):
                             manager.copy_all_assets()
 
@@ -1354,8 +2036,8 @@ class TestAssetManager:
                 with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
                     manager = AssetManager()
 
-                    # Mock copy_directory_assets to raise an exception
-                    with patch.object(manager, 'copy_directory_assets', side_effect=OSError("Disk full")):
+                    # Mock the executor to raise an exception
+                    with patch('microblog.builder.asset_manager.ThreadPoolExecutor', side_effect=OSError("Disk full")):
                         with pytest.raises(AssetManagingError, match="Asset copying failed"):
                             manager.copy_all_assets()
 
@@ -1408,8 +2090,8 @@ class TestAssetManager:
                 with patch('microblog.builder.asset_manager.get_static_dir', return_value=temp_content_structure['static']):
                     manager = AssetManager()
 
-                    # Mock rglob to raise an exception during info gathering
-                    with patch.object(Path, 'rglob', side_effect=OSError("Permission denied")):
+                    # Mock scandir to raise an exception during info gathering
+                    with patch('microblog.builder.asset_manager.os.scandir', side_effect=OSError("Permission denied")):
                         info = manager.get_asset_info()
 
                     # Should return empty info but not crash
@@ -1440,6 +2122,7 @@ class TestBuildGenerator:
         mock_template_renderer.templates_dir = temp_content_structure['static'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
         mock_asset_manager.copy_all_assets.return_value = {
             'total_successful': 5,
             'total_failed': 0,
@@ -1497,6 +2180,32 @@ class TestBuildGenerator:
                             # Check callback was called
                             progress_callback.assert_called_once()
 
+    def test_report_progress_throttles_small_steps(self, mock_dependencies):
+        """Test small progress steps within a phase are recorded but not all reported."""
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=mock_dependencies['markdown_processor']):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=mock_dependencies['template_renderer']):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            progress_callback = Mock()
+                            generator = BuildGenerator(progress_callback)
+
+                            with patch('microblog.builder.generator.time.monotonic', return_value=100.0):
+                                for i in range(1, 1001):
+                                    generator._report_progress(
+                                        BuildPhase.CONTENT_PROCESSING,
+                                        f"Processed {i}/1000 posts",
+                                        i / 10
+                                    )
+                                generator._report_progress(BuildPhase.TEMPLATE_RENDERING, "Rendered homepage", 10)
+
+                            assert len(generator.progress_history) == 1001
+                            reported = [c.args[0] for c in progress_callback.call_args_list]
+                            assert len(reported) < 200
+                            assert reported[-2].percentage == 100
+                            assert reported[-1].phase == BuildPhase.TEMPLATE_RENDERING
+
     def test_validate_build_preconditions_success(self, mock_dependencies):
         """Test successful build preconditions validation."""
         with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
@@ -1527,6 +2236,28 @@ class TestBuildGenerator:
 
                             assert is_valid is False
 
+    def test_validate_build_preconditions_lists_templates_once(self, mock_dependencies):
+        """Test required templates are checked against one listing without compiling them."""
+        mock_dependencies['config'].build.strict_validation = False
+        renderer = mock_dependencies['template_renderer']
+        renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html']
+
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=mock_dependencies['markdown_processor']):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=renderer):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            generator = BuildGenerator()
+
+                            assert generator._validate_build_preconditions() is False
+
+                            renderer.env.list_templates.return_value.append('rss.xml')
+                            assert generator._validate_build_preconditions() is True
+
+                            assert renderer.env.list_templates.call_count == 2
+                            renderer.validate_template.assert_not_called()
+
     def test_create_backup_success(self, mock_dependencies, temp_content_structure):
         """Test successful backup creation."""
         with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
@@ -1548,6 +2279,36 @@ class TestBuildGenerator:
                             assert generator.backup_dir.exists()
                             assert (generator.backup_dir / "test.html").exists()
 
+    def test_create_backup_replaces_old_backup(self, mock_dependencies, temp_content_structure):
+        """Test an old backup is renamed away and deleted in the background."""
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=mock_dependencies['markdown_processor']):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=mock_dependencies['template_renderer']):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            generator = BuildGenerator()
+
+                            generator.backup_dir.mkdir(parents=True)
+                            (generator.backup_dir / "old.html").write_text("old backup")
+                            generator.build_dir.mkdir(parents=True)
+                            (generator.build_dir / "test.html").write_text("test content")
+
+                            with patch('microblog.builder.generator.shutil.move') as mock_move:
+                                success = generator._create_backup()
+                            mock_move.assert_not_called()
+
+                            for thread in threading.enumerate():
+                                if thread.name.startswith("discard-"):
+                                    thread.join(timeout=10)
+
+                            assert success is True
+                            assert (generator.backup_dir / "test.html").exists()
+                            assert not (generator.backup_dir / "old.html").exists()
+                            assert list(generator.build_dir.iterdir()) == []
+                            leftovers = list(generator.backup_dir.parent.glob(f"{generator.backup_dir.name}.old.*"))
+                            assert leftovers == []
+
     def test_rollback_from_backup_success(self, mock_dependencies, temp_content_structure):
         """Test successful rollback from backup."""
         with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
@@ -1573,6 +2334,308 @@ class TestBuildGenerator:
                             assert (generator.build_dir / "backup.html").exists()
                             assert not generator.backup_dir.exists()
 
+    @pytest.mark.parametrize("files,expected", [
+        (["index.html", "archive.html", "rss.xml"], True),
+        (["index.html", "archive.html"], False),
+    ])
+    def test_verify_build_integrity_required_files(self, mock_dependencies, files, expected):
+        """Test build verification requires the homepage, archive and RSS feed."""
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=mock_dependencies['markdown_processor']):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=mock_dependencies['template_renderer']):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            generator = BuildGenerator()
+                            (generator.build_dir / "posts").mkdir(parents=True)
+                            (generator.build_dir / "posts" / "first.html").write_text("<html>post</html>")
+                            for name in files:
+                                (generator.build_dir / name).write_text("<html>page</html>")
+
+                            assert generator._verify_build_integrity() is expected
+
+    def test_write_page_round_trips_unicode(self, temp_content_structure):
+        """Test pages are written as UTF-8 through the unbuffered writer."""
+        page = temp_content_structure['build'] / "page.html"
+        page.parent.mkdir(parents=True, exist_ok=True)
+        content = "<p>Caf\u00e9 \u2014 \U0001F600</p>" * 1000
+
+        _write_page(page, content)
+
+        assert page.read_text(encoding='utf-8') == content
+
+    def test_write_page_continues_after_short_writes(self, temp_content_structure):
+        """Test a page is written completely when os.write writes partially."""
+        page = temp_content_structure['build'] / "rss.xml"
+        page.parent.mkdir(parents=True, exist_ok=True)
+        content = "<item>entry</item>" * 100
+        real_write = os.write
+
+        with patch('microblog.builder.generator.os.write', side_effect=lambda fd, data: real_write(fd, data[:7])):
+            _write_page(page, content)
+
+        assert page.read_text(encoding='utf-8') == content
+
+    def test_rebuild_links_unchanged_pages_from_previous_build(self, mock_dependencies):
+        """Test pages identical to the previous build are hard-linked instead of rewritten."""
+        renderer = mock_dependencies['template_renderer']
+        renderer.render_homepage.return_value = "<html>home</html>"
+        renderer.render_archive.return_value = "<html>archive</html>"
+        renderer.render_rss_feed.return_value = "<rss></rss>"
+        renderer.render_post.return_value = "<html>post</html>"
+        post = SimpleNamespace(computed_slug="first", frontmatter=SimpleNamespace(title="First", tags=[]))
+        processed_posts = [ProcessedPost(post, "<p></p>")]
+
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=mock_dependencies['markdown_processor']):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=renderer):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            generator = BuildGenerator()
+                            generator.build_dir.mkdir(parents=True)
+                            generator._render_templates(processed_posts)
+                            generator._save_page_manifest()
+
+                            assert generator._create_backup()
+                            renderer.render_archive.return_value = "<html>new archive</html>"
+                            with generator._reusing_previous_pages():
+                                generator._render_templates(processed_posts)
+
+                            def same_file(page):
+                                return os.path.samefile(generator.build_dir / page, generator.backup_dir / page)
+
+                            assert same_file("index.html")
+                            assert same_file("posts/first.html")
+                            assert not same_file("archive.html")
+                            assert (generator.build_dir / "archive.html").read_text() == "<html>new archive</html>"
+
+    def test_previous_pages_are_kept_per_generator(self, mock_dependencies):
+        """Test a build ending does not drop the previous pages of another one."""
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=mock_dependencies['markdown_processor']):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=mock_dependencies['template_renderer']):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            first = BuildGenerator()
+                            second = BuildGenerator()
+                            first.backup_dir.mkdir(parents=True)
+                            (first.backup_dir / PAGE_MANIFEST_NAME).write_text('{"index.html": "digest"}')
+
+                            with first._reusing_previous_pages():
+                                with second._reusing_previous_pages():
+                                    pass
+
+                                assert first._previous_pages is not None
+                                assert first._previous_pages[2] == {'index.html': "digest"}
+
+                            assert first._previous_pages is None
+
+    def test_render_templates_indexes_tags_in_one_pass(self, mock_dependencies):
+        """Test tag pages get the posts carrying each tag, matched case-insensitively."""
+        renderer = mock_dependencies['template_renderer']
+        renderer.render_homepage.return_value = "<html>home</html>"
+        renderer.render_archive.return_value = "<html>archive</html>"
+        renderer.render_rss_feed.return_value = "<rss></rss>"
+        renderer.render_post.return_value = "<html>post</html>"
+        renderer.render_tag_page.return_value = "<html>tag</html>"
+
+        def make_post(slug, tags):
+            return SimpleNamespace(computed_slug=slug, frontmatter=SimpleNamespace(title=slug, tags=tags))
+
+        first = make_post("first", ["Python", "python", "Web"])
+        second = make_post("second", ["web"])
+        processed_posts = [ProcessedPost(p, "<p></p>") for p in (first, second)]
+
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=mock_dependencies['markdown_processor']):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=renderer):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            generator = BuildGenerator()
+                            generator.build_dir.mkdir(parents=True)
+
+                            stats = generator._render_templates(processed_posts)
+
+                            assert "tags/python.html" in stats['rendered_pages']
+                            assert "tags/web.html" in stats['rendered_pages']
+                            tag_calls = {c.args[0]: c.args[1] for c in renderer.render_tag_page.call_args_list}
+                            assert tag_calls == {'python': [first], 'web': [first, second]}
+                            renderer.get_all_tags.assert_not_called()
+
+    @pytest.mark.parametrize("post_count", [3, PARALLEL_MIN_TASKS])
+    def test_process_content_converts_every_post_in_order(self, mock_dependencies, post_count):
+        """Test every post is converted, in order, with and without worker processes."""
+        mock_dependencies['config'].performance.enable_parallel_processing = True
+        mock_dependencies['config'].performance.max_parallel_workers = 2
+        posts = [
+            SimpleNamespace(content=f"post {i}", frontmatter=SimpleNamespace(title=f"Post {i}"))
+            for i in range(post_count)
+        ]
+        mock_dependencies['post_service'].get_published_posts.return_value = posts
+
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=WorkerMarkdownProcessor()):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=mock_dependencies['template_renderer']):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            generator = BuildGenerator()
+
+                            processed_posts, stats = generator._process_content()
+
+                            assert [pp.html for pp in processed_posts] == [
+                                f"<p>post {i}</p>" for i in range(post_count)
+                            ]
+                            assert stats['processed_posts'] == post_count
+                            assert stats['parallel_processing'] is (post_count >= PARALLEL_MIN_TASKS)
+
+    def test_render_templates_in_worker_processes(self, mock_dependencies):
+        """Test post pages are rendered by worker processes for larger sites."""
+        mock_dependencies['config'].performance.enable_parallel_processing = True
+        mock_dependencies['config'].performance.max_parallel_workers = 2
+
+        processed_posts = [
+            ProcessedPost(
+                SimpleNamespace(
+                    computed_slug=f"post-{i}",
+                    frontmatter=SimpleNamespace(title=f"Post {i}", tags=[])
+                ),
+                f"<p>{i}</p>"
+            )
+            for i in range(PARALLEL_MIN_TASKS)
+        ]
+
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=mock_dependencies['markdown_processor']):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=WorkerTemplateRenderer()):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            generator = BuildGenerator()
+                            generator.build_dir.mkdir(parents=True)
+
+                            stats = generator._render_templates(processed_posts)
+
+                            assert stats['rendering_errors'] == 0
+                            assert stats['pages_rendered'] == PARALLEL_MIN_TASKS + 3
+                            # Rendering happened in the workers, not in this process
+                            this_process = f"{os.getpid()}</html>"
+                            for i in range(PARALLEL_MIN_TASKS):
+                                page = (generator.build_dir / "posts" / f"post-{i}.html").read_text()
+                                assert page.startswith("<html>post ")
+                                assert not page.endswith(this_process)
+                            homepage = (generator.build_dir / "index.html").read_text()
+                            assert not homepage.endswith(this_process)
+                            assert stats['rendered_pages'][0] == 'index.html'
+                            assert stats['rendered_pages'][-1] == 'rss.xml'
+
+    def test_worker_processes_are_not_forked_from_the_build(self):
+        """Test worker processes do not inherit the threads of the building process."""
+        assert generator_module._worker_context().get_start_method() in ('forkserver', 'spawn')
+
+    def test_import_leaves_multiprocessing_setup_alone(self):
+        """Test importing the generator does not change the forkserver preload list."""
+        code = (
+            "import multiprocessing.forkserver as forkserver\n"
+            "import microblog.builder.generator\n"
+            "print(forkserver._forkserver._preload_modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "['__main__']"
+
+    def test_render_worker_initializer_sets_worker_state(self):
+        """Test rendering workers get the renderer and previous pages as arguments."""
+        renderer = Mock()
+        previous_pages = ("/build/", "/backup/", {'index.html': "digest"})
+        try:
+            _init_render_worker(renderer, previous_pages)
+
+            assert generator_module._worker_renderer is renderer
+            assert generator_module._worker_previous_pages == previous_pages
+            renderer.preload_templates.assert_called_once_with()
+        finally:
+            generator_module._worker_renderer = None
+            generator_module._worker_previous_pages = None
+
+    def test_build_restores_gc_settings(self, mock_dependencies):
+        """Test the garbage collector tuning is undone when a build ends."""
+        threshold = gc.get_threshold()
+        freeze_count = gc.get_freeze_count()
+
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=mock_dependencies['markdown_processor']):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=mock_dependencies['template_renderer']):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            generator = BuildGenerator()
+                            seen = []
+                            with patch.object(
+                                generator,
+                                '_validate_build_preconditions',
+                                side_effect=lambda: seen.append(gc.get_threshold()) or False
+                            ):
+                                result = generator.build()
+
+                            assert not result.success
+                            assert seen == [BUILD_GC_THRESHOLD]
+                            assert gc.get_threshold() == threshold
+                            assert gc.get_freeze_count() == freeze_count
+
+    def test_overlapping_builds_share_gc_tuning(self):
+        """Test the collector stays tuned until the last of overlapping builds ends."""
+        threshold = gc.get_threshold()
+        freeze_count = gc.get_freeze_count()
+
+        with patch('microblog.builder.generator.gc.collect', wraps=gc.collect) as collect:
+            _begin_build_gc()
+            _begin_build_gc()
+        collect.assert_called_once_with()
+
+        _end_build_gc()
+        assert gc.get_threshold() == BUILD_GC_THRESHOLD
+        _end_build_gc()
+        assert gc.get_threshold() == threshold
+        assert gc.get_freeze_count() == freeze_count
+
+    def test_build_copies_assets_while_rendering(self, mock_dependencies):
+        """Test assets are copied on another thread while templates are rendered."""
+        copy_started = threading.Event()
+        copy_threads = []
+
+        def copy_all_assets(previous_build_dir=None):
+            copy_threads.append(threading.current_thread())
+            copy_started.set()
+            return {'total_successful': 5, 'total_failed': 0, 'mappings': []}
+
+        renderer = mock_dependencies['template_renderer']
+        # Rendering only completes once the asset copy has started
+        renderer.render_homepage.side_effect = (
+            lambda posts: "<html>homepage</html>" if copy_started.wait(5) else None
+        )
+        renderer.render_archive.return_value = "<html>archive</html>"
+        renderer.render_rss_feed.return_value = "<?xml version='1.0'?><rss></rss>"
+        mock_dependencies['asset_manager'].copy_all_assets.side_effect = copy_all_assets
+
+        with patch('microblog.builder.generator.get_config', return_value=mock_dependencies['config']):
+            with patch('microblog.builder.generator.get_markdown_processor', return_value=mock_dependencies['markdown_processor']):
+                with patch('microblog.builder.generator.get_template_renderer', return_value=renderer):
+                    with patch('microblog.builder.generator.get_asset_manager', return_value=mock_dependencies['asset_manager']):
+                        with patch('microblog.builder.generator.get_post_service', return_value=mock_dependencies['post_service']):
+
+                            generator = BuildGenerator()
+                            result = generator.build()
+
+                            assert result.success is True
+                            assert result.stats['assets']['total_successful'] == 5
+                            assert copy_threads[0] is not threading.main_thread()
+
     def test_build_success_flow(self, mock_dependencies):
         """Test complete successful build flow."""
         # Setup mock returns for successful build
@@ -1605,6 +2668,7 @@ class TestBuildGenerator:
                             assert result.build_dir == generator.build_dir
                             assert result.stats is not None
                             assert len(generator.progress_history) > 0
+                            mock_dependencies['template_renderer'].reload_templates.assert_called_once_with()
 
                             # Check that all phases were executed
                             phases = [p.phase for p in generator.progress_history]
@@ -1694,6 +2758,55 @@ class TestBuildGenerator:
                             gen2 = get_build_generator()
                             assert gen1 is gen2
 
+    def test_global_instances_created_once_under_concurrency(self):
+        """Test threads racing on the first call share a single instance."""
+        barrier = threading.Barrier(8)
+        created = []
+
+        def slow_renderer():
+            created.append(object())
+            time.sleep(0.05)
+            return created[-1]
+
+        def get_renderer(results):
+            barrier.wait()
+            results.append(get_template_renderer())
+
+        results = []
+        with patch('microblog.builder.template_renderer._template_renderer', None):
+            with patch('microblog.builder.template_renderer.TemplateRenderer', side_effect=slow_renderer):
+                threads = [threading.Thread(target=get_renderer, args=(results,)) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+
+    def test_build_generator_uses_latest_progress_callback(self):
+        """Test the shared build generator reports to the most recent caller's callback."""
+        first_callback = Mock()
+        second_callback = Mock()
+
+        reset_build_generator()
+        try:
+            with patch('microblog.builder.generator.get_config'):
+                with patch('microblog.builder.generator.get_markdown_processor'):
+                    with patch('microblog.builder.generator.get_template_renderer'):
+                        with patch('microblog.builder.generator.get_asset_manager'):
+                            with patch('microblog.builder.generator.get_post_service'):
+                                gen1 = get_build_generator(first_callback)
+                                gen2 = get_build_generator(second_callback)
+
+                                assert gen1 is gen2
+                                assert gen2.progress_callback is second_callback
+
+                                reset_build_generator()
+                                assert get_build_generator() is not gen1
+        finally:
+            reset_build_generator()
+
 
 class TestBuildFailureScenarios:
     """Test comprehensive failure scenarios and rollback mechanisms."""
@@ -1731,6 +2844,7 @@ class TestBuildFailureScenarios:
         mock_template_renderer.templates_dir = setup['structure']['static'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
 
         # Setup posts to process
         sample_post = PostContent(
@@ -1776,6 +2890,7 @@ class TestBuildFailureScenarios:
         mock_template_renderer.templates_dir = setup['structure']['static'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
 
         # Setup posts
         setup['post_service'].get_published_posts.return_value = []
@@ -1808,6 +2923,7 @@ class TestBuildFailureScenarios:
         mock_template_renderer.templates_dir = setup['structure']['static'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
 
         # Setup posts
         setup['post_service'].get_published_posts.return_value = []
@@ -1844,6 +2960,7 @@ class TestBuildFailureScenarios:
         mock_template_renderer.templates_dir = setup['structure']['static'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
 
         # Setup posts
         setup['post_service'].get_published_posts.return_value = []
@@ -1888,6 +3005,7 @@ class TestBuildFailureScenarios:
         mock_template_renderer.templates_dir = setup['structure']['static'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
 
         # Make markdown processing fail
         mock_markdown_processor.process_content.side_effect = Exception("Processing failed")
@@ -1924,6 +3042,7 @@ class TestBuildFailureScenarios:
         mock_template_renderer.templates_dir = setup['structure']['static'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
 
         # Setup for successful build
         setup['post_service'].get_published_posts.return_value = []
@@ -2037,6 +3156,7 @@ class TestPerformanceBuildTests:
             mock_template_renderer.templates_dir = Path(temp_dir) / "templates"
             mock_template_renderer.templates_dir.mkdir(parents=True)
             mock_template_renderer.validate_template.return_value = (True, None)
+            mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
             mock_markdown_processor.process_content.return_value = "<p>processed</p>"
             mock_template_renderer.render_homepage.return_value = "<html>home</html>"
             mock_template_renderer.render_post.return_value = "<html>post</html>"
@@ -2078,6 +3198,8 @@ class TestPerformanceBuildTests:
             mock_config.build.output_dir = str(build_dir)
             mock_config.build.backup_dir = str(build_dir) + ".bak"
             mock_config.build.posts_per_page = 10
+            # Mocked components cannot be sent to worker processes
+            mock_config.performance.enable_parallel_processing = False
 
             # Create 50 posts (simulating workload for performance testing)
             posts = []
@@ -2105,6 +3227,7 @@ class TestPerformanceBuildTests:
             mock_template_renderer.templates_dir = Path(temp_dir) / "templates"
             mock_template_renderer.templates_dir.mkdir(parents=True)
             mock_template_renderer.validate_template.return_value = (True, None)
+            mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
             mock_markdown_processor.process_content.return_value = "<p>processed content</p>"
             mock_template_renderer.render_homepage.return_value = "<html>homepage</html>"
             mock_template_renderer.render_post.return_value = "<html>post content</html>"
@@ -2154,6 +3277,8 @@ class TestPerformanceBuildTests:
             mock_config.build.output_dir = str(build_dir)
             mock_config.build.backup_dir = str(build_dir) + ".bak"
             mock_config.build.posts_per_page = 10
+            # Mocked components cannot be sent to worker processes
+            mock_config.performance.enable_parallel_processing = False
 
             # Create many posts to test memory usage
             posts = []
@@ -2180,6 +3305,7 @@ class TestPerformanceBuildTests:
             # Setup mocks
             mock_template_renderer.templates_dir = templates_dir
             mock_template_renderer.validate_template.return_value = (True, None)
+            mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
             mock_markdown_processor.process_content.return_value = "<p>" + "processed content. " * 50 + "</p>"
             mock_template_renderer.render_homepage.return_value = "<html>" + "homepage content. " * 100 + "</html>"
             mock_template_renderer.render_post.return_value = "<html>" + "post content. " * 100 + "</html>"
@@ -2284,6 +3410,7 @@ class TestAtomicOperationFailures:
         mock_template_renderer.templates_dir = setup['content'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
         mock_template_renderer.render_homepage.return_value = "<html>homepage</html>"
         mock_template_renderer.render_archive.return_value = "<html>archive</html>"
         mock_template_renderer.render_rss_feed.return_value = "<?xml version='1.0'?><rss></rss>"
@@ -2328,6 +3455,7 @@ class TestAtomicOperationFailures:
         mock_template_renderer.templates_dir = setup['content'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
         mock_template_renderer.render_homepage.side_effect = Exception("Template corrupted")
 
         with patch('microblog.builder.generator.get_config', return_value=mock_config):
@@ -2428,6 +3556,7 @@ class TestAtomicOperationFailures:
         mock_template_renderer.templates_dir = setup['content'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
         mock_template_renderer.render_homepage.return_value = "<html>homepage</html>"
         mock_template_renderer.render_archive.return_value = "<html>archive</html>"
         mock_template_renderer.render_rss_feed.return_value = "<?xml version='1.0'?><rss></rss>"
@@ -2483,6 +3612,7 @@ class TestAtomicOperationFailures:
         mock_template_renderer.templates_dir = setup['content'] / "templates"
         mock_template_renderer.templates_dir.mkdir(parents=True, exist_ok=True)
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
 
         # Simulate failure during markdown processing
         mock_markdown_processor.process_content.side_effect = Exception("Content processing failed: Failed to process 1 posts")
@@ -2515,6 +3645,8 @@ class TestBuildPerformanceRequirements:
         mock_config.site.author = "Test"
         mock_config.site.description = "Test"
         mock_config.build.posts_per_page = 10
+        # Mocked components cannot be sent to worker processes
+        mock_config.performance.enable_parallel_processing = False
 
         mock_post_service = Mock()
         mock_post_service.posts_dir = Path("/tmp/posts")
@@ -2541,6 +3673,7 @@ class TestBuildPerformanceRequirements:
         mock_template_renderer = Mock()
         mock_template_renderer.templates_dir = Path("/tmp/templates")
         mock_template_renderer.validate_template.return_value = (True, None)
+        mock_template_renderer.env.list_templates.return_value = ['index.html', 'post.html', 'archive.html', 'rss.xml', 'tag.html']
         mock_template_renderer.render_homepage.return_value = "<html>homepage</html>"
         mock_template_renderer.render_post.return_value = "<html>post</html>"
         mock_template_renderer.render_archive.return_value = "<html>archive</html>"
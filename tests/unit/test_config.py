@@ -204,6 +204,28 @@ class TestConfigManager:
         assert config.site.url == "https://test.example.com"
         assert manager._config is config
 
+    def test_config_loaded_once_across_threads(self, valid_config_file):
+        """Test concurrent first access to the config parses the file once."""
+        import threading
+
+        manager = ConfigManager(config_path=valid_config_file)
+        barrier = threading.Barrier(8)
+        configs = []
+
+        def read_config():
+            barrier.wait()
+            configs.append(manager.config)
+
+        with patch.object(manager, 'load_config', wraps=manager.load_config) as load_config:
+            threads = [threading.Thread(target=read_config) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert load_config.call_count == 1
+        assert all(config is configs[0] for config in configs)
+
     def test_load_config_file_not_found(self, temp_config_file):
         """Test config loading with missing file."""
         # Use a path that doesn't exist
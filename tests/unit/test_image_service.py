@@ -0,0 +1,175 @@
+"""
+Unit tests for the image upload service.
+
+Tests cover:
+- Saving uploads and filename collision handling
+- In-memory validation of extensions and image signatures
+"""
+
+import asyncio
+import io
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from microblog.content.image_service import ImageService, ImageValidationError
+
+PNG_BYTES = b'\x89PNG\r\n\x1a\n' + b'\x00' * 24
+
+
+@pytest.fixture
+def temp_content_dir():
+    """Create a temporary content directory for testing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+@pytest.fixture
+def image_service(temp_content_dir):
+    """Create an ImageService storing images in the temporary directory."""
+    with patch('microblog.content.image_service.get_content_dir', return_value=temp_content_dir):
+        yield ImageService()
+
+
+class TestImageUpload:
+    """Test saving uploaded images."""
+
+    def test_save_uploaded_file(self, image_service, temp_content_dir):
+        """Test a valid upload is written once under its sanitized name."""
+        result = image_service.save_uploaded_file(PNG_BYTES, "My Photo.png")
+
+        assert result['filename'] == "My_Photo.png"
+        assert result['relative_path'] == str(Path("images") / "My_Photo.png")
+        assert result['markdown'] == "![My Photo](/images/My_Photo.png)"
+        assert (temp_content_dir / "images" / "My_Photo.png").read_bytes() == PNG_BYTES
+        assert [path.name for path in (temp_content_dir / "images").iterdir()] == ["My_Photo.png"]
+
+    def test_save_uploaded_file_without_tmpfile_support(self, image_service, temp_content_dir):
+        """Test uploads are written directly where O_TMPFILE is unavailable."""
+        with patch('microblog.content.image_service._O_TMPFILE', 0):
+            result = image_service.save_uploaded_file(PNG_BYTES, "photo.png")
+
+        assert (temp_content_dir / "images" / result['filename']).read_bytes() == PNG_BYTES
+
+    def test_save_uploaded_file_avoids_collisions(self, image_service, temp_content_dir):
+        """Test uploads never replace existing images, including ones added outside the service."""
+        (temp_content_dir / "images" / "photo_1.png").write_bytes(b"existing")
+
+        first = image_service.save_uploaded_file(PNG_BYTES, "photo.png")
+        second = image_service.save_uploaded_file(PNG_BYTES, "photo.png")
+
+        assert first['filename'] == "photo.png"
+        assert second['filename'] == "photo_2.png"
+        assert (temp_content_dir / "images" / "photo_1.png").read_bytes() == b"existing"
+
+    @pytest.mark.asyncio
+    async def test_save_uploaded_file_async_concurrent(self, image_service, temp_content_dir):
+        """Test concurrent uploads of the same name each get their own file."""
+        uploads = [io.BytesIO(PNG_BYTES) for _ in range(5)]
+
+        results = await asyncio.gather(*(
+            image_service.save_uploaded_file_async(upload, "photo.png") for upload in uploads
+        ))
+
+        assert len({result['filename'] for result in results}) == 5
+        assert len(list((temp_content_dir / "images").iterdir())) == 5
+        assert all(upload.tell() == 0 for upload in uploads)
+
+    @pytest.mark.parametrize("content,filename", [
+        (b'MZ\x90\x00', "photo.png"),
+        (b'\xff\xd8\xff\xe0', "photo.gif"),
+        (PNG_BYTES, "script.js"),
+        (b'<html></html>', "drawing.svg"),
+    ])
+    def test_save_uploaded_file_rejects_invalid_content(self, image_service, temp_content_dir, content, filename):
+        """Test invalid uploads are rejected before anything is written."""
+        with pytest.raises(ImageValidationError):
+            image_service.save_uploaded_file(content, filename)
+
+        assert list((temp_content_dir / "images").iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_save_uploaded_file_async_rejects_invalid_content(self, image_service):
+        """Test invalid uploads raise validation errors rather than upload errors."""
+        with pytest.raises(ImageValidationError):
+            await image_service.save_uploaded_file_async(io.BytesIO(b'MZ\x90\x00'), "photo.png")
+
+    @pytest.mark.parametrize("content,filename", [
+        (b'\xff\xd8\xff\xdb', "photo.jpeg"),
+        (b'GIF89a', "anim.gif"),
+        (b'RIFF\x00\x00\x00\x00WEBPVP8 ', "photo.webp"),
+        (b'<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg"/>', "logo.svg"),
+    ])
+    def test_save_uploaded_file_accepts_image_formats(self, image_service, content, filename):
+        """Test each supported image format passes the signature check."""
+        assert image_service.save_uploaded_file(content, filename)['filename'] == filename
+
+
+class TestImageDeletion:
+    """Test deleting images."""
+
+    def test_delete_image(self, image_service, temp_content_dir):
+        """Test an uploaded image can be deleted and its name reused."""
+        image_service.save_uploaded_file(PNG_BYTES, "photo.png")
+
+        assert image_service.delete_image("photo.png") is True
+        assert not (temp_content_dir / "images" / "photo.png").exists()
+        assert image_service.generate_unique_filename("photo.png") == "photo.png"
+
+    @pytest.mark.parametrize("filename", ["../secret.png", "sub/photo.png", "..", ".", ""])
+    def test_delete_image_rejects_paths(self, image_service, temp_content_dir, filename):
+        """Test names that are not plain file names are never deleted."""
+        (temp_content_dir / "secret.png").write_bytes(PNG_BYTES)
+        (temp_content_dir / "images" / "sub").mkdir()
+        (temp_content_dir / "images" / "sub" / "photo.png").write_bytes(PNG_BYTES)
+
+        assert image_service.delete_image(filename) is False
+        assert (temp_content_dir / "secret.png").exists()
+        assert (temp_content_dir / "images" / "sub" / "photo.png").exists()
+
+    def test_delete_image_rejects_symlink_outside(self, image_service, temp_content_dir):
+        """Test a symlink leading out of the images directory is not followed."""
+        target = temp_content_dir / "secret.png"
+        target.write_bytes(PNG_BYTES)
+        (temp_content_dir / "images" / "link.png").symlink_to(target)
+
+        assert image_service.delete_image("link.png") is False
+        assert target.exists()
+
+
+class TestImageListing:
+    """Test listing stored images."""
+
+    def test_list_images_only_lists_image_files(self, image_service, temp_content_dir):
+        """Test non-image files and directories are left out of the listing."""
+        images_dir = temp_content_dir / "images"
+        image_service.save_uploaded_file(PNG_BYTES, "photo.png")
+        (images_dir / "notes.txt").write_text("not an image")
+        (images_dir / "album.png").mkdir()
+
+        with patch.object(image_service.asset_manager, 'validate_file', wraps=image_service.asset_manager.validate_file) as validate:
+            images = image_service.list_images()
+
+        assert [image['filename'] for image in images] == ["photo.png"]
+        assert images[0]['relative_path'] == str(Path("images") / "photo.png")
+        assert images[0]['size'] == len(PNG_BYTES)
+        validate.assert_called_once()
+
+
+class TestFilenameSanitization:
+    """Test upload filename sanitization."""
+
+    @pytest.mark.parametrize("filename,expected", [
+        ("photo.PNG", "photo.png"),
+        ("My Vacation (1)!!.jpg", "My_Vacation_1.jpg"),
+        ("a__b _-c.gif", "a_b_-c.gif"),
+        ("Café 中文.webp", "Café_中文.webp"),
+        ("../../etc/passwd.png", "passwd.png"),
+        ("__.png", "image.png"),
+        ("", "image"),
+    ])
+    def test_sanitize_filename(self, image_service, filename, expected):
+        """Test unsafe characters and underscore runs collapse to one underscore."""
+        assert image_service.sanitize_filename(filename) == expected
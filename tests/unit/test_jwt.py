@@ -13,10 +13,12 @@ import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
+import jwt
 import pytest
-from jose import JWTError, jwt
+from jwt.exceptions import PyJWTError as JWTError
 
 from microblog.auth.jwt_handler import (
+    clear_token_cache,
     create_jwt_token,
     decode_jwt_token_unsafe,
     get_token_expiry,
@@ -293,6 +295,20 @@ class TestTokenUtilities:
         payload = decode_jwt_token_unsafe("invalid.token")
         assert payload is None
 
+    def test_decode_jwt_token_unsafe_malformed_payload(self):
+        """Test unsafe token decoding with a payload that is not JSON."""
+        assert decode_jwt_token_unsafe("header.bm90LWpzb24.signature") is None
+        assert decode_jwt_token_unsafe("header.!!!.signature") is None
+
+    def test_decode_jwt_token_unsafe_ignores_signature(self):
+        """Test unsafe token decoding does not require a valid signature."""
+        token = jwt.encode({"user_id": 1, "username": "admin"}, "test-secret", algorithm="HS256")
+        header, payload, _ = token.split(".")
+
+        claims = decode_jwt_token_unsafe(f"{header}.{payload}.invalid-signature")
+
+        assert claims == {"user_id": 1, "username": "admin"}
+
     @patch('microblog.auth.jwt_handler.get_config')
     def test_get_token_expiry_valid(self, mock_get_config, mock_config):
         """Test getting token expiry from valid token."""
@@ -422,6 +438,54 @@ class TestTokenUtilities:
         assert refreshed_token is None
 
 
+class TestPayloadCache:
+    """Test caching of verified token payloads."""
+
+    @patch('microblog.auth.jwt_handler.get_config')
+    def test_verify_jwt_token_uses_cache(self, mock_get_config, mock_config):
+        """Test repeated verification of the same token skips decoding."""
+        mock_get_config.return_value = mock_config
+        clear_token_cache()
+
+        token = create_jwt_token(user_id=1, username="admin")
+        first = verify_jwt_token(token)
+
+        with patch('microblog.auth.jwt_handler.jwt.decode') as mock_decode:
+            second = verify_jwt_token(token)
+
+        mock_decode.assert_not_called()
+        assert second == first
+
+    @patch('microblog.auth.jwt_handler.get_config')
+    def test_cached_payload_not_shared_across_secrets(self, mock_get_config, mock_config):
+        """Test a cached payload is not returned after the secret changes."""
+        mock_get_config.return_value = mock_config
+        clear_token_cache()
+
+        token = create_jwt_token(user_id=1, username="admin")
+        assert verify_jwt_token(token) is not None
+
+        wrong_config = Mock()
+        wrong_config.auth.jwt_secret = "different-secret-key"
+        wrong_config.auth.session_expires = 3600
+        mock_get_config.return_value = wrong_config
+
+        assert verify_jwt_token(token) is None
+
+    @patch('microblog.auth.jwt_handler.get_config')
+    def test_cached_payload_expires(self, mock_get_config, short_session_config):
+        """Test a cached payload is rejected once the token expires."""
+        mock_get_config.return_value = short_session_config
+        clear_token_cache()
+
+        token = create_jwt_token(user_id=1, username="admin")
+        assert verify_jwt_token(token) is not None
+
+        time.sleep(2)
+
+        assert verify_jwt_token(token) is None
+
+
 class TestJWTIntegration:
     """Test JWT integration scenarios."""
 
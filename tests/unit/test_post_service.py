@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import tempfile
+import threading
 from datetime import date
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -216,6 +217,21 @@ class TestPostRetrieval:
         with pytest.raises(PostNotFoundError, match="Post with slug 'nonexistent' not found"):
             post_service.get_post_by_slug("nonexistent")
 
+    def test_get_post_by_slug_tries_matching_filename_first(self, post_service, temp_posts_dir):
+        """Test a slug lookup loads the file named after the slug before any other."""
+        for i in range(5):
+            post_service.create_post(title=f"Post {i}", content=f"Content {i}", date=date(2023, 12, i + 1))
+        # Moved to a file not named after its slug; found by the full scan
+        (temp_posts_dir / "2023-12-04-post-3.md").rename(temp_posts_dir / "renamed.md")
+
+        fresh_service = PostService(posts_dir=temp_posts_dir)
+        with patch.object(fresh_service, '_load_post_from_file', wraps=fresh_service._load_post_from_file) as load_post:
+            post = fresh_service.get_post_by_slug("post-2")
+
+        assert post.frontmatter.title == "Post 2"
+        load_post.assert_called_once_with(temp_posts_dir / "2023-12-03-post-2.md")
+        assert fresh_service.get_post_by_slug("post-3").frontmatter.title == "Post 3"
+
     def test_get_post_by_slug_draft_filtering(self, post_service):
         """Test draft filtering in slug retrieval."""
         # Create draft post
@@ -476,6 +492,27 @@ class TestPostListing:
         zero_posts = post_service.list_posts(include_drafts=True, limit=0)
         assert len(zero_posts) == 5  # No limit applied
 
+    def test_list_posts_limit_loads_only_returned_posts(self, post_service, temp_posts_dir):
+        """Test a limited listing reads only frontmatter for the posts it leaves out."""
+        for i in range(5):
+            post_service.create_post(
+                title=f"Post {i}",
+                content=f"Content {i}",
+                date=date(2023, 12, i + 1),
+                tags=["even" if i % 2 == 0 else "odd"],
+                draft=i == 4
+            )
+        # A body that cannot be loaded does not matter for a post left out
+        (temp_posts_dir / "2023-11-01-broken.md").write_bytes(
+            b"---\ntitle: Broken\ndate: 2023-11-01\n---\n\xff\xfe"
+        )
+
+        with patch.object(post_service, '_load_post_from_file', wraps=post_service._load_post_from_file) as load_post:
+            posts = post_service.list_posts(tag_filter="even", limit=1)
+
+        assert [post.frontmatter.title for post in posts] == ["Post 2"]
+        load_post.assert_called_once_with(temp_posts_dir / posts[0].filename)
+
     def test_list_posts_corrupted_file_handling(self, post_service, temp_posts_dir):
         """Test handling corrupted files during listing."""
         # Create valid post
@@ -551,6 +588,54 @@ class TestPublishWorkflow:
         assert all(post.is_draft for post in draft_posts)
 
 
+class TestPostGeneration:
+    """Test change detection for cached post data."""
+
+    def test_generation_stable_without_changes(self, post_service, sample_post_data):
+        """Test the generation only moves when post files change."""
+        post_service.create_post(**sample_post_data)
+
+        generation = post_service.generation()
+
+        assert post_service.generation() == generation
+        post_service.list_posts()
+        assert post_service.generation() == generation
+
+    def test_generation_tracks_file_changes(self, post_service, sample_post_data, temp_posts_dir):
+        """Test edits, including ones made outside the service, move the generation."""
+        post = post_service.create_post(**sample_post_data)
+        generation = post_service.generation()
+
+        post_service.update_post(post.computed_slug, tags=["changed"])
+        updated = post_service.generation()
+        assert updated > generation
+
+        (temp_posts_dir / "external.md").write_text("---\ntitle: External\ndate: 2023-12-02\n---\nBody")
+        assert post_service.generation() > updated
+
+    def test_posts_by_year_cached_until_posts_change(self, post_service, sample_post_data):
+        """Test the year grouping is reused until a post is added."""
+        sample_post_data["draft"] = False
+        post_service.create_post(**sample_post_data)
+
+        with patch.object(post_service, 'get_published_posts', wraps=post_service.get_published_posts) as get_posts:
+            first = post_service.get_posts_by_year()
+            assert post_service.get_posts_by_year() is first
+            assert get_posts.call_count == 1
+
+            post_service.create_post(**{
+                **sample_post_data,
+                "title": "Older Post",
+                "slug": "older-post",
+                "date": date(2021, 5, 1),
+            })
+            posts_by_year = post_service.get_posts_by_year()
+
+        assert get_posts.call_count == 2
+        assert list(posts_by_year) == [2023, 2021]
+        assert [p.frontmatter.title for p in posts_by_year[2021]] == ["Older Post"]
+
+
 class TestFileOperations:
     """Test file parsing and saving operations."""
 
@@ -588,6 +673,164 @@ Content here."""
         with pytest.raises(PostFileError, match="YAML parsing error"):
             post_service._parse_markdown_file(invalid_yaml_content)
 
+    @pytest.mark.parametrize("frontmatter_yaml", [
+        "title: Don't Panic\ndate: '2023-12-01'\nslug: ''\ntags:\n- python\n- web\ndraft: false\ndescription: ''\n",
+        "title: 'It''s here'\ndate: 2023-12-01\ntags: [a, 'b']\ndraft: yes\ncount: 7\nextra:\n",
+        "title: Indented\ntags:\n  - one\n  - two\ndescription: null\n",
+    ])
+    def test_load_frontmatter_fast_path_matches_yaml(self, frontmatter_yaml):
+        """Test flat frontmatter is parsed without YAML to the same result."""
+        import yaml
+
+        from microblog.utils.frontmatter import load_frontmatter
+
+        with patch('microblog.utils.frontmatter.load_yaml') as load_yaml:
+            result = load_frontmatter(frontmatter_yaml)
+
+        load_yaml.assert_not_called()
+        assert result == yaml.safe_load(frontmatter_yaml)
+        assert [type(v) for v in result.values()] == [type(v) for v in yaml.safe_load(frontmatter_yaml).values()]
+
+    @pytest.mark.parametrize("frontmatter_yaml", [
+        "title: Continued\n  on the next line\n",
+        "title: \"Escaped \\u00e9\"\n",
+        "url: http://example.com\n",
+        "nested:\n  key: value\n",
+        "date: 2023-02-30\n",
+        "value: 1.5\n",
+    ])
+    def test_load_frontmatter_falls_back_to_yaml(self, frontmatter_yaml):
+        """Test frontmatter outside the simple subset is handed to the YAML parser."""
+        from microblog.utils.frontmatter import load_frontmatter
+
+        with patch('microblog.utils.frontmatter.load_yaml', return_value={'parsed': 'yaml'}) as load_yaml:
+            assert load_frontmatter(frontmatter_yaml) == {'parsed': 'yaml'}
+
+        load_yaml.assert_called_once_with(frontmatter_yaml)
+
+    def test_dump_yaml_matches_python_emitter(self):
+        """Test frontmatter is serialized the same with or without libyaml."""
+        import yaml
+
+        from microblog.utils.frontmatter import dump_yaml
+
+        frontmatter = {
+            "title": 'Café: "quoted"',
+            "date": "2023-12-01",
+            "tags": ["test", "yes"],
+            "draft": True,
+            "description": None,
+        }
+
+        assert dump_yaml(frontmatter) == yaml.dump(frontmatter, default_flow_style=False, sort_keys=False)
+
+    @pytest.mark.parametrize("file_content", [
+        "---\ntitle: Big\n---\n\n  \n# Body\n",
+        "---  \ntitle: Big\n---x\n---\t\nBody \u00e9\n",
+        "---\ntitle: Caf\u00e9\n---\n\u00a0\nBody\n",
+        "---\n\t\n---\n---\n\n-\x0c\n ",
+        "---\ntitle: Separator\n---\x1c\nBody\n",
+        "---\r\ntitle: Windows\r\n---\r\nBody\r\n",
+        "---\ntitle: Unclosed\n",
+        "# No frontmatter\n",
+    ])
+    def test_read_frontmatter_file_matches_split(self, temp_posts_dir, file_content):
+        """Test memory-mapped large posts split the same way as their text."""
+        from microblog.utils.frontmatter import (
+            LARGE_POST_BYTES,
+            read_frontmatter_file,
+            split_frontmatter,
+        )
+
+        file_content += "Lorem ipsum dolor sit amet.\n" * (LARGE_POST_BYTES // 20)
+        file_path = temp_posts_dir / "large.md"
+        file_path.write_bytes(file_content.encode())
+
+        expected = split_frontmatter(file_content.replace("\r\n", "\n"))
+        assert read_frontmatter_file(file_path) == expected
+
+    @pytest.mark.parametrize("file_content", [
+        "---\ntitle: Mapped\n---\nBody\n",
+        "---\n\t\n---\n---\n\n-\x0c\n ",
+        "--- \n\n---\n---\nBody\n",
+        "---\ntitle: Separator\n---\x1c\nBody\n",
+        "---\x85\ntitle: Next line\n---\nBody\n",
+        "---\ntitle: Unclosed\n",
+    ])
+    def test_split_mapped_frontmatter_matches_split(self, temp_posts_dir, file_content):
+        """Test the memory-mapped split agrees with split_frontmatter() or declines."""
+        import mmap
+
+        from microblog.utils.frontmatter import (
+            _UNSUPPORTED,
+            _split_mapped_frontmatter,
+            split_frontmatter,
+        )
+
+        file_path = temp_posts_dir / "mapped.md"
+        file_path.write_bytes(file_content.encode())
+
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                parts = _split_mapped_frontmatter(mapped)
+
+        if parts is not _UNSUPPORTED:
+            assert parts == split_frontmatter(file_content)
+
+    def test_read_frontmatter_file_with_many_rules(self, temp_posts_dir):
+        """Test a large post full of non-fence '---' lines is split only once."""
+        import microblog.utils.frontmatter as frontmatter_module
+        from microblog.utils.frontmatter import (
+            LARGE_POST_BYTES,
+            read_frontmatter_file,
+            split_frontmatter,
+        )
+
+        file_content = "---\ntitle: Rules\n" + "----\nSection text.\n" * 8000
+        assert len(file_content) >= LARGE_POST_BYTES
+        file_path = temp_posts_dir / "rules.md"
+        file_path.write_bytes(file_content.encode())
+
+        with patch.object(
+            frontmatter_module, 'split_frontmatter', wraps=split_frontmatter
+        ) as split:
+            assert read_frontmatter_file(file_path) == split_frontmatter(file_content)
+
+        assert split.call_count <= 2
+
+    @pytest.mark.parametrize("file_content", [
+        "---\ntitle: Small\n---\nBody\n",
+        "---  \n \ntitle: Spaced\n---x\n---\t\nBody\n",
+        "---\r\ntitle: Windows\r\n---\r\nBody\r\n",
+        "---\ntitle: Unclosed\n",
+        "# No frontmatter\n",
+        "---\ntitle: Long\n" + "tags:\n" + "- tag\n" * 2000 + "---\nBody\n",
+    ])
+    def test_read_frontmatter_yaml_matches_file_split(self, temp_posts_dir, file_content):
+        """Test reading only the frontmatter gives the same YAML as the full split."""
+        from microblog.utils.frontmatter import (
+            read_frontmatter_file,
+            read_frontmatter_yaml,
+        )
+
+        file_path = temp_posts_dir / "post.md"
+        file_path.write_bytes(file_content.encode())
+
+        parts = read_frontmatter_file(file_path)
+        assert read_frontmatter_yaml(file_path) == (parts[0] if parts else None)
+
+    def test_load_large_post_from_file(self, post_service, sample_post_data, temp_posts_dir):
+        """Test large posts load with their full content."""
+        from microblog.utils.frontmatter import LARGE_POST_BYTES
+
+        sample_post_data["content"] = "Paragraph text.\n\n" * (LARGE_POST_BYTES // 10)
+        created_post = post_service.create_post(**sample_post_data)
+
+        loaded_post = post_service._load_post_from_file(temp_posts_dir / created_post.filename)
+
+        assert loaded_post.frontmatter.title == sample_post_data["title"]
+        assert loaded_post.content == sample_post_data["content"]
+
     def test_save_post_to_file(self, post_service, sample_post_data, temp_posts_dir):
         """Test saving post to file."""
         # Create post using the service's validation function
@@ -622,6 +865,62 @@ Content here."""
         assert loaded_post.frontmatter.date == sample_post_data["date"]
         assert loaded_post.frontmatter.tags == sample_post_data["tags"]
 
+    def test_load_post_from_file_caches_until_file_changes(self, post_service, sample_post_data, temp_posts_dir):
+        """Test unchanged post files are not parsed again."""
+        created_post = post_service.create_post(**sample_post_data)
+        file_path = temp_posts_dir / created_post.filename
+
+        first = post_service._load_post_from_file(file_path)
+        with patch('microblog.content.post_service.read_frontmatter_file') as read_file:
+            assert post_service._load_post_from_file(file_path) is first
+            assert post_service.get_post_by_slug("test-post") is first
+        read_file.assert_not_called()
+
+        # Edits made outside the service are picked up
+        file_path.write_text(file_path.read_text().replace("Test Post", "Edited Post!"))
+        assert post_service._load_post_from_file(file_path).frontmatter.title == "Edited Post!"
+
+    def test_post_cache_shared_between_threads(self, post_service, sample_post_data):
+        """Test concurrent listings and deletions keep the post cache consistent."""
+        for i in range(20):
+            post_service.create_post(**{**sample_post_data, "slug": f"post-{i}"})
+
+        errors = []
+
+        def list_repeatedly():
+            try:
+                for _ in range(20):
+                    post_service.list_posts(include_drafts=True)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=list_repeatedly) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(0, 20, 2):
+            post_service.delete_post(f"post-{i}")
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(post_service.list_posts(include_drafts=True)) == 10
+        assert len(post_service._post_cache) == 10
+        assert set(post_service._slug_index) == {f"post-{i}" for i in range(1, 20, 2)}
+
+    def test_get_post_by_slug_after_update_and_delete(self, post_service, sample_post_data):
+        """Test slug lookups follow renamed and deleted posts."""
+        post_service.create_post(**sample_post_data)
+        post_service.get_post_by_slug("test-post")
+
+        post_service.update_post("test-post", new_slug="renamed-post")
+        with pytest.raises(PostNotFoundError):
+            post_service.get_post_by_slug("test-post")
+        assert post_service.get_post_by_slug("renamed-post").computed_slug == "renamed-post"
+
+        assert post_service.delete_post("renamed-post") is True
+        with pytest.raises(PostNotFoundError):
+            post_service.get_post_by_slug("renamed-post")
+
 
 class TestGlobalPostService:
     """Test global post service instance management."""
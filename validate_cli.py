@@ -6,7 +6,7 @@ This script validates that the CLI structure is correctly implemented
 without requiring installation.
 """
 
-import importlib.util
+import importlib
 import sys
 from pathlib import Path
 
@@ -14,17 +14,15 @@ from pathlib import Path
 def validate_cli_structure():
     """Validate that the CLI module is correctly structured."""
 
-    # Check if cli.py exists and is importable
-    cli_path = Path("microblog/cli.py")
+    # Check if the cli package exists and is importable
+    cli_path = Path("microblog/cli/__init__.py")
     if not cli_path.exists():
-        print("❌ CLI module not found at microblog/cli.py")
+        print("❌ CLI package not found at microblog/cli/")
         return False
 
-    # Load the CLI module
+    # Load the CLI package; commands are imported from it on demand
     try:
-        spec = importlib.util.spec_from_file_location("microblog.cli", cli_path)
-        cli_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(cli_module)
+        cli_module = importlib.import_module("microblog.cli")
         print("✅ CLI module loaded successfully")
     except Exception as e:
         print(f"❌ Failed to load CLI module: {e}")
@@ -50,11 +48,15 @@ def validate_cli_structure():
     expected_commands = ['build', 'serve', 'create-user', 'init', 'status']
 
     try:
-        # Get the commands from the Click group
-        commands = list(cli_module.main.commands.keys())
+        # Get the commands from the Click group, loading each one
+        ctx = click.Context(cli_module.main)
+        commands = [
+            name for name in cli_module.main.list_commands(ctx)
+            if cli_module.main.get_command(ctx, name) is not None
+        ]
         print(f"✅ Found commands: {commands}")
 
-        missing_commands = [cmd for cmd in expected_commands if cmd.replace('-', '_') not in commands]
+        missing_commands = [cmd for cmd in expected_commands if cmd not in commands]
         if missing_commands:
             print(f"⚠️  Missing expected commands: {missing_commands}")
         else: